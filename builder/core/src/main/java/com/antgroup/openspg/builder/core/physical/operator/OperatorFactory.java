@@ -16,6 +16,7 @@ package com.antgroup.openspg.builder.core.physical.operator;
 import com.antgroup.openspg.builder.core.runtime.BuilderContext;
 import com.antgroup.openspg.builder.model.exception.BuilderException;
 import com.antgroup.openspg.builder.model.pipeline.config.OperatorConfig;
+import java.util.List;
 
 public interface OperatorFactory {
 
@@ -24,4 +25,10 @@ public interface OperatorFactory {
   void loadOperator(OperatorConfig config);
 
   Object invoke(OperatorConfig config, Object... input);
+
+  /**
+   * Invokes the operator once for a batch of inputs, each element is the argument list of one
+   * {@link #invoke} call. Returns the outputs in the order of the inputs.
+   */
+  List<Object> invokeBatch(OperatorConfig config, List<List<Object>> inputs);
 }
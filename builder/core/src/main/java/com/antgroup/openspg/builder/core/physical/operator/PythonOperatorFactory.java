@@ -25,8 +25,15 @@ import pemja.core.PythonInterpreter;
 import pemja.core.PythonInterpreterConfig;
 
 @Slf4j
+@SuppressWarnings("unchecked")
 public class PythonOperatorFactory implements OperatorFactory {
 
+  /** The per-record entry point of python operators, see `BaseOp._handle`. */
+  private static final String HANDLE_METHOD = "_handle";
+
+  /** The batch entry point of python operators, see `BaseOp._handle_batch`. */
+  private static final String HANDLE_BATCH_METHOD = "_handle_batch";
+
   private static volatile PythonInterpreter pythonInterpreter;
   private final Map<OperatorConfig, String> operatorObjects = new ConcurrentHashMap<>();
 
@@ -80,6 +87,28 @@ public class PythonOperatorFactory implements OperatorFactory {
     return pythonInterpreter.invokeMethod(pythonObject, config.getMethod(), input);
   }
 
+  @Override
+  public List<Object> invokeBatch(OperatorConfig config, List<List<Object>> inputs) {
+    if (inputs.isEmpty()) {
+      return Collections.emptyList();
+    }
+    if (!HANDLE_METHOD.equals(config.getMethod())) {
+      return inputs.stream()
+          .map(input -> invoke(config, input.toArray()))
+          .collect(Collectors.toList());
+    }
+    String pythonObject = operatorObjects.get(config);
+    if (StringUtils.isBlank(pythonObject)) {
+      throw new IllegalStateException();
+    }
+    // one call per batch, instead of one call and one record conversion per record
+    Object result = pythonInterpreter.invokeMethod(pythonObject, HANDLE_BATCH_METHOD, inputs);
+    if (result instanceof Object[]) {
+      return Arrays.asList((Object[]) result);
+    }
+    return (List<Object>) result;
+  }
+
   private void loadOperatorObject(OperatorConfig config) {
     if (operatorObjects.containsKey(config)) {
       return;
@@ -91,6 +120,9 @@ public class PythonOperatorFactory implements OperatorFactory {
         String.format(
             "%s=%s(%s)",
             pythonOperatorObject, config.getClassName(), paramToPythonString(config.getParams())));
+    // open the operator when it is loaded, instead of lazily on its first record
+    pythonInterpreter.exec("from knext.operator.lifecycle import operator_manager");
+    pythonInterpreter.exec(String.format("operator_manager.open(%s)", pythonOperatorObject));
     operatorObjects.put(config, pythonOperatorObject);
   }
 
@@ -26,6 +26,7 @@ import com.antgroup.openspg.core.schema.model.identifier.SPGTypeIdentifier;
 import com.fasterxml.jackson.core.type.TypeReference;
 import com.fasterxml.jackson.databind.ObjectMapper;
 import java.util.ArrayList;
+import java.util.Collections;
 import java.util.List;
 import java.util.Map;
 import org.apache.commons.collections4.CollectionUtils;
@@ -51,12 +52,16 @@ public abstract class BaseExtractProcessor<T extends BaseExtractNodeConfig>
 
   @Override
   public List<BaseRecord> process(List<BaseRecord> inputs) {
-    List<BaseRecord> results = new ArrayList<>();
+    List<List<Object>> batchInputs = new ArrayList<>(inputs.size());
     for (BaseRecord record : inputs) {
-      BuilderRecord builderRecord = (BuilderRecord) record;
-      Map<String, Object> result =
-          (Map<String, Object>)
-              operatorFactory.invoke(config.getOperatorConfig(), builderRecord.getProps());
+      batchInputs.add(Collections.singletonList(((BuilderRecord) record).getProps()));
+    }
+    List<Object> batchResults =
+        operatorFactory.invokeBatch(config.getOperatorConfig(), batchInputs);
+
+    List<BaseRecord> results = new ArrayList<>();
+    for (Object batchResult : batchResults) {
+      Map<String, Object> result = (Map<String, Object>) batchResult;
 
       InvokeResultWrapper<List<PythonRecord>> invokeResultWrapper =
           mapper.convertValue(
@@ -35,7 +35,6 @@ import com.antgroup.openspg.core.schema.model.identifier.BaseSPGIdentifier;
 import com.antgroup.openspg.core.schema.model.identifier.SPGIdentifierTypeEnum;
 import com.antgroup.openspg.core.schema.model.identifier.SPGTypeIdentifier;
 import com.antgroup.openspg.core.schema.model.type.BaseSPGType;
-import com.google.common.collect.Lists;
 import java.util.*;
 import java.util.stream.Collectors;
 import java.util.stream.Stream;
@@ -114,11 +113,24 @@ public class SPGTypeMappingHelper {
   }
 
   public List<BaseSPGRecord> toSPGRecords(BuilderRecord record) {
-    Map<String, String> propertyValues = propertyMapping(record);
-    Map<String, String> relationValues = relationMapping(record);
+    return toSPGRecords(Collections.singletonList(record));
+  }
+
+  /**
+   * Maps a batch of records, whose subjects go through the fusing strategy together, so that a
+   * fusing operator is called once per batch and can resolve the duplicated records of a batch.
+   */
+  public List<BaseSPGRecord> toSPGRecords(List<BuilderRecord> records) {
+    List<BaseAdvancedRecord> mappedRecords = new ArrayList<>(records.size());
+    for (BuilderRecord record : records) {
+      mappedRecords.add(toAdvancedRecord(propertyMapping(record), relationMapping(record)));
+    }
+    if (mappedRecords.isEmpty()) {
+      return Collections.emptyList();
+    }
 
     List<BaseSPGRecord> results = new ArrayList<>();
-    List<BaseAdvancedRecord> advancedRecords = toAdvancedRecord(propertyValues, relationValues);
+    List<BaseAdvancedRecord> advancedRecords = subjectFusing.fusing(mappedRecords);
     for (BaseAdvancedRecord advancedRecord : advancedRecords) {
       if (CollectionUtils.isNotEmpty(advancedRecord.getRelationRecords())) {
         for (RelationRecord relationRecord : advancedRecord.getRelationRecords()) {
@@ -190,7 +202,7 @@ public class SPGTypeMappingHelper {
     return relationValues;
   }
 
-  private List<BaseAdvancedRecord> toAdvancedRecord(
+  private BaseAdvancedRecord toAdvancedRecord(
       Map<String, String> propertyValues, Map<String, String> relationValues) {
     String bizId = propertyValues.get("id");
     if (StringUtils.isBlank(bizId)) {
@@ -204,6 +216,6 @@ public class SPGTypeMappingHelper {
         EdgeRecordConvertor.toRelationRecords(spgType, relationValues));
     recordLinking.linking(advancedRecord);
     recordPredicting.predicting(advancedRecord);
-    return subjectFusing.fusing(Lists.newArrayList(advancedRecord));
+    return advancedRecord;
   }
 }
@@ -62,9 +62,7 @@ public class SPGTypeMappingProcessor extends BaseProcessor<SPGTypeMappingNodeCon
     }
 
     for (SPGTypeMappingHelper mappingHelper : mappingHelpers) {
-      for (BuilderRecord record : emptyIdentifierRecords) {
-        resultSpgRecords.addAll(toSPGRecords(mappingHelper, record));
-      }
+      resultSpgRecords.addAll(toSPGRecords(mappingHelper, emptyIdentifierRecords));
     }
 
     for (SPGTypeMappingHelper mappingHelper : mappingHelpers) {
@@ -73,9 +71,7 @@ public class SPGTypeMappingProcessor extends BaseProcessor<SPGTypeMappingNodeCon
         continue;
       }
 
-      for (BuilderRecord record : identifiedRecords) {
-        resultSpgRecords.addAll(toSPGRecords(mappingHelper, record));
-      }
+      resultSpgRecords.addAll(toSPGRecords(mappingHelper, identifiedRecords));
     }
     return (List) resultSpgRecords;
   }
@@ -84,11 +80,13 @@ public class SPGTypeMappingProcessor extends BaseProcessor<SPGTypeMappingNodeCon
   public void close() throws Exception {}
 
   private List<BaseSPGRecord> toSPGRecords(
-      SPGTypeMappingHelper mappingHelper, BuilderRecord record) {
-    if (mappingHelper.isFiltered(record)) {
-      return Collections.emptyList();
+      SPGTypeMappingHelper mappingHelper, List<BuilderRecord> records) {
+    List<BuilderRecord> mappedRecords = new ArrayList<>(records.size());
+    for (BuilderRecord record : records) {
+      if (!mappingHelper.isFiltered(record)) {
+        mappedRecords.add(record);
+      }
     }
-
-    return mappingHelper.toSPGRecords(record);
+    return mappingHelper.toSPGRecords(mappedRecords);
   }
 }
@@ -55,19 +55,26 @@ public class OperatorLinking implements PropertyLinking {
 
     PythonRecord pythonRecord =
         new PythonRecord().setSpgTypeName("").setProperties(Collections.emptyMap());
-    List<String> ids = new ArrayList<>(rawValues.size());
+    List<List<Object>> batchInputs = new ArrayList<>(rawValues.size());
     for (String rawValue : rawValues) {
+      batchInputs.add(Arrays.asList(rawValue, pythonRecord.toMap()));
+    }
+    List<Object> results;
+    try {
+      results = operatorFactory.invokeBatch(linkingConfig.getOperatorConfig(), batchInputs);
+    } catch (Exception e) {
+      throw new LinkingException(e, "{} normalize error", rawValues);
+    }
+
+    List<String> ids = new ArrayList<>(rawValues.size());
+    for (int i = 0; i < results.size(); i++) {
       InvokeResultWrapper<List<PythonRecord>> invokeResultWrapper = null;
       try {
-        Map<String, Object> result =
-            (Map<String, Object>)
-                operatorFactory.invoke(
-                    linkingConfig.getOperatorConfig(), rawValue, pythonRecord.toMap());
         invokeResultWrapper =
             mapper.convertValue(
-                result, new TypeReference<InvokeResultWrapper<List<PythonRecord>>>() {});
+                results.get(i), new TypeReference<InvokeResultWrapper<List<PythonRecord>>>() {});
       } catch (Exception e) {
-        throw new LinkingException(e, "{} normalize error", rawValue);
+        throw new LinkingException(e, "{} normalize error", rawValues.get(i));
       }
 
       if (invokeResultWrapper == null || CollectionUtils.isEmpty(invokeResultWrapper.getData())) {
@@ -41,6 +41,10 @@ import com.antgroup.openspg.server.api.http.client.HttpConceptFacade;
 import com.antgroup.openspg.server.api.http.client.HttpSchemaFacade;
 import com.antgroup.openspg.server.api.http.client.util.ConnectionInfo;
 import com.antgroup.openspg.server.api.http.client.util.HttpClientBootstrap;
+import java.io.IOException;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Paths;
 import java.util.HashMap;
 import java.util.Map;
 import lombok.extern.slf4j.Slf4j;
@@ -53,6 +57,7 @@ public class LocalBuilderMain {
   private static final String PROJECT_ID_OPTION = "projectId";
   private static final String JOB_NAME_OPTION = "jobName";
   private static final String PIPELINE_OPTION = "pipeline";
+  private static final String PIPELINE_FILE_OPTION = "pipelineFile";
   private static final String PYTHON_EXEC_OPTION = "pythonExec";
   private static final String PYTHON_PATHS_OPTION = "pythonPaths";
   private static final String SCHEMA_URL_OPTION = "schemaUrl";
@@ -79,7 +84,9 @@ public class LocalBuilderMain {
 
     options.addRequiredOption(PROJECT_ID_OPTION, PROJECT_ID_OPTION, true, "project id");
     options.addRequiredOption(JOB_NAME_OPTION, JOB_NAME_OPTION, true, "job name");
-    options.addRequiredOption(PIPELINE_OPTION, PIPELINE_OPTION, true, "pipeline info");
+    options.addOption(PIPELINE_OPTION, PIPELINE_OPTION, true, "pipeline info");
+    options.addOption(
+        PIPELINE_FILE_OPTION, PIPELINE_FILE_OPTION, true, "file of pipeline info");
     options.addRequiredOption(PYTHON_EXEC_OPTION, PYTHON_EXEC_OPTION, true, "python exec");
     options.addRequiredOption(PYTHON_PATHS_OPTION, PYTHON_PATHS_OPTION, true, "python path");
     options.addRequiredOption(SCHEMA_URL_OPTION, SCHEMA_URL_OPTION, true, "schema url");
@@ -112,7 +119,7 @@ public class LocalBuilderMain {
     long projectId = Long.parseLong(commandLine.getOptionValue(PROJECT_ID_OPTION));
     String jobName = commandLine.getOptionValue(JOB_NAME_OPTION);
 
-    String pipelineStr = commandLine.getOptionValue(PIPELINE_OPTION);
+    String pipelineStr = getPipelineStr(commandLine);
     Pipeline pipeline = BuilderJsonUtils.deserialize(pipelineStr, Pipeline.class);
 
     String pythonExec = commandLine.getOptionValue(PYTHON_EXEC_OPTION);
@@ -154,6 +161,19 @@ public class LocalBuilderMain {
     }
   }
 
+  private static String getPipelineStr(CommandLine commandLine) throws IOException {
+    String pipelineFile = commandLine.getOptionValue(PIPELINE_FILE_OPTION);
+    if (pipelineFile != null) {
+      return new String(Files.readAllBytes(Paths.get(pipelineFile)), StandardCharsets.UTF_8);
+    }
+    String pipelineStr = commandLine.getOptionValue(PIPELINE_OPTION);
+    if (pipelineStr == null) {
+      throw new PipelineConfigException(
+          "either {} or {} option is required", PIPELINE_OPTION, PIPELINE_FILE_OPTION);
+    }
+    return pipelineStr;
+  }
+
   private static ProjectSchema getProjectSchema(long projectId, String schemaUrl) {
     HttpClientBootstrap.init(
         new ConnectionInfo(schemaUrl).setConnectTimeout(6000).setReadTimeout(600000));
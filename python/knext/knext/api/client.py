@@ -14,6 +14,7 @@ from knext.client.schema import SchemaClient
 from knext.client.reasoner import ReasonerClient
 from knext.client.operator import OperatorClient
 from knext.client.search import SearchClient
+from knext.client.local_search import LocalSearchClient
 
 __all__ = [
     "BuilderClient",
@@ -21,4 +22,5 @@ __all__ = [
     "ReasonerClient",
     "OperatorClient",
     "SearchClient",
+    "LocalSearchClient",
 ]
@@ -23,11 +23,29 @@ class BuilderChain(Chain):
         return None
 
     def invoke(self, **kwargs):
+        if kwargs.get("local"):
+            return self.invoke_local(
+                kwargs.get("sink"), parallelism=int(kwargs.get("parallelism", 1))
+            )
+
         from knext.client.builder import BuilderClient
 
         client = BuilderClient()
         client.execute(self, **kwargs)
 
+    def invoke_local(self, sink=None, parallelism: int = 1):
+        """Executes this chain in-process and returns the sink the records are written to.
+
+        :param sink: A `LocalSink`, or a sink uri accepted by `LocalSink.from_uri`.
+            Records are kept in a `MemorySink` if not given.
+        :param parallelism: The number of worker processes of each extract operator.
+        """
+        from knext.chain.local_runner import LocalBuilderRunner, LocalSink
+
+        if isinstance(sink, str):
+            sink = LocalSink.from_uri(sink)
+        return LocalBuilderRunner(sink, parallelism=parallelism).run(self)
+
     @classmethod
     def from_chain(cls, chain):
         return cls(dag=chain.dag)
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import networkx as nx
+
+from knext.operator.spg_record import SPGRecord
+
+
+def _to_record(output) -> SPGRecord:
+    """Returns a component output as a SPGRecord, as the outputs of a worker pool are.
+    A plain dict output is taken as the properties of a record without type."""
+    if isinstance(output, SPGRecord):
+        return output
+    return SPGRecord(None, dict(output))
+
+
+def _record_id(record: SPGRecord) -> str:
+    """Returns the id of an entity record, or `srcId#dstId` of a relation record."""
+    id = record.get_property("id")
+    if id is None and record.get_property("srcId") is not None:
+        id = f'{record.get_property("srcId")}#{record.get_property("dstId")}'
+    if id is None:
+        id = json.dumps(record.to_dict()["properties"], sort_keys=True)
+    return id
+
+
+class LocalSink(ABC):
+    """Base class for the sinks that receive the records written by a local builder run."""
+
+    @abstractmethod
+    def write(self, record: SPGRecord):
+        raise NotImplementedError(
+            f"{self.__class__.__name__} need to implement `write` method."
+        )
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def from_uri(uri: str) -> "LocalSink":
+        """Creates a sink from `memory`, `jsonl:<path>` or `sqlite:<path>`."""
+        kind, _, path = uri.partition(":")
+        if kind == "memory":
+            return MemorySink()
+        if kind == "jsonl" and path:
+            return JSONLSink(path)
+        if kind == "sqlite" and path:
+            return SqliteSink(path)
+        raise ValueError(
+            f"Invalid sink [{uri}], expected memory, jsonl:<path> or sqlite:<path>."
+        )
+
+
+class MemorySink(LocalSink):
+    """Keeps the written records as an in-memory graph, keyed by (spg_type_name, id).
+    Relation records are keyed by `srcId#dstId`.
+    Records with the same key are merged, later properties overwrite earlier ones."""
+
+    def __init__(self):
+        self._records: Dict[Tuple[str, str], SPGRecord] = {}
+
+    @property
+    def records(self) -> List[SPGRecord]:
+        return list(self._records.values())
+
+    def get(self, spg_type_name: str, id: str) -> SPGRecord:
+        return self._records.get((spg_type_name, id))
+
+    def write(self, record: SPGRecord):
+        key = (record.spg_type_name, _record_id(record))
+        existing = self._records.get(key)
+        if existing is None:
+            self._records[key] = record
+        else:
+            existing.upsert_properties(record.properties)
+            existing.relations.update(record.relations)
+
+
+class JSONLSink(LocalSink):
+    """Writes each record as one line of JSON."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, record: SPGRecord):
+        self._file.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class SqliteSink(LocalSink):
+    """Upserts each record into the `spg_record` table of a sqlite file."""
+
+    def __init__(self, path: str, commit_interval: int = 1000):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS spg_record ("
+            "spg_type_name TEXT NOT NULL, id TEXT NOT NULL, properties TEXT, "
+            "PRIMARY KEY (spg_type_name, id))"
+        )
+        self._commit_interval = commit_interval
+        self._uncommitted = 0
+
+    def write(self, record: SPGRecord):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO spg_record VALUES (?, ?, ?)",
+            (
+                record.spg_type_name,
+                _record_id(record),
+                json.dumps(record.to_dict()["properties"], ensure_ascii=False),
+            ),
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= self._commit_interval:
+            self._conn.commit()
+            self._uncommitted = 0
+
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
+
+
+class LocalBuilderRunner:
+    """Executes the DAG of a builder chain in-process, without the builder jar.
+
+    Records read by a source component are pushed through the downstream components in
+    batches of `batch_size`, so that records stream through the chain without being
+    materialized. Records reaching a `SinkWriter` component are written to `sink`, and
+    the number of records output by each component is counted in `stats`.
+    If `parallelism` is greater than 1, the operators of `UserDefinedExtractor`
+    components run in an `OperatorWorkerPool` of `parallelism` processes. Link, fuse and
+    predict operators are called by their mapping component and stay in-process, fuse
+    operators are called once per batch to resolve the duplicated records of a batch.
+    All in-process operators of the chain are opened in parallel before the first record.
+    """
+
+    def __init__(
+        self, sink: LocalSink = None, parallelism: int = 1, batch_size: int = 64
+    ):
+        self.sink = sink or MemorySink()
+        self.parallelism = parallelism
+        self.batch_size = batch_size
+        self.stats = Counter()
+        self._pools = {}
+
+    def run(self, chain) -> LocalSink:
+        from knext.component.builder.base import SourceReader
+        from knext.operator.lifecycle import operator_manager
+
+        dag: nx.DiGraph = chain.dag
+        sources = [
+            node for node in nx.topological_sort(dag) if dag.in_degree(node) == 0
+        ]
+        try:
+            operator_manager.prewarm(
+                [op for node in dag.nodes for op in self._operators(node)]
+            )
+            for source in sources:
+                if not isinstance(source, SourceReader):
+                    raise ValueError(
+                        f"{source.__class__.__name__} can not be the start of a builder chain."
+                    )
+                batch = []
+                for record in source.invoke(None):
+                    batch.append(record)
+                    if len(batch) >= self.batch_size:
+                        self._push(dag, source, batch)
+                        batch = []
+                if batch:
+                    self._push(dag, source, batch)
+        finally:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
+            self.sink.close()
+        return self.sink
+
+    def _push(self, dag: nx.DiGraph, node, records: list):
+        from knext.component.builder.base import SinkWriter
+
+        self.stats[node.name] += len(records)
+        for successor in dag.successors(node):
+            if isinstance(successor, SinkWriter):
+                self.stats[successor.name] += len(records)
+                for record in records:
+                    self.sink.write(record)
+                continue
+            outputs = self._invoke(successor, records)
+            if outputs:
+                self._push(dag, successor, outputs)
+
+    def _invoke(self, component, records: list) -> list:
+        pool = self._pool(component)
+        if pool is None:
+            return [_to_record(output) for output in component.invoke_batch(records)]
+        outputs = []
+        for result in pool.handle((record,) for record in records):
+            outputs.extend(SPGRecord.from_dict(data) for data in result["data"])
+        return outputs
+
+    def _operators(self, component) -> list:
+        from knext.component.builder.extractor import UserDefinedExtractor
+        from knext.component.builder.mapping import SPGTypeMapping, _SPGTypeMappings
+        from knext.operator.base import BaseOp
+
+        if isinstance(component, UserDefinedExtractor):
+            return [component.extract_op] if self.parallelism <= 1 else []
+        if isinstance(component, _SPGTypeMappings):
+            return [
+                op
+                for mapping in component.spg_type_mappings
+                for op in self._operators(mapping)
+            ]
+        if isinstance(component, SPGTypeMapping):
+            strategies = (
+                list(component._object_linking_strategies.values())
+                + list(component._predicate_predicting_strategies.values())
+                + [component._fusing_strategy()]
+            )
+            return [op for op in strategies if isinstance(op, BaseOp)]
+        return []
+
+    def _pool(self, component):
+        from knext.component.builder.extractor import UserDefinedExtractor
+        from knext.operator.worker_pool import OperatorWorkerPool
+
+        if self.parallelism <= 1 or not isinstance(component, UserDefinedExtractor):
+            return None
+        if component.id not in self._pools:
+            op = component.extract_op
+            self._pools[component.id] = OperatorWorkerPool(
+                op.__class__,
+                op.params,
+                processes=self.parallelism,
+                batch_size=max(1, self.batch_size // self.parallelism),
+            )
+        return self._pools[component.id]
@@ -9,7 +9,6 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
-import json
 import os
 import sys
 
@@ -28,7 +27,9 @@ class BuilderClient(Client):
     def __init__(self, host_addr: str = None, project_id: int = None):
         super().__init__(host_addr, project_id)
 
-        if "KNEXT_ROOT_PATH" in os.environ and "KNEXT_BUILDER_JOB_DIR" in os.environ:
+        if not BuilderJob._has_registered and (
+            "KNEXT_ROOT_PATH" in os.environ and "KNEXT_BUILDER_JOB_DIR" in os.environ
+        ):
             self._builder_job_path = os.path.join(
                 os.environ["KNEXT_ROOT_PATH"], os.environ["KNEXT_BUILDER_JOB_DIR"]
             )
@@ -58,11 +59,18 @@ class BuilderClient(Client):
     def execute(self, builder_chain: BuilderChain, **kwargs):
         import subprocess
         import datetime
+        import tempfile
         from knext import lib
+        from knext.rest.rest import json_dumps
 
         jar_path = os.path.join(lib.__path__[0], lib.LOCAL_BUILDER_JAR)
         dag_config = builder_chain.to_rest()
         pipeline = self.serialize(dag_config)
+        # Pass the pipeline by file, large pipelines exceed the limit of argv.
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".json", encoding="utf-8", delete=False
+        ) as pipeline_file:
+            pipeline_file.write(json_dumps(pipeline))
         log_file_name = f"{datetime.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log"
 
         java_cmd = [
@@ -73,8 +81,8 @@ class BuilderClient(Client):
             self._project_id,
             "--jobName",
             kwargs.get("job_name", "default_job"),
-            "--pipeline",
-            json.dumps(pipeline),
+            "--pipelineFile",
+            pipeline_file.name,
             "--pythonExec",
             sys.executable,
             "--pythonPaths",
@@ -96,7 +104,10 @@ class BuilderClient(Client):
         if kwargs.get("lead_to"):
             java_cmd.append("--leadTo")
 
-        subprocess.call(java_cmd)
+        try:
+            subprocess.call(java_cmd)
+        finally:
+            os.remove(pipeline_file.name)
 
     def query(self, job_inst_id: int):
         """Query status of a submitted builder job by job inst id."""
@@ -0,0 +1,494 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import csv
+import json
+import math
+import os
+import pickle
+import re
+import sqlite3
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from knext.client.search import IdxRecord, SearchClient
+from knext.common.schema_helper import PropertyName
+from knext.operator.spg_record import SPGRecord
+
+LOCAL_SCHEME = "local"
+
+_INDEX_VERSION = 1
+
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_TOKEN_PATTERN = re.compile(f"[{_CJK}]|[^\\W_{_CJK}]+")
+
+
+def _tokenize(value: str, ngram_size: Optional[int] = None) -> List[str]:
+    """Splits a value into lowercase terms, like the standard analyzer of
+    Elasticsearch: words, with each CJK character as a term of its own.
+    With `ngram_size`, the terms are the character n-grams of the value instead."""
+    value = value.lower()
+    if not ngram_size:
+        return _TOKEN_PATTERN.findall(value)
+    value = " ".join(value.split())
+    if len(value) <= ngram_size:
+        return [value] if value else []
+    return [value[i : i + ngram_size] for i in range(len(value) - ngram_size + 1)]
+
+
+class _FieldIndex:
+    """BM25 inverted index and exact-match hash index of one property."""
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.lengths: Dict[int, int] = {}
+        self.total_length = 0
+        self.values: Dict[str, List[int]] = {}
+
+    def add(self, pos: int, value: str, ngram_size: Optional[int]):
+        terms = Counter(_tokenize(value, ngram_size))
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[pos] = tf
+        length = sum(terms.values())
+        self.lengths[pos] = length
+        self.total_length += length
+        self.values.setdefault(value, []).append(pos)
+
+    def remove(self, pos: int, value: str, ngram_size: Optional[int]):
+        for term in set(_tokenize(value, ngram_size)):
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(pos, None)
+                if not postings:
+                    del self.postings[term]
+        self.total_length -= self.lengths.pop(pos, 0)
+        positions = self.values.get(value)
+        if positions is not None:
+            positions.remove(pos)
+            if not positions:
+                del self.values[value]
+
+
+class LocalIndex:
+    """In-process search index of the records of one SPG type.
+
+    Each property gets a BM25 inverted index for `match` queries, and a hash index
+    for `term` queries and exact searches. The indexes of a property are built on
+    first query and kept up to date as records are added.
+
+    Args:
+        spg_type_name: The name of the SPG type of the indexed records.
+        path: Optional. The file the index is loaded from if it exists, and saved to.
+        ngram_size: Optional. Index character n-grams of this size instead of words,
+            which tolerates typos in names. Only used when the index is created.
+    """
+
+    k1: float = 1.2
+    b: float = 0.75
+
+    def __init__(
+        self, spg_type_name: str, path: str = None, ngram_size: Optional[int] = None
+    ):
+        self.spg_type_name = spg_type_name
+        self.path = path
+        self.ngram_size = ngram_size
+        self._ids: List[str] = []
+        self._docs: List[Dict[str, str]] = []
+        self._positions: Dict[str, int] = {}
+        self._fields: Dict[str, _FieldIndex] = {}
+        self._lock = threading.RLock()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add(self, doc_id: str, properties: Dict[str, str]):
+        """Adds a record to the index, replacing the record with the same id."""
+        doc_id = str(doc_id)
+        properties = {
+            name: value if isinstance(value, str) else str(value)
+            for name, value in properties.items()
+            if value is not None
+        }
+        properties.setdefault("id", doc_id)
+        with self._lock:
+            pos = self._positions.get(doc_id)
+            if pos is None:
+                pos = len(self._ids)
+                self._positions[doc_id] = pos
+                self._ids.append(doc_id)
+                self._docs.append(properties)
+            else:
+                for name, field in self._fields.items():
+                    if name in self._docs[pos]:
+                        field.remove(pos, self._docs[pos][name], self.ngram_size)
+                self._docs[pos] = properties
+            for name, field in self._fields.items():
+                if name in properties:
+                    field.add(pos, properties[name], self.ngram_size)
+
+    def add_records(self, records: Iterable[SPGRecord]) -> int:
+        """Adds the records of this SPG type, like the records of `MemorySink`,
+        and returns the number of added records."""
+        count = 0
+        for record in records:
+            if record.spg_type_name != self.spg_type_name:
+                continue
+            properties = record.properties
+            if properties.get("id") is None:
+                continue
+            self.add(properties["id"], properties)
+            count += 1
+        return count
+
+    def load_csv(self, path: str, id_column: str = "id", **kwargs) -> int:
+        """Adds the rows of a csv file with a header row, using `id_column` as the
+        record id, and returns the number of added records.
+        Other keyword arguments are passed to `csv.DictReader`."""
+        count = 0
+        with open(path, "r", encoding="utf-8", newline="") as file:
+            for row in csv.DictReader(file, **kwargs):
+                if row.get(id_column):
+                    self.add(row[id_column], row)
+                    count += 1
+        return count
+
+    def load_jsonl(self, path: str, id_field: str = "id") -> int:
+        """Adds the records of a jsonl file, and returns the number of added records.
+        Lines written by `JSONLSink` are added if they are of this SPG type, other
+        lines are added as flat json objects of property name to value."""
+        count = 0
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if "spgTypeName" in data and "properties" in data:
+                    if data["spgTypeName"] != self.spg_type_name:
+                        continue
+                    data = data["properties"]
+                if data.get(id_field) is None:
+                    continue
+                self.add(data[id_field], data)
+                count += 1
+        return count
+
+    def load_sqlite(self, path: str) -> int:
+        """Adds the records of this SPG type written by `SqliteSink`, and returns the
+        number of added records."""
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            rows = conn.execute(
+                "SELECT id, properties FROM spg_record WHERE spg_type_name = ?",
+                (self.spg_type_name,),
+            )
+            count = 0
+            for doc_id, properties in rows:
+                self.add(doc_id, json.loads(properties))
+                count += 1
+            return count
+        finally:
+            conn.close()
+
+    def save(self, path: str = None):
+        """Saves the index, with the indexes built so far, to `path` or the path
+        the index was created with."""
+        path = path or self.path
+        if not path:
+            raise ValueError("The path to save the local index is not given.")
+        with self._lock:
+            state = {
+                "version": _INDEX_VERSION,
+                "spg_type_name": self.spg_type_name,
+                "ngram_size": self.ngram_size,
+                "ids": self._ids,
+                "docs": self._docs,
+                "fields": self._fields,
+            }
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as file:
+                pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+
+    def load(self, path: str):
+        """Replaces the content of the index with the index saved to `path`."""
+        with open(path, "rb") as file:
+            state = pickle.load(file)
+        if state.get("version") != _INDEX_VERSION:
+            raise ValueError(f"Unsupported local index version in {path}.")
+        with self._lock:
+            self.ngram_size = state["ngram_size"]
+            self._ids = state["ids"]
+            self._docs = state["docs"]
+            self._positions = {doc_id: pos for pos, doc_id in enumerate(self._ids)}
+            self._fields = state["fields"]
+
+    def values(self, property_name: str) -> Iterator[Tuple[str, str]]:
+        """Yields the (id, property value) of the records with the property."""
+        for doc_id, properties in zip(self._ids, self._docs):
+            value = properties.get(property_name)
+            if value is not None:
+                yield doc_id, value
+
+    def exact(self, property_name: str, value: str) -> List[int]:
+        """Returns the positions of the records whose property equals `value`."""
+        return list(self._field(property_name).values.get(str(value), []))
+
+    def search(
+        self, query, sort=None, filter=None, start: int = 0, size: int = 10
+    ) -> List[IdxRecord]:
+        """Evaluates an Elasticsearch query on the index, see `LocalSearchClient`."""
+        scores = self._evaluate(query)
+        if filter is not None:
+            allowed = self._evaluate(filter)
+            scores = {pos: score for pos, score in scores.items() if pos in allowed}
+        hits = sorted(scores.items(), key=lambda hit: (-hit[1], hit[0]))
+        for name, reverse in reversed(self._sort_keys(sort)):
+            hits.sort(key=lambda hit: self._docs[hit[0]].get(name, ""), reverse=reverse)
+        return [self.record(pos, score) for pos, score in hits[start : start + size]]
+
+    def record(self, pos: int, score: float = 1.0) -> IdxRecord:
+        """Returns the record at position `pos` of the index."""
+        return IdxRecord(
+            self.spg_type_name,
+            self.spg_type_name,
+            self._ids[pos],
+            score,
+            dict(self._docs[pos]),
+        )
+
+    def _field(self, name: str) -> _FieldIndex:
+        field = self._fields.get(name)
+        if field is None:
+            with self._lock:
+                field = self._fields.get(name)
+                if field is None:
+                    field = _FieldIndex()
+                    for pos, properties in enumerate(self._docs):
+                        if name in properties:
+                            field.add(pos, properties[name], self.ngram_size)
+                    self._fields[name] = field
+        return field
+
+    def _bm25(self, name: str, value) -> Dict[int, float]:
+        field = self._field(name)
+        if not field.lengths:
+            return {}
+        count = len(field.lengths)
+        avg_length = field.total_length / count or 1.0
+        scores = {}
+        for term in set(_tokenize(str(value), self.ngram_size)):
+            postings = field.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for pos, tf in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * field.lengths[pos] / avg_length)
+                scores[pos] = scores.get(pos, 0.0) + idf * tf * (self.k1 + 1) / (
+                    tf + norm
+                )
+        return scores
+
+    def _evaluate(self, query) -> Dict[int, float]:
+        """Returns the scores of the records matching `query`, by position."""
+        if not query or "match_all" in query:
+            return {pos: 1.0 for pos in range(len(self._ids))}
+        if len(query) != 1:
+            raise ValueError(f"Expected one query clause, got {list(query)}.")
+        kind, body = next(iter(query.items()))
+        if kind in ("match", "match_phrase"):
+            ((name, value),) = body.items()
+            if isinstance(value, dict):
+                value = value.get("query")
+            return self._bm25(name, value)
+        if kind == "multi_match":
+            scores = {}
+            for name in body.get("fields", []):
+                for pos, score in self._bm25(name, body["query"]).items():
+                    scores[pos] = max(score, scores.get(pos, 0.0))
+            return scores
+        if kind in ("term", "terms"):
+            ((name, values),) = body.items()
+            if kind == "term":
+                values = [values.get("value") if isinstance(values, dict) else values]
+            return {pos: 1.0 for value in values for pos in self.exact(name, value)}
+        if kind == "ids":
+            positions = (self._positions.get(str(doc_id)) for doc_id in body["values"])
+            return {pos: 1.0 for pos in positions if pos is not None}
+        if kind == "bool":
+            return self._evaluate_bool(body)
+        raise ValueError(f"Query `{kind}` is not supported by the local index.")
+
+    def _evaluate_bool(self, body) -> Dict[int, float]:
+        def clauses(key):
+            value = body.get(key) or []
+            return value if isinstance(value, list) else [value]
+
+        scores = None
+        for clause in clauses("must"):
+            matched = self._evaluate(clause)
+            if scores is None:
+                scores = matched
+            else:
+                scores = {
+                    pos: score + matched[pos]
+                    for pos, score in scores.items()
+                    if pos in matched
+                }
+        for clause in clauses("filter"):
+            matched = self._evaluate(clause)
+            if scores is None:
+                scores = {pos: 0.0 for pos in matched}
+            else:
+                scores = {pos: s for pos, s in scores.items() if pos in matched}
+        should = [self._evaluate(clause) for clause in clauses("should")]
+        if scores is None:
+            scores = {}
+            for matched in should:
+                for pos, score in matched.items():
+                    scores[pos] = scores.get(pos, 0.0) + score
+        else:
+            for matched in should:
+                for pos in scores:
+                    scores[pos] += matched.get(pos, 0.0)
+        for clause in clauses("must_not"):
+            excluded = self._evaluate(clause)
+            scores = {pos: s for pos, s in scores.items() if pos not in excluded}
+        return scores
+
+    @staticmethod
+    def _sort_keys(sort) -> List[Tuple[str, bool]]:
+        """Converts Elasticsearch sort criteria to (property name, reverse) pairs."""
+        keys = []
+        for item in sort if isinstance(sort, list) else [sort] if sort else []:
+            if isinstance(item, str):
+                name, _, order = item.partition(":")
+                keys.append((name, order == "desc"))
+                continue
+            for name, order in item.items():
+                if isinstance(order, dict):
+                    order = order.get("order", "asc")
+                keys.append((name, order == "desc"))
+        return [(name, reverse) for name, reverse in keys if name != "_score"]
+
+
+_local_indexes: Dict[Tuple[str, str], LocalIndex] = {}
+_local_indexes_lock = threading.Lock()
+
+
+def _index_dir(url: str) -> str:
+    """Returns the index directory of a url like `local:///path/to/dir`, or an empty
+    string for `local:`, whose indexes are kept in memory only."""
+    parsed = urlparse(url)
+    return parsed.netloc + parsed.path
+
+
+def get_local_index(
+    spg_type_name: str, search_engine_url: str = None, ngram_size: int = None
+) -> LocalIndex:
+    """Returns the local index of `spg_type_name`, shared in this process by all
+    LocalSearchClients of `search_engine_url`, which defaults to
+    `KNEXT_SEARCH_ENGINE_URL` if it is a local url, or to `local:`."""
+    if not search_engine_url:
+        search_engine_url = os.environ.get("KNEXT_SEARCH_ENGINE_URL") or ""
+        if urlparse(search_engine_url).scheme != LOCAL_SCHEME:
+            search_engine_url = f"{LOCAL_SCHEME}:"
+    index_dir = _index_dir(search_engine_url)
+    with _local_indexes_lock:
+        key = (index_dir, spg_type_name)
+        if key not in _local_indexes:
+            path = None
+            if index_dir:
+                path = os.path.join(index_dir, f"{spg_type_name}.idx")
+            _local_indexes[key] = LocalIndex(spg_type_name, path, ngram_size)
+        return _local_indexes[key]
+
+
+class LocalSearchClient(SearchClient):
+    """Search client backed by a local index instead of a search engine, for testing
+    and benchmarking operators offline, or recalling entities of small SPG types
+    without a network round-trip per lookup.
+
+    The index is shared in the process by all clients of the same url, which is
+    `local:` for an in-memory index, or `local:///path/to/dir` for indexes saved to
+    `<dir>/<spg_type_name>.idx`. `SearchClient` returns a LocalSearchClient for such
+    urls, so operators can be run against a local index by setting
+    `KNEXT_SEARCH_ENGINE_URL`, after loading the records with one of the `load_*`
+    methods.
+
+    `search` supports the `match`, `match_phrase`, `multi_match`, `term`, `terms`,
+    `ids`, `match_all` and `bool` queries, and sorting by property values.
+    `match` queries are scored with BM25, `term` queries and exact searches look
+    up the property value in a hash index.
+    """
+
+    def __init__(
+        self,
+        spg_type_name: str,
+        search_engine_url: str = None,
+        ngram_size: Optional[int] = None,
+    ):
+        self.spg_type_name = spg_type_name
+        self.index = get_local_index(spg_type_name, search_engine_url, ngram_size)
+        self.index_name = spg_type_name
+        self.client = None
+
+    def add_records(self, records: Iterable[SPGRecord]) -> int:
+        return self.index.add_records(records)
+
+    def load_csv(self, path: str, id_column: str = "id", **kwargs) -> int:
+        return self.index.load_csv(path, id_column, **kwargs)
+
+    def load_jsonl(self, path: str, id_field: str = "id") -> int:
+        return self.index.load_jsonl(path, id_field)
+
+    def load_sqlite(self, path: str) -> int:
+        return self.index.load_sqlite(path)
+
+    def save(self, path: str = None):
+        self.index.save(path)
+
+    def search(self, query, sort=None, filter=None, start: int = 0, size: int = 10):
+        return self.index.search(query, sort, filter, start, size)
+
+    def search_batch(
+        self, queries: List[dict], size: int = 10
+    ) -> List[Optional[List[IdxRecord]]]:
+        return [
+            self.search(query, size=size) if query is not None else None
+            for query in queries
+        ]
+
+    def exact_search(
+        self, record: SPGRecord, property_name: PropertyName
+    ) -> Optional[SPGRecord]:
+        property_value = record.get_property(property_name)
+        if not property_value:
+            return None
+        return self.exact_search_by_property(property_value, property_name)
+
+    def exact_search_by_property(
+        self, property_value: str, property_name: PropertyName
+    ) -> Optional[SPGRecord]:
+        positions = self.index.exact(property_name, property_value)
+        if not positions:
+            return None
+        return self.index.record(positions[0]).to_spg_record()
+
+    def exact_search_batch(
+        self, records: List[SPGRecord], property_name: PropertyName
+    ) -> List[Optional[SPGRecord]]:
+        return [self.exact_search(record, property_name) for record in records]
@@ -10,30 +10,67 @@
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
 
+import hashlib
+import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from knext import rest
 from knext.client.schema import SchemaClient
 from knext.client.model.base import SpgTypeEnum
 
+_NAMESPACE_PATTERN = re.compile(r"^namespace\s+([a-zA-Z0-9]+)$")
+_CONCEPT_PATTERN = re.compile(
+    r"^`([a-zA-Z0-9\.]+)`/`([^`]+)`:(\s*?([a-zA-Z0-9\.]+)/`([^`]+)`)?$"
+)
+_DEFINE_PATTERN = re.compile(r"Define\s*\(", re.IGNORECASE)
+_CONCEPT_TYPE_PATTERN = re.compile(
+    r"\(([\w\s]*?:)`([\w\s\.]+)`/`([^`]+)`\)", re.IGNORECASE
+)
+_NON_CONCEPT_TYPE_PATTERN = re.compile(r"\(([\w\s]*?:)([\w\s\.]+)\)", re.IGNORECASE)
+_ACTION_TYPE_PATTERN = re.compile(
+    r"createNodeInstance\s*?\([^)]+(type=)([^,]+),", re.IGNORECASE
+)
+
 
 class SPGConceptRuleMarkLang:
     """
     SPG Concept Rule Mark Language Parser
     Feature: parse rule script and then alter the schema of project
-    """
 
-    namespace = None
-    rule_quote_open = False
-    rule_text = ""
-    src_concept = ()
-    dst_concept = ()
+    All rules of the script are parsed first and then submitted concurrently, with at
+    most `parallelism` requests at a time. The hash of each submitted rule is recorded in
+    a manifest file (`<filename>.manifest` by default), which is saved every
+    `checkpoint_interval` rules. Rules that are unchanged since they were last submitted
+    are skipped, so a failed registration resumes from where it stopped. Set `force` to
+    submit all rules anyway.
+    """
 
-    def __init__(self, filename):
+    def __init__(
+        self,
+        filename,
+        parallelism: int = 8,
+        manifest_path: str = None,
+        force: bool = False,
+        checkpoint_interval: int = 100,
+    ):
         self.current_line_num = 0
+        self.namespace = None
+        self.rule_quote_open = False
+        self.rule_text = ""
+        self.src_concept = ()
+        self.dst_concept = ()
+        self.rules = []
+        self.errors = []
+        self.parallelism = parallelism
+        self.manifest_path = manifest_path or f"{filename}.manifest"
+        self.force = force
+        self.checkpoint_interval = checkpoint_interval
         self.session = SchemaClient().create_session()
         self.concept_client = rest.ConceptApi()
         self.load_script(filename)
+        self.submit_rules()
 
     def error_msg(self, msg):
         return f"Line# {self.current_line_num}: {msg}"
@@ -43,7 +80,7 @@ class SPGConceptRuleMarkLang:
         parse the concept definition
         """
 
-        namespace_match = re.match(r"^namespace\s+([a-zA-Z0-9]+)$", expression)
+        namespace_match = _NAMESPACE_PATTERN.match(expression)
         if namespace_match:
             assert self.namespace is None, self.error_msg(
                 "Duplicated namespace define, please ensure define it only once"
@@ -52,10 +89,7 @@ class SPGConceptRuleMarkLang:
             self.namespace = namespace_match.group(1)
             return
 
-        type_match = re.match(
-            r"^`([a-zA-Z0-9\.]+)`/`([^`]+)`:(\s*?([a-zA-Z0-9\.]+)/`([^`]+)`)?$",
-            expression,
-        )
+        type_match = _CONCEPT_PATTERN.match(expression)
         if type_match:
             assert self.namespace is not None, self.error_msg(
                 "please define namespace first"
@@ -66,7 +100,7 @@ class SPGConceptRuleMarkLang:
                 self.dst_concept = (type_match.group(4), type_match.group(5))
 
         else:
-            raise Exception(
+            raise AssertionError(
                 self.error_msg("parse error, expect `ConceptType`/`ConceptName`:")
             )
 
@@ -94,8 +128,7 @@ class SPGConceptRuleMarkLang:
         Auto generate define statement and append namespace to the entity name
         """
 
-        pattern = re.compile(r"Define\s*\(", re.IGNORECASE)
-        match = pattern.match(rule.strip())
+        match = _DEFINE_PATTERN.match(rule.strip())
         if not match:
             subject_type = None
             subject_name = None
@@ -109,7 +142,7 @@ class SPGConceptRuleMarkLang:
                 predicate_name = "belongTo"
                 object_type = f"{self.namespace}.{self.src_concept[0]}"
                 object_name = self.src_concept[1]
-                assert object_type in self.session.spg_types, self.error_msg(
+                assert object_type in self.session.spg_type_names, self.error_msg(
                     f"{object_type} not found in schema"
                 )
 
@@ -118,11 +151,11 @@ class SPGConceptRuleMarkLang:
                     concept_type.spg_type_enum == SpgTypeEnum.Concept
                 ), self.error_msg(f"{object_type} is not concept type")
 
-                for spg_type in self.session.spg_types.values():
-                    for relation_name in spg_type.relations:
-                        if relation_name.startswith(f"belongTo_{object_type}"):
-                            subject_type = spg_type.name
-                            break
+                for spg_type_name, predicate_name in self.session.find_by_object_type(
+                    object_type
+                ):
+                    if predicate_name == "belongTo":
+                        subject_type = spg_type_name
 
             if subject_name is None:
                 head = (
@@ -139,9 +172,8 @@ class SPGConceptRuleMarkLang:
             rule += "\n}"
 
         # complete the namespace of concept type
-        pattern = re.compile(r"\(([\w\s]*?:)`([\w\s\.]+)`/`([^`]+)`\)", re.IGNORECASE)
         replace_list = []
-        matches = re.findall(pattern, rule)
+        matches = _CONCEPT_TYPE_PATTERN.findall(rule)
         if matches:
             for group in matches:
                 if "." in group[1]:
@@ -154,8 +186,7 @@ class SPGConceptRuleMarkLang:
                 )
 
         # complete the namespace of non-concept type
-        pattern = re.compile(r"\(([\w\s]*?:)([\w\s\.]+)\)", re.IGNORECASE)
-        matches = re.findall(pattern, rule)
+        matches = _NON_CONCEPT_TYPE_PATTERN.findall(rule)
         if matches:
             for group in matches:
                 if "." not in group[1]:
@@ -167,10 +198,7 @@ class SPGConceptRuleMarkLang:
                     )
 
         # complete the namespace of type in action clause
-        pattern = re.compile(
-            r"createNodeInstance\s*?\([^)]+(type=)([^,]+),", re.IGNORECASE
-        )
-        matches = re.findall(pattern, rule)
+        matches = _ACTION_TYPE_PATTERN.findall(rule)
         if matches:
             for group in matches:
                 if "." not in group[1]:
@@ -194,48 +222,141 @@ class SPGConceptRuleMarkLang:
 
     def submit_rule(self):
         """
-        submit the rule definition, make them available for inference
+        collect the rule definition, it is submitted by `submit_rules` after parsing
         """
 
         if self.dst_concept[0] is None:
             # belongTo rule
-            self.concept_client.concept_define_dynamic_taxonomy_post(
-                define_dynamic_taxonomy_request=rest.DefineDynamicTaxonomyRequest(
-                    concept_type_name=f"{self.namespace}.{self.src_concept[0]}",
-                    concept_name=self.src_concept[1],
-                    dsl=self.rule_text,
-                )
-            )
-            print(
-                f"Defined belongTo rule for `{self.src_concept[0]}`/`{self.src_concept[1]}`"
+            request = rest.DefineDynamicTaxonomyRequest(
+                concept_type_name=f"{self.namespace}.{self.src_concept[0]}",
+                concept_name=self.src_concept[1],
+                dsl=self.rule_text,
             )
+            message = f"Defined belongTo rule for `{self.src_concept[0]}`/`{self.src_concept[1]}`"
 
         else:
             # leadTo rule
-            self.concept_client.concept_define_logical_causation_post(
-                define_logical_causation_request=rest.DefineLogicalCausationRequest(
-                    subject_concept_type_name=f"{self.namespace}.{self.src_concept[0]}",
-                    subject_concept_name=self.src_concept[1],
-                    predicate_name="leadTo",
-                    object_concept_type_name=f"{self.namespace}.{self.dst_concept[0]}",
-                    object_concept_name=self.dst_concept[1],
-                    dsl=self.rule_text,
-                )
+            request = rest.DefineLogicalCausationRequest(
+                subject_concept_type_name=f"{self.namespace}.{self.src_concept[0]}",
+                subject_concept_name=self.src_concept[1],
+                predicate_name="leadTo",
+                object_concept_type_name=f"{self.namespace}.{self.dst_concept[0]}",
+                object_concept_name=self.dst_concept[1],
+                dsl=self.rule_text,
             )
-            print(
+            message = (
                 f"Defined leadTo rule for "
                 f"`{self.src_concept[0]}`/`{self.src_concept[1]}` -> `{self.dst_concept[0]}`/`{self.dst_concept[1]}`"
             )
+        self.rules.append((request, message))
         self.clear_session()
 
+    def rule_key(self, request) -> str:
+        if isinstance(request, rest.DefineDynamicTaxonomyRequest):
+            return f"belongTo:{request.concept_type_name}/{request.concept_name}"
+        return (
+            f"leadTo:{request.subject_concept_type_name}/{request.subject_concept_name}"
+            f"->{request.object_concept_type_name}/{request.object_concept_name}"
+        )
+
+    def rule_digest(self, request) -> str:
+        content = json.dumps(
+            self.concept_client.api_client.sanitize_for_serialization(request),
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def load_manifest(self):
+        if self.force or not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+        except ValueError:
+            # a corrupt manifest only means that all rules are submitted again
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("project_id") != str(
+            self.session._project_id
+        ):
+            return {}
+        rules = manifest.get("rules")
+        return rules if isinstance(rules, dict) else {}
+
+    def save_manifest(self, rules):
+        manifest = {"project_id": str(self.session._project_id), "rules": rules}
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def post_rule(self, request):
+        if isinstance(request, rest.DefineDynamicTaxonomyRequest):
+            self.concept_client.concept_define_dynamic_taxonomy_post(
+                define_dynamic_taxonomy_request=request
+            )
+        else:
+            self.concept_client.concept_define_logical_causation_post(
+                define_logical_causation_request=request
+            )
+
+    def submit_rules(self):
+        """
+        submit the collected rule definitions, make them available for inference
+        """
+
+        submitted = self.load_manifest()
+        pending = []
+        for request, message in self.rules:
+            key, digest = self.rule_key(request), self.rule_digest(request)
+            if submitted.get(key) != digest:
+                pending.append((request, message, key, digest))
+        skipped = len(self.rules) - len(pending)
+        if skipped > 0:
+            print(f"Skipped {skipped} unchanged rules")
+        if not pending:
+            return
+
+        errors = []
+        done = 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.parallelism) as executor:
+                futures = {
+                    executor.submit(self.post_rule, request): (message, key, digest)
+                    for request, message, key, digest in pending
+                }
+                for future in as_completed(futures):
+                    message, key, digest = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        errors.append(f"{key}: {e}")
+                        continue
+                    print(message)
+                    submitted[key] = digest
+                    done += 1
+                    if done % self.checkpoint_interval == 0:
+                        self.save_manifest(submitted)
+        finally:
+            self.save_manifest(submitted)
+        print(f"Submitted {done}/{len(pending)} rules")
+        if errors:
+            raise Exception(
+                f"Failed to submit {len(errors)} rules, rerun to resume:\n"
+                + "\n".join(errors)
+            )
+
     def load_script(self, filename):
         """
-        Load and then parse the script file
+        Load and then parse the script file.
+        A concept with an error is skipped together with its rules, and all errors of the
+        script are raised at the end in one AssertionError.
         """
 
-        file = open(filename, "r", encoding="utf-8")
-        lines = file.read().splitlines()
+        with open(filename, "r", encoding="utf-8") as file:
+            lines = file.read().splitlines()
         last_indent_level = 0
+        skip_rules = False
 
         for line in lines:
             self.current_line_num += 1
@@ -251,8 +372,12 @@ class SPGConceptRuleMarkLang:
                     self.rule_quote_open = False
                     if len(right_strip_line) > 2:
                         self.rule_text += right_strip_line[: len(right_strip_line) - 2]
-                    self.rule_text = self.complete_rule(self.rule_text)
-                    self.submit_rule()
+                    try:
+                        self.rule_text = self.complete_rule(self.rule_text)
+                        self.submit_rule()
+                    except AssertionError as e:
+                        self.errors.append(str(e))
+                        self.clear_session()
 
                 else:
                     self.rule_text += line + "\n"
@@ -264,7 +389,16 @@ class SPGConceptRuleMarkLang:
             if indent_count == 0:
                 # the line without indent is namespace definition or a concept definition
                 self.clear_session()
-                self.parse_concept(strip_line)
+                try:
+                    self.parse_concept(strip_line)
+                    skip_rules = False
+                except AssertionError as e:
+                    self.errors.append(str(e))
+                    skip_rules = True
+
+            elif skip_rules:
+                # skip the rules of an erroneous concept
+                continue
 
             elif indent_count > last_indent_level:
                 # the line is the sub definition of the previous line
@@ -272,10 +406,11 @@ class SPGConceptRuleMarkLang:
                     if len(strip_line) > 5:
                         self.parse_rule(strip_line[5:])
                 else:
-                    raise Exception(self.error_msg("parse error, expect rule:"))
+                    self.errors.append(self.error_msg("parse error, expect rule:"))
 
             last_indent_level = indent_count
 
         # if rule is the last line of file, then submit it
         if len(self.rule_text) > 0:
             self.submit_rule()
+        assert not self.errors, "\n".join(self.errors)
@@ -9,9 +9,12 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
+import hashlib
+import json
 import re
 from enum import Enum
 from pathlib import Path
+from typing import List
 
 from knext.client.model.base import (
     HypernymPredicateEnum,
@@ -32,6 +35,43 @@ from knext.client.model.spg_type import (
 from knext.client.schema import SchemaClient
 
 
+"""Types and properties provided by the server, used when parsing offline.
+The types are the ones seeded by dev/release/mysql/sql/initdb.sql."""
+BUILTIN_BASIC_TYPES = {"Text", "Integer", "Float"}
+BUILTIN_STANDARD_TYPES = {
+    "STD.ChinaMobile",
+    "STD.Email",
+    "STD.IdCardNo",
+    "STD.MacAddress",
+    "STD.Date",
+    "STD.ChinaTelCode",
+    "STD.Timestamp",
+}
+THING_PROPERTIES = ("id", "name", "description")
+
+_NAMESPACE_PATTERN = re.compile(r"^namespace\s+([a-zA-Z0-9]+)$")
+_TYPE_PATTERN = re.compile(r"^([a-zA-Z0-9\.]+)\((\w+)\):\s*?([a-zA-Z0-9,]+)$")
+_SUB_TYPE_PATTERN = re.compile(r"^([a-zA-Z0-9]+)\((\w+)\)\s*?->\s*?([a-zA-Z0-9\.]+):$")
+_TYPE_META_PATTERN = re.compile(
+    r"^(desc|properties|relations|hypernymPredicate|regular|spreadable|autoRelate):\s*?(.*)$"
+)
+_PREDICATE_PATTERN = re.compile(r"^([a-zA-Z0-9#]+)\(([\w\.]+)\):\s*?([a-zA-Z0-9,\.]+)$")
+_PROPERTY_META_PATTERN = re.compile(r"^(desc|properties|constraint|rule):\s*?(.*)$")
+_RELATION_META_PATTERN = re.compile(r"^(desc|properties|rule):\s*?(.*)$")
+_CONSTRAINT_VALUE_PATTERN = re.compile(
+    r"(Enum|Regular)\s*?=\s*?\"([^\"]+)\"", re.IGNORECASE
+)
+_DEFINE_PATTERN = re.compile(r"Define\s*\(", re.IGNORECASE)
+_RULE_TYPE_PATTERN = re.compile(
+    r"\(([\w\s]*?:)(`?[\w\s\.]+)`?/?[^)]*?\)", re.IGNORECASE
+)
+
+
+def _digest(value) -> str:
+    content = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
 class IndentLevel(Enum):
     # Define entity/concept/event/standard types or subtypes
     Type = 0
@@ -64,12 +104,10 @@ class SPGSchemaMarkLang:
     SPG Schema Mark Language Parser
     Feature1: parse schema script and then alter the schema of project
     Feature2: export schema script from a project
+    If `offline` is True, the script is validated against the built-in types of the
+    server instead of the project schema, and no request is sent to the server.
     """
 
-    internal_type = set()
-    entity_internal_property = set()
-    event_internal_property = {"eventTime"}
-    concept_internal_property = {"stdId", "alias"}
     keyword_type = {"EntityType", "ConceptType", "EventType", "StandardType"}
     semantic_rel = {
         "SYNANT": [
@@ -124,23 +162,43 @@ class SPGSchemaMarkLang:
         "receivesAction": "接受动作",
         "motivatedByGoal": "目标驱动",
     }
-    parsing_register = {
-        RegisterUnit.Type: None,
-        RegisterUnit.Property: None,
-        RegisterUnit.Relation: None,
-        RegisterUnit.SubProperty: None,
-    }
-    indent_level_pos = [None, None, None, None, None, None]
-    rule_quote_predicate = None
-    rule_quote_open = False
-    current_parsing_level = 0
-    last_indent_level = 0
-    namespace = None
-    types = {}
-
-    def __init__(self, filename):
+
+    def __init__(self, filename, offline: bool = False):
         self.schema_file = filename
+        self.offline = offline
         self.current_line_num = 0
+        self.current_column_num = 0
+        self.current_line = ""
+        self.internal_type = set()
+        self.entity_internal_property = set()
+        self.event_internal_property = {"eventTime"}
+        self.concept_internal_property = {"stdId", "alias"}
+        self.parsing_register = {
+            RegisterUnit.Type: None,
+            RegisterUnit.Property: None,
+            RegisterUnit.Relation: None,
+            RegisterUnit.SubProperty: None,
+        }
+        self.indent_level_pos = [None, None, None, None, None, None]
+        self.rule_quote_predicate = None
+        self.rule_quote_open = False
+        self.current_parsing_level = 0
+        self.last_indent_level = 0
+        self.namespace = None
+        self.types = {}
+        self.errors = []
+
+        if offline:
+            self.init_builtin_types()
+        else:
+            self.init_server_types()
+        self.load_script()
+
+    def init_server_types(self):
+        """
+        Load the internal types and properties from the project schema
+        """
+
         schema = SchemaClient()
         thing = schema.query_spg_type("Thing")
         for prop in thing.properties:
@@ -155,7 +213,23 @@ class SPGSchemaMarkLang:
                 SpgTypeEnum.Standard,
             ]:
                 self.internal_type.add(spg_type.name)
-        self.load_script()
+
+    def init_builtin_types(self):
+        """
+        Use the built-in types and properties of the server as internal ones
+        """
+
+        self.internal_type.update(BUILTIN_BASIC_TYPES | BUILTIN_STANDARD_TYPES)
+        for prop in THING_PROPERTIES:
+            self.entity_internal_property.add(prop)
+            self.event_internal_property.add(prop)
+            self.concept_internal_property.add(prop)
+
+    @staticmethod
+    def script_digest(filename) -> str:
+        """Hash of the content of a schema script."""
+        with open(filename, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
 
     def save_register(self, element: RegisterUnit, value):
         """
@@ -208,8 +282,16 @@ class SPGSchemaMarkLang:
 
             self.current_parsing_level += 1
 
-    def error_msg(self, msg):
-        return f"Line# {self.current_line_num}: {msg} (Please refer https://spg.openkg.cn/tutorial/spgschema for details)"
+    def error_msg(self, msg, token: str = None):
+        """Formats an error of the current line, at the column of `token` if it is found
+        in the line, or else at the first column of the expression."""
+        column = self.current_column_num
+        for text in (token, (token or "").split(".")[-1]):
+            index = self.current_line.find(text, column - 1) if text else -1
+            if index >= 0:
+                column = index + 1
+                break
+        return f"Line# {self.current_line_num}, Column# {column}: {msg} (Please refer https://spg.openkg.cn/tutorial/spgschema for details)"
 
     def get_type_name_with_ns(self, type_name: str):
         if "." in type_name:
@@ -222,7 +304,7 @@ class SPGSchemaMarkLang:
         parse the SPG type definition
         """
 
-        namespace_match = re.match(r"^namespace\s+([a-zA-Z0-9]+)$", expression)
+        namespace_match = _NAMESPACE_PATTERN.match(expression)
         if namespace_match:
             assert self.namespace is None, self.error_msg(
                 "Duplicated namespace define, please ensure define it only once"
@@ -231,9 +313,7 @@ class SPGSchemaMarkLang:
             self.namespace = namespace_match.group(1)
             return
 
-        type_match = re.match(
-            r"^([a-zA-Z0-9\.]+)\((\w+)\):\s*?([a-zA-Z0-9,]+)$", expression
-        )
+        type_match = _TYPE_PATTERN.match(expression)
         if type_match:
             assert self.namespace is not None, self.error_msg(
                 "Missing namespace, please define namespace at the first"
@@ -243,7 +323,8 @@ class SPGSchemaMarkLang:
             type_name_zh = type_match.group(2).strip()
             type_class = type_match.group(3).strip()
             assert type_class in self.keyword_type, self.error_msg(
-                f"{type_class} is illegal, please define it before current line"
+                f"{type_class} is illegal, please define it before current line",
+                token=type_class,
             )
 
             spg_type = None
@@ -269,16 +350,14 @@ class SPGSchemaMarkLang:
                 )
             ns_type_name = self.get_type_name_with_ns(type_name)
             assert ns_type_name not in self.types, self.error_msg(
-                f'Type "{type_name}" is duplicated in the schema'
+                f'Type "{type_name}" is duplicated in the schema', token=type_name
             )
 
             self.types[ns_type_name] = spg_type
             self.save_register(RegisterUnit.Type, spg_type)
             return
 
-        sub_type_match = re.match(
-            r"^([a-zA-Z0-9]+)\((\w+)\)\s*?->\s*?([a-zA-Z0-9\.]+):$", expression
-        )
+        sub_type_match = _SUB_TYPE_PATTERN.match(expression)
         if sub_type_match:
             assert self.namespace is not None, self.error_msg(
                 "Missing namespace, please define namespace at the first"
@@ -294,9 +373,11 @@ class SPGSchemaMarkLang:
             assert (
                 type_class not in self.keyword_type
                 and type_class not in self.internal_type
-            ), self.error_msg(f"{type_class} is not a valid inheritable type")
+            ), self.error_msg(
+                f"{type_class} is not a valid inheritable type", token=type_class
+            )
             assert ns_type_class in self.types, self.error_msg(
-                f"{type_class} not found, please define it first"
+                f"{type_class} not found, please define it first", token=type_class
             )
 
             parent_spg_type = self.types[ns_type_class]
@@ -304,7 +385,8 @@ class SPGSchemaMarkLang:
                 SpgTypeEnum.Entity,
                 SpgTypeEnum.Event,
             ], self.error_msg(
-                f'"{type_class}" cannot be inherited, only entity/event type can be inherited.'
+                f'"{type_class}" cannot be inherited, only entity/event type can be inherited.',
+                token=type_class,
             )
 
             spg_type = EntityType(
@@ -333,10 +415,7 @@ class SPGSchemaMarkLang:
         parse the meta definition of SPG type
         """
 
-        match = re.match(
-            r"^(desc|properties|relations|hypernymPredicate|regular|spreadable|autoRelate):\s*?(.*)$",
-            expression,
-        )
+        match = _TYPE_META_PATTERN.match(expression)
         assert match, self.error_msg(
             "Unrecognized expression, expect desc:|properties:|relations:"
         )
@@ -422,7 +501,8 @@ class SPGSchemaMarkLang:
                     and self.types[c].spg_type_enum == SpgTypeEnum.Concept
                 ), self.error_msg(
                     f"{concept.strip()} is not a concept type, "
-                    f"concept type only allow relationships defined between concept types"
+                    f"concept type only allow relationships defined between concept types",
+                    token=concept.strip(),
                 )
                 for k in self.semantic_rel:
                     if k == "IND":
@@ -443,10 +523,12 @@ class SPGSchemaMarkLang:
         short_name = name_arr[0]
         pred_name = name_arr[1]
         assert short_name in self.semantic_rel, self.error_msg(
-            f"{short_name} is incorrect, expect SYNANT/CAU/SEQ/IND/INC"
+            f"{short_name} is incorrect, expect SYNANT/CAU/SEQ/IND/INC",
+            token=short_name,
         )
         assert pred_name in self.semantic_rel[short_name], self.error_msg(
-            f'{pred_name} is incorrect, expect {" / ".join(self.semantic_rel[short_name])}'
+            f'{pred_name} is incorrect, expect {" / ".join(self.semantic_rel[short_name])}',
+            token=pred_name,
         )
 
         subject_type = self.parsing_register[RegisterUnit.Type]
@@ -454,7 +536,8 @@ class SPGSchemaMarkLang:
         if "." not in predicate_class:
             predicate_class_ns = f"{self.namespace}.{predicate_class}"
         assert predicate_class_ns in self.types, self.error_msg(
-            f"{predicate_class} is illegal, please ensure that it appears in this schema."
+            f"{predicate_class} is illegal, please ensure that it appears in this schema.",
+            token=predicate_class,
         )
         object_type = self.types[predicate_class_ns]
 
@@ -474,7 +557,8 @@ class SPGSchemaMarkLang:
                 SpgTypeEnum.Concept,
                 SpgTypeEnum.Event,
             ], self.error_msg(
-                f'"{predicate_class}" must be a concept type to conform to the definition of causal relation'
+                f'"{predicate_class}" must be a concept type to conform to the definition of causal relation',
+                token=predicate_class,
             )
             if subject_type.spg_type_enum == SpgTypeEnum.Concept:
                 assert object_type.spg_type_enum == SpgTypeEnum.Concept, self.error_msg(
@@ -490,7 +574,8 @@ class SPGSchemaMarkLang:
             assert (
                 subject_type.spg_type_enum == object_type.spg_type_enum
             ), self.error_msg(
-                f'"{predicate_class}" should keep the same type with "{subject_type.name.split(".")[1]}"'
+                f'"{predicate_class}" should keep the same type with "{subject_type.name.split(".")[1]}"',
+                token=predicate_class,
             )
         elif short_name == "IND":
             assert subject_type.spg_type_enum in [
@@ -498,7 +583,8 @@ class SPGSchemaMarkLang:
                 SpgTypeEnum.Event,
             ], self.error_msg("Only entity/event types could define inductive relation")
             assert object_type.spg_type_enum == SpgTypeEnum.Concept, self.error_msg(
-                f'"{predicate_class}" must be a concept type to conform to the definition of inductive relation'
+                f'"{predicate_class}" must be a concept type to conform to the definition of inductive relation',
+                token=predicate_class,
             )
         elif short_name == "INC":
             assert subject_type.spg_type_enum == SpgTypeEnum.Concept, self.error_msg(
@@ -520,9 +606,7 @@ class SPGSchemaMarkLang:
         parse the property/relation definition of SPG type
         """
 
-        match = re.match(
-            r"^([a-zA-Z0-9#]+)\(([\w\.]+)\):\s*?([a-zA-Z0-9,\.]+)$", expression
-        )
+        match = _PREDICATE_PATTERN.match(expression)
         assert match, self.error_msg(
             "Unrecognized expression, expect pattern like english(Chinese):Type"
         )
@@ -547,17 +631,20 @@ class SPGSchemaMarkLang:
         else:
             for semantic_short in self.semantic_rel.values():
                 assert predicate_name not in semantic_short, self.error_msg(
-                    f"{predicate_name} is a semantic predicate, please add the semantic prefix"
+                    f"{predicate_name} is a semantic predicate, please add the semantic prefix",
+                    token=predicate_name,
                 )
 
         assert (
             self.get_type_name_with_ns(predicate_class) in self.types
             or predicate_class in self.internal_type
         ), self.error_msg(
-            f"{predicate_class} is illegal, please ensure that it appears in this schema."
+            f"{predicate_class} is illegal, please ensure that it appears in this schema.",
+            token=predicate_class,
         )
         assert predicate_name not in self.entity_internal_property, self.error_msg(
-            f"property {predicate_name} is the default property of type"
+            f"property {predicate_name} is the default property of type",
+            token=predicate_name,
         )
         if predicate_class not in self.internal_type:
             predicate_type = self.types[self.get_type_name_with_ns(predicate_class)]
@@ -583,26 +670,30 @@ class SPGSchemaMarkLang:
                 not in self.parsing_register[RegisterUnit.Relation].sub_properties
             ), self.error_msg(
                 f'Property "{predicate_name}" is duplicated under the relation '
-                f"{self.parsing_register[RegisterUnit.Relation].name}"
+                f"{self.parsing_register[RegisterUnit.Relation].name}",
+                token=predicate_name,
             )
         else:
             assert (
                 predicate_name
                 not in self.parsing_register[RegisterUnit.Type].properties
             ), self.error_msg(
-                f'Property "{predicate_name}" is duplicated under the type {type_name[type_name.index(".") + 1:]}'
+                f'Property "{predicate_name}" is duplicated under the type {type_name[type_name.index(".") + 1:]}',
+                token=predicate_name,
             )
         if predicate_class == "ConceptType":
             assert not self.is_internal_property(
                 predicate_name, SpgTypeEnum.Concept
             ), self.error_msg(
-                f"property {predicate_name} is the default property of ConceptType"
+                f"property {predicate_name} is the default property of ConceptType",
+                token=predicate_name,
             )
         if predicate_class == "EventType":
             assert not self.is_internal_property(
                 predicate_name, SpgTypeEnum.Event
             ), self.error_msg(
-                f"property {predicate_name} is the default property of EventType"
+                f"property {predicate_name} is the default property of EventType",
+                token=predicate_name,
             )
 
         if (
@@ -650,13 +741,15 @@ class SPGSchemaMarkLang:
                         assert (
                             subject_type not in BasicTypeEnum.__members__
                         ), self.error_msg(
-                            f"{predicate_class} is illegal for subject in event type"
+                            f"{predicate_class} is illegal for subject in event type",
+                            token=predicate_class,
                         )
 
                         if "." not in subject_type:
                             subject_type = f"{self.namespace}.{predicate_class}"
                         assert subject_type in self.types, self.error_msg(
-                            f"{predicate_class} is illegal, please ensure that it appears in this schema."
+                            f"{predicate_class} is illegal, please ensure that it appears in this schema.",
+                            token=predicate_class,
                         )
 
                         subject_predicate = Property(
@@ -675,10 +768,12 @@ class SPGSchemaMarkLang:
         else:
             # predicate is relation
             assert not predicate_class.startswith("STD."), self.error_msg(
-                f"{predicate_class} is not allow appear in the definition of relation."
+                f"{predicate_class} is not allow appear in the definition of relation.",
+                token=predicate_class,
             )
             assert predicate_class in self.types, self.error_msg(
-                f"{predicate_class} is illegal, please ensure that it appears in this schema."
+                f"{predicate_class} is illegal, please ensure that it appears in this schema.",
+                token=predicate_class,
             )
             assert (
                 f"{predicate_name}_{predicate_class}"
@@ -701,7 +796,7 @@ class SPGSchemaMarkLang:
         parse the property meta definition of SPG type
         """
 
-        match = re.match(r"^(desc|properties|constraint|rule):\s*?(.*)$", expression)
+        match = _PROPERTY_META_PATTERN.match(expression)
         assert match, self.error_msg(
             "Unrecognized expression, expect desc:|properties:|constraint:|rule:"
         )
@@ -740,7 +835,7 @@ class SPGSchemaMarkLang:
         parse the relation meta definition of SPG type
         """
 
-        match = re.match(r"^(desc|properties|rule):\s*?(.*)$", expression)
+        match = _RELATION_META_PATTERN.match(expression)
         assert match, self.error_msg(
             "Unrecognized expression, expect desc:|properties:|rule:"
         )
@@ -806,8 +901,7 @@ class SPGSchemaMarkLang:
         if len(expression) == 0:
             return
 
-        pattern = re.compile(r"(Enum|Regular)\s*?=\s*?\"([^\"]+)\"", re.IGNORECASE)
-        matches = re.findall(pattern, expression)
+        matches = _CONSTRAINT_VALUE_PATTERN.findall(expression)
         if matches:
             for group in matches:
                 if group[0].lower() == "enum":
@@ -820,7 +914,7 @@ class SPGSchemaMarkLang:
                 elif group[0].lower() == "regular":
                     prop.add_constraint(ConstraintTypeEnum.Regular, group[1])
 
-        expression = re.sub(r"(Enum|Regular)\s*?=\s*?\"([^\"]+)\"", "", expression)
+        expression = _CONSTRAINT_VALUE_PATTERN.sub("", expression)
         array = expression.split(",")
         for cons in array:
             cons = cons.strip()
@@ -835,8 +929,7 @@ class SPGSchemaMarkLang:
         Auto generate define statement and append namespace to the entity name
         """
 
-        pattern = re.compile(r"Define\s*\(", re.IGNORECASE)
-        match = pattern.match(rule.strip())
+        match = _DEFINE_PATTERN.match(rule.strip())
         if not match:
             subject_name = self.parsing_register[RegisterUnit.Type].name
             predicate = None
@@ -851,8 +944,7 @@ class SPGSchemaMarkLang:
             rule = head + rule
             rule += "\n}"
 
-        pattern = re.compile(r"\(([\w\s]*?:)(`?[\w\s\.]+)`?/?[^)]*?\)", re.IGNORECASE)
-        matches = re.findall(pattern, rule)
+        matches = _RULE_TYPE_PATTERN.findall(rule)
         replace_list = []
         if matches:
             for group in matches:
@@ -874,11 +966,14 @@ class SPGSchemaMarkLang:
 
     def load_script(self):
         """
-        Load and then parse the script file
+        Load and then parse the script file.
+        A line with an error is skipped together with the lines nested under it, and all
+        errors of the script are raised at the end in one AssertionError.
         """
 
-        file = open(self.schema_file, "r", encoding="utf-8")
-        lines = file.read().splitlines()
+        with open(self.schema_file, "r", encoding="utf-8") as file:
+            lines = file.read().splitlines()
+        error_indent = None
         for line in lines:
             self.current_line_num += 1
             strip_line = line.strip()
@@ -888,49 +983,72 @@ class SPGSchemaMarkLang:
                 # skip empty or comments line
                 continue
 
-            if self.rule_quote_open:
-                # process the multi-line assignment [[ .... ]]
-                right_strip_line = line.rstrip()
-                if strip_line.endswith("]]"):
-                    self.rule_quote_open = False
-                    if len(right_strip_line) > 2:
-                        self.rule_quote_predicate.logical_rule += right_strip_line[
-                            : len(right_strip_line) - 2
-                        ]
-                    self.rule_quote_predicate.logical_rule = self.complete_rule(
-                        self.rule_quote_predicate.logical_rule
-                    )
+            indent_count = len(line) - len(line.lstrip())
+            self.current_line = line
+            self.current_column_num = indent_count + 1
+            if error_indent is not None and not self.rule_quote_open:
+                if indent_count > error_indent:
+                    # skip the definitions nested under an erroneous line
+                    continue
+                error_indent = None
 
-                else:
-                    self.rule_quote_predicate.logical_rule += line + "\n"
-                continue
+            try:
+                self.parse_line(line, strip_line, indent_count)
+            except AssertionError as e:
+                self.errors.append(str(e))
+                self.rule_quote_open = False
+                error_indent = indent_count
+                self.last_indent_level = indent_count
+                self.indent_level_pos[self.current_parsing_level] = indent_count
 
-            indent_count = len(line) - len(line.lstrip())
-            if indent_count == 0:
-                # the line without indent is namespace definition or a type definition
-                self.adjust_parsing_level(0)
-
-            elif indent_count > self.last_indent_level:
-                # the line is the sub definition of the previous line
-                self.adjust_parsing_level(1)
-
-            elif indent_count < self.last_indent_level:
-                # finish current indent parsing
-                backward_step = None
-                for i in range(0, len(self.indent_level_pos)):
-                    if indent_count == self.indent_level_pos[i]:
-                        backward_step = i - self.current_parsing_level
-                        break
-                assert backward_step, self.error_msg(
-                    f"Invalid indentation, please align with the previous definition"
+        assert not self.errors, "\n".join(self.errors)
+
+    def parse_line(self, line, strip_line, indent_count):
+        """
+        Parse a non-empty line of the script
+        """
+        if self.rule_quote_open:
+            # process the multi-line assignment [[ .... ]]
+            right_strip_line = line.rstrip()
+            if strip_line.endswith("]]"):
+                self.rule_quote_open = False
+                if len(right_strip_line) > 2:
+                    self.rule_quote_predicate.logical_rule += right_strip_line[
+                        : len(right_strip_line) - 2
+                    ]
+                self.rule_quote_predicate.logical_rule = self.complete_rule(
+                    self.rule_quote_predicate.logical_rule
                 )
 
-                if backward_step != 0:
-                    self.adjust_parsing_level(backward_step)
+            else:
+                self.rule_quote_predicate.logical_rule += line + "\n"
+            return
+
+        if indent_count == 0:
+            # the line without indent is namespace definition or a type definition
+            self.adjust_parsing_level(0)
+
+        elif indent_count > self.last_indent_level:
+            # the line is the sub definition of the previous line
+            self.adjust_parsing_level(1)
+
+        elif indent_count < self.last_indent_level:
+            # finish current indent parsing
+            backward_step = None
+            for i in range(0, len(self.indent_level_pos)):
+                if indent_count == self.indent_level_pos[i]:
+                    backward_step = i - self.current_parsing_level
+                    break
+            assert backward_step, self.error_msg(
+                f"Invalid indentation, please align with the previous definition"
+            )
+
+            if backward_step != 0:
+                self.adjust_parsing_level(backward_step)
 
-            self.parsing_dispatch(strip_line, self.current_parsing_level)
-            self.last_indent_level = indent_count
-            self.indent_level_pos[self.current_parsing_level] = indent_count
+        self.parsing_dispatch(strip_line, self.current_parsing_level)
+        self.last_indent_level = indent_count
+        self.indent_level_pos[self.current_parsing_level] = indent_count
 
     def is_internal_property(self, prop: Property, spg_type: SpgTypeEnum):
         if spg_type == SpgTypeEnum.Entity or spg_type == SpgTypeEnum.Standard:
@@ -959,11 +1077,16 @@ class SPGSchemaMarkLang:
 
                 old[prop].alter_operation = AlterOperationEnum.Delete
                 need_update = True
-                print(
-                    f"Delete sub property: [{old_type_name}] {old_property.name}.{prop}"
+                self._add_alteration(
+                    old_type_name,
+                    f"Delete sub property: [{old_type_name}] {old_property.name}.{prop}",
                 )
 
         for prop, o in new.items():
+            if prop in old and self.predicate_digest(o) == self.predicate_digest(
+                old[prop]
+            ):
+                continue
             if prop not in old and not new_property.inherited:
                 assert inherited_type is None, self.error_msg(
                     f'"{old_type_name} was inherited by other type, such as "{inherited_type}". Prohibit property alteration!'
@@ -971,8 +1094,9 @@ class SPGSchemaMarkLang:
 
                 old_property.add_sub_property(new[prop])
                 need_update = True
-                print(
-                    f"Create sub property: [{old_type_name}] {old_property.name}.{prop}"
+                self._add_alteration(
+                    old_type_name,
+                    f"Create sub property: [{old_type_name}] {old_property.name}.{prop}",
                 )
 
             elif old[prop].object_type_name != new[prop].object_type_name:
@@ -986,8 +1110,9 @@ class SPGSchemaMarkLang:
                 old[prop].alter_operation = AlterOperationEnum.Delete
                 old_property.add_sub_property(new[prop])
                 need_update = True
-                print(
-                    f"Recreate sub property: [{old_type_name}] {old_property.name}.{prop}"
+                self._add_alteration(
+                    old_type_name,
+                    f"Recreate sub property: [{old_type_name}] {old_property.name}.{prop}",
                 )
 
             elif old[prop] != new[prop]:
@@ -1001,7 +1126,10 @@ class SPGSchemaMarkLang:
                 old[prop].overwritten_by(o)
                 old[prop].alter_operation = AlterOperationEnum.Update
                 need_update = True
-                print(f"Update property: [{old_type_name}] {old_property.name}.{prop}")
+                self._add_alteration(
+                    old_type_name,
+                    f"Update property: [{old_type_name}] {old_property.name}.{prop}",
+                )
         return need_update
 
     def get_inherited_type(self, type_name):
@@ -1010,37 +1138,92 @@ class SPGSchemaMarkLang:
                 return spg_type
         return None
 
-    def diff_and_sync(self, print_only):
+    def predicate_digest(self, predicate) -> str:
+        """Hash of a property or relation, including its sub properties."""
+        sub_properties = {
+            name: _digest(sub_property.to_dict())
+            for name, sub_property in predicate.sub_properties.items()
+        }
+        return _digest([predicate.to_dict(), sub_properties])
+
+    def type_digest(self, spg_type) -> str:
+        """Hash of the alterable part of a type. Types with the same digest in the script
+        and on the server have no alteration, so their subtrees are not compared."""
+        meta = {
+            attr: getattr(spg_type, attr, None)
+            for attr in (
+                "spg_type_enum",
+                "parent_type_name",
+                "name_zh",
+                "desc",
+                "hypernym_predicate",
+                "spreadable",
+                "constraint",
+            )
+        }
+        properties = {
+            name: self.predicate_digest(prop)
+            for name, prop in spg_type.properties.items()
+            if not prop.inherited
+            and not self.is_internal_property(name, spg_type.spg_type_enum)
+        }
+        hypernym_predicates = [member.value for member in HypernymPredicateEnum]
+        relations = {
+            name: self.predicate_digest(relation)
+            for name, relation in spg_type.relations.items()
+            if not relation.inherited
+            and not relation.is_dynamic
+            and name.split("_")[0] not in spg_type.properties
+            and not (
+                spg_type.spg_type_enum == SpgTypeEnum.Concept
+                and name.split("_")[0] in hypernym_predicates
+            )
+        }
+        return _digest([meta, properties, relations])
+
+    def _add_alteration(self, spg_type_name: str, message: str, rank: int = 2):
+        self.alteration_plan.append((rank, spg_type_name, message))
+
+    def diff(self, session) -> List[str]:
         """
-        Get the schema diff and then sync to graph storage
+        Alter the SPG types in `session` to match the script, and return the alteration
+        plan: deleted types first, then created types, then the updates of each type.
+        Only the types, properties and relations whose digest differs are compared, so a
+        session loaded from a schema snapshot can be diffed offline.
         """
-        schema = SchemaClient()
-        session = schema.create_session()
+        self.alteration_plan = []
 
         # generate the delete list of spg type
-        for spg_type in session.spg_types:
-            unique_id = session.spg_types[spg_type]._rest_model.ontology_id.unique_id
-            if spg_type in self.internal_type and unique_id < 1000:
-                continue
+        for spg_type in session.spg_type_names:
+            if spg_type in self.internal_type:
+                unique_id = session.get(spg_type)._rest_model.ontology_id.unique_id
+                if unique_id < 1000:
+                    continue
 
             if spg_type not in self.types:
                 session.delete_type(session.get(spg_type))
-                print(f"Delete type: {spg_type}")
+                self._add_alteration(spg_type, f"Delete type: {spg_type}", rank=0)
 
         for spg_type in self.types:
             # generate the creation list of spg type
-            if spg_type not in session.spg_types:
+            if spg_type not in session.spg_type_names:
                 session.create_type(self.types[spg_type])
-                print(f"Create type: {spg_type}")
+                self._add_alteration(spg_type, f"Create type: {spg_type}", rank=1)
                 relations = self.types[spg_type].relations
                 if len(relations) > 0:
                     for rel in relations:
-                        print(f'Create relation: [{spg_type}] {rel.split("_")[0]}')
+                        self._add_alteration(
+                            spg_type,
+                            f'Create relation: [{spg_type}] {rel.split("_")[0]}',
+                            rank=1,
+                        )
 
             else:
                 # generate the update list
                 new_type = self.types[spg_type]
                 old_type = session.get(spg_type)
+                if self.type_digest(new_type) == self.type_digest(old_type):
+                    continue
 
                 assert (
                     new_type.spg_type_enum == old_type.spg_type_enum
@@ -1077,7 +1260,9 @@ class SPGSchemaMarkLang:
                     if old_type.constraint != new_type.constraint:
                         old_type.constraint = new_type.constraint
                         need_update = True
-                        print(f"Update standard type constraint: {spg_type}")
+                        self._add_alteration(
+                            spg_type, f"Update standard type constraint: {spg_type}"
+                        )
 
                 inherited_type = self.get_inherited_type(new_type.name)
                 for prop in old_type.properties:
@@ -1101,10 +1286,15 @@ class SPGSchemaMarkLang:
                             prop
                         ].alter_operation = AlterOperationEnum.Delete
                         need_update = True
-                        print(f"Delete property: [{new_type.name}] {prop}")
+                        self._add_alteration(
+                            spg_type, f"Delete property: [{new_type.name}] {prop}"
+                        )
 
                 for prop, o in new_type.properties.items():
-
+                    if prop in old_type.properties and self.predicate_digest(
+                        o
+                    ) == self.predicate_digest(old_type.properties[prop]):
+                        continue
                     if (
                         prop not in old_type.properties
                         and not self.is_internal_property(prop, new_type.spg_type_enum)
@@ -1116,7 +1306,9 @@ class SPGSchemaMarkLang:
 
                         old_type.add_property(new_type.properties[prop])
                         need_update = True
-                        print(f"Create property: [{new_type.name}] {prop}")
+                        self._add_alteration(
+                            spg_type, f"Create property: [{new_type.name}] {prop}"
+                        )
 
                     elif (
                         old_type.properties[prop].object_type_name
@@ -1134,7 +1326,9 @@ class SPGSchemaMarkLang:
                         ].alter_operation = AlterOperationEnum.Delete
                         old_type.add_property(new_type.properties[prop])
                         need_update = True
-                        print(f"Recreate property: [{new_type.name}] {prop}")
+                        self._add_alteration(
+                            spg_type, f"Recreate property: [{new_type.name}] {prop}"
+                        )
 
                     elif (
                         old_type.properties[prop].sub_properties
@@ -1165,10 +1359,16 @@ class SPGSchemaMarkLang:
                             prop
                         ].alter_operation = AlterOperationEnum.Update
                         need_update = True
-                        print(f"Update property: [{new_type.name}] {prop}")
+                        self._add_alteration(
+                            spg_type, f"Update property: [{new_type.name}] {prop}"
+                        )
 
                 for relation in new_type.relations:
                     p_name = relation.split("_")[0]
+                    if relation in old_type.relations and self.predicate_digest(
+                        new_type.relations[relation]
+                    ) == self.predicate_digest(old_type.relations[relation]):
+                        continue
                     if (
                         relation not in old_type.relations
                         or old_type.relations[relation].object_type_name
@@ -1179,7 +1379,9 @@ class SPGSchemaMarkLang:
                         )
                         old_type.add_relation(new_type.relations[relation])
                         need_update = True
-                        print(f"Create relation: [{new_type.name}] {p_name}")
+                        self._add_alteration(
+                            spg_type, f"Create relation: [{new_type.name}] {p_name}"
+                        )
 
                     elif (
                         old_type.relations[relation].sub_properties
@@ -1217,7 +1419,9 @@ class SPGSchemaMarkLang:
                             relation
                         ].alter_operation = AlterOperationEnum.Update
                         need_update = True
-                        print(f"Update relation: [{new_type.name}] {relation}")
+                        self._add_alteration(
+                            spg_type, f"Update relation: [{new_type.name}] {relation}"
+                        )
 
                 for relation, o in old_type.relations.items():
                     p_name = relation.split("_")[0]
@@ -1241,72 +1445,138 @@ class SPGSchemaMarkLang:
                             relation
                         ].alter_operation = AlterOperationEnum.Delete
                         need_update = True
-                        print(f"Delete relation: [{new_type.name}] {p_name}")
+                        self._add_alteration(
+                            spg_type, f"Delete relation: [{new_type.name}] {p_name}"
+                        )
 
                 if need_update:
                     session.update_type(old_type)
+        self.alteration_plan.sort(key=lambda alteration: alteration[:2])
+        return [message for _, _, message in self.alteration_plan]
+
+    def diff_and_sync(self, print_only):
+        """
+        Get the schema diff and then sync to graph storage
+        """
+        schema = SchemaClient()
+        session = schema.create_session(refresh=True)
+        for message in self.diff(session):
+            print(message)
         if not print_only:
             session.commit()
         if session._alter_spg_types:
             return True
         return False
 
-    def export_schema_python(self, filename):
+    def export_schema_python(self, filename, offline: bool = None):
         """
         Export the schema helper class in python
         You can import the exported class in your code to obtain the code prompt in IDE
+        If `offline` is True, the helper is exported from the parsed script instead of
+        the project schema, and records the digest of the script.
         """
 
-        schema = SchemaClient()
-        session = schema.create_session()
+        if offline is None:
+            offline = self.offline
         assert len(self.namespace) > 0, "Schema is invalid"
 
         spg_types = []
-        for spg_type_name in sorted(session.spg_types):
-            if spg_type_name.startswith("STD.") or spg_type_name in self.internal_type:
-                continue
-
-            sub_properties = {}
-            properties = set()
-            for prop, prop_type in session.get(spg_type_name).properties.items():
-                if len(prop_type.sub_properties) > 0:
-                    sub_properties[prop] = set()
-                    for sub_prop in prop_type.sub_properties:
-                        sub_properties[prop].add(sub_prop)
-                else:
-                    properties.add(prop)
-
-            relations = set()
-            relation_sub_properties = {}
-            hyp_predicate = [member.value for member in HypernymPredicateEnum]
-            for relation, relation_type in session.get(spg_type_name).relations.items():
-                rel = relation.split("_")[0]
+        if offline:
+            for spg_type_name in sorted(self.types):
+                if spg_type_name.startswith("STD."):
+                    continue
+                spg_types.append(
+                    self.helper_metadata(
+                        spg_type_name,
+                        self.offline_predicates(spg_type_name, "properties"),
+                        self.offline_predicates(spg_type_name, "relations"),
+                    )
+                )
+        else:
+            session = SchemaClient().create_session()
+            for spg_type_name in sorted(session.spg_type_names):
                 if (
-                    rel in relations
-                    or rel in hyp_predicate
-                    or rel in session.get(spg_type_name).properties
+                    spg_type_name.startswith("STD.")
+                    or spg_type_name in self.internal_type
                 ):
                     continue
-
-                if len(relation_type.sub_properties) > 0:
-                    relation_sub_properties[rel] = set()
-                    for sub_prop in relation_type.sub_properties:
-                        relation_sub_properties[rel].add(sub_prop)
-                else:
-                    relations.add(rel)
-
-            spg_types.append(
-                {
-                    "name": spg_type_name.split(".")[1],
-                    "properties": properties,
-                    "sub_properties": sub_properties,
-                    "relations": relations,
-                    "relation_sub_properties": relation_sub_properties,
-                }
-            )
+                spg_type = session.get(spg_type_name)
+                spg_types.append(
+                    self.helper_metadata(
+                        spg_type_name, spg_type.properties, spg_type.relations
+                    )
+                )
 
         metadata = {"namespace": self.namespace, "spg_types": spg_types}
+        if offline:
+            metadata["schema_digest"] = self.script_digest(self.schema_file)
 
         from knext.common.template import render_template
 
         render_template(Path(filename).parent, Path(filename).name, **metadata)
+
+    def helper_metadata(self, spg_type_name, properties, relations):
+        """
+        Collect the names of properties, relations and sub properties of a type for the
+        schema helper template
+        """
+
+        sub_properties = {}
+        helper_properties = set()
+        for prop, prop_type in properties.items():
+            if len(prop_type.sub_properties) > 0:
+                sub_properties[prop] = set()
+                for sub_prop in prop_type.sub_properties:
+                    sub_properties[prop].add(sub_prop)
+            else:
+                helper_properties.add(prop)
+
+        helper_relations = set()
+        relation_sub_properties = {}
+        hyp_predicate = [member.value for member in HypernymPredicateEnum]
+        for relation, relation_type in relations.items():
+            rel = relation.split("_")[0]
+            if rel in helper_relations or rel in hyp_predicate or rel in properties:
+                continue
+
+            if len(relation_type.sub_properties) > 0:
+                relation_sub_properties[rel] = set()
+                for sub_prop in relation_type.sub_properties:
+                    relation_sub_properties[rel].add(sub_prop)
+            else:
+                helper_relations.add(rel)
+
+        return {
+            "name": spg_type_name.split(".")[1],
+            "properties": sorted(helper_properties),
+            "sub_properties": {k: sorted(v) for k, v in sorted(sub_properties.items())},
+            "relations": sorted(helper_relations),
+            "relation_sub_properties": {
+                k: sorted(v) for k, v in sorted(relation_sub_properties.items())
+            },
+        }
+
+    def offline_predicates(self, spg_type_name, attr):
+        """
+        Get the properties or relations of a parsed type, including the ones inherited
+        from its parent types and, for properties, the internal ones of the server
+        """
+
+        spg_type = self.types[spg_type_name]
+        lineage = [spg_type]
+        while lineage[-1].parent_type_name in self.types:
+            lineage.append(self.types[lineage[-1].parent_type_name])
+
+        predicates = {}
+        if attr == "properties":
+            if spg_type.spg_type_enum == SpgTypeEnum.Concept:
+                internal_properties = self.concept_internal_property
+            elif spg_type.spg_type_enum == SpgTypeEnum.Event:
+                internal_properties = self.event_internal_property
+            else:
+                internal_properties = self.entity_internal_property
+            for prop in sorted(internal_properties):
+                predicates[prop] = Property(name=prop, object_type_name="Text")
+        for ancestor in reversed(lineage):
+            predicates.update(getattr(ancestor, attr))
+        return predicates
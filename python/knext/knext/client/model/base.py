@@ -328,6 +328,8 @@ class BaseProperty(ABC):
 
         if sub_properties is None:
             return
+        if isinstance(sub_properties, dict):
+            sub_properties = sub_properties.values()
 
         self._rest_model.advanced_config.sub_properties = [
             prop.to_rest() for prop in sub_properties
@@ -686,14 +688,19 @@ class BaseSpgType(ABC):
         """
         from knext.client.model.property import Property
 
-        properties = {}
-        for prop in self._rest_model.properties:
-            properties[prop.basic_info.name.name] = Property(
-                name=prop.basic_info.name.name,
-                object_type_name=prop.object_type_ref.basic_info.name.name,
-                rest_model=prop,
-            )
-        return properties
+        def build(rest_properties):
+            properties = {}
+            for prop in rest_properties:
+                properties[prop.basic_info.name.name] = Property(
+                    name=prop.basic_info.name.name,
+                    object_type_name=prop.object_type_ref.basic_info.name.name,
+                    rest_model=prop,
+                )
+            return properties
+
+        return self._cached_wrappers(
+            "_properties_cache", self._rest_model.properties, build
+        )
 
     @properties.setter
     def properties(self, properties: List[Type["Property"]]):
@@ -729,16 +736,21 @@ class BaseSpgType(ABC):
         """
         from knext.client.model.relation import Relation
 
-        relations = {}
-        for relation in self._rest_model.relations:
-            predicate_name = relation.basic_info.name.name
-            object_type_name = relation.object_type_ref.basic_info.name.name
-            relations[predicate_name + "_" + object_type_name] = Relation(
-                name=predicate_name,
-                object_type_name=object_type_name,
-                rest_model=relation,
-            )
-        return relations
+        def build(rest_relations):
+            relations = {}
+            for relation in rest_relations:
+                predicate_name = relation.basic_info.name.name
+                object_type_name = relation.object_type_ref.basic_info.name.name
+                relations[predicate_name + "_" + object_type_name] = Relation(
+                    name=predicate_name,
+                    object_type_name=object_type_name,
+                    rest_model=relation,
+                )
+            return relations
+
+        return self._cached_wrappers(
+            "_relations_cache", self._rest_model.relations, build
+        )
 
     @relations.setter
     def relations(self, relations: List["Relation"]):
@@ -787,6 +799,19 @@ class BaseSpgType(ABC):
         """
         self._rest_model.alter_operation = alter_operation
 
+    def _cached_wrappers(self, cache_name: str, rest_models: list, build) -> dict:
+        """Returns a copy of the wrappers built by `build` from `rest_models`.
+
+        The wrappers are built once and rebuilt only when `rest_models` is replaced or
+        its elements are added, removed or replaced.
+        """
+        ids = tuple(map(id, rest_models or []))
+        cache = getattr(self, cache_name, None)
+        if cache is None or cache[0] is not rest_models or cache[1] != ids:
+            cache = (rest_models, ids, build(rest_models or []))
+            setattr(self, cache_name, cache)
+        return dict(cache[2])
+
     @staticmethod
     def by_type_enum(type_enum: str):
         """Reflection from type enum to subclass object of BaseSpgType."""
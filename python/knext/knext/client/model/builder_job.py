@@ -11,7 +11,7 @@
 # or implied.
 
 from enum import Enum
-from typing import Dict, Type
+from typing import Dict, Tuple, Type
 
 from knext.chain.builder_chain import BuilderChain
 
@@ -32,6 +32,7 @@ class BuilderJob:
     lead_to: bool
 
     _registry: Dict[str, Type] = {}
+    _lazy_registry: Dict[str, Tuple[str, str]] = {}
     _local_path: str
     _module_path: str
     _has_registered: bool = False
@@ -54,6 +55,10 @@ class BuilderJob:
             subclass.name = name
             subclass._local_path = local_path
             subclass._module_path = module_path
+            if name in cls._lazy_registry:
+                raise ValueError(
+                    f"BuilderJob [{name}] conflict in {subclass._local_path} and {cls._lazy_registry[name][0]}."
+                )
             if name in cls._registry:
                 raise ValueError(
                     f"BuilderJob [{name}] conflict in {subclass._local_path} and {cls.by_name(name)._local_path}."
@@ -67,6 +72,10 @@ class BuilderJob:
     @classmethod
     def by_name(cls, name: str):
         """Reflection from job name to subclass object of BuilderJob."""
+        if name not in BuilderJob._registry and name in BuilderJob._lazy_registry:
+            from knext.common.class_register import load_registered
+
+            load_registered(BuilderJob, name)
         if name in BuilderJob._registry:
             subclass = BuilderJob._registry[name]
             return subclass
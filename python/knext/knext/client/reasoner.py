@@ -11,9 +11,11 @@
 # or implied.
 import os
 from enum import Enum
+from typing import Iterator
 
 from knext import rest
 from knext.client.base import Client
+from knext.client.table_store import TableStoreClient
 
 _DEFAULT_JOB_NAME = "job"
 
@@ -89,6 +91,33 @@ class ReasonerClient(Client):
         )
         return self._rest_client.reasoner_run_dsl_post(reasoner_dsl_run_request=request)
 
+    def run_dsl_pages(
+        self, dsl_content: str, page_size: int = 1000
+    ) -> Iterator[rest.TableReasonerReceipt]:
+        """Run a synchronization reasoner job by providing DSL content, and yield its
+        result in pages of at most `page_size` rows."""
+        result = self.run_dsl(dsl_content)
+        cells = result.cells or []
+        for start in range(0, len(cells), page_size):
+            yield rest.TableReasonerReceipt(
+                columns=result.columns,
+                cells=cells[start : start + page_size],
+                receipt_type=result.receipt_type,
+            )
+
     def query(self, job_inst_id: int):
         """Query status of a submitted reasoner job by job inst id."""
         return self._rest_client.reasoner_query_job_inst_get(job_inst_id=job_inst_id)
+
+    def iter_result(self, table_name: str, batch_size: int = None) -> Iterator:
+        """Stream the result table of a reasoner job. Yields the rows, starting with the
+        header row, or column batches of `batch_size` rows if it is given."""
+        client = TableStoreClient(self._host_addr, self._project_id)
+        if batch_size:
+            return client.iter_batches(table_name, batch_size)
+        return client.iter_rows(table_name)
+
+    def download_result(self, table_name: str, file_path: str) -> str:
+        """Download the result table of a reasoner job to a csv or jsonl file."""
+        client = TableStoreClient(self._host_addr, self._project_id)
+        return client.download(table_name, file_path)
@@ -10,7 +10,13 @@
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
 
-from typing import List, Dict
+import copy
+import hashlib
+import json
+import os
+import threading
+from types import SimpleNamespace
+from typing import List, Dict, Tuple
 
 from knext import rest
 from knext.client.base import Client
@@ -18,6 +24,10 @@ from knext.client.model.base import BaseSpgType, AlterOperationEnum, SpgTypeEnum
 from knext.client.model.relation import Relation
 
 
+_project_schemas: Dict[Tuple[str, str], rest.ProjectSchema] = {}
+_project_schemas_lock = threading.Lock()
+
+
 class SchemaClient(Client):
     """ """
 
@@ -28,6 +38,87 @@ class SchemaClient(Client):
 
         self._session = None
 
+    def query_project_schema(self, refresh: bool = False) -> rest.ProjectSchema:
+        """Query the project schema, which is cached in this process.
+
+        The schema queried from the server is versioned by the digest of its content, and
+        the version is exported to the processes started afterwards, like operator
+        workers, by the `KNEXT_SCHEMA_VERSION_<project_id>` environment variable. Cached
+        schemas are keyed by project id and version, and are only used once a version is
+        known, so a new process queries the server first and never gets a schema that
+        changed on the server since. If `KNEXT_SCHEMA_SNAPSHOT_DIR` is set, the schema is
+        also saved to a snapshot file of its version there, so that those processes load
+        it from the file instead of the server. Use `refresh` to reload the schema from
+        the server.
+        """
+        version = os.environ.get(self._version_env())
+        project_schema = None
+        if version and not refresh:
+            with _project_schemas_lock:
+                project_schema = _project_schemas.get((str(self._project_id), version))
+            if project_schema is None:
+                project_schema = self._load_snapshot(version)
+        if project_schema is None:
+            project_schema = self._rest_client.schema_query_project_schema_get(
+                self._project_id
+            )
+            schema = self.serialize(project_schema)
+            content = json.dumps(schema, sort_keys=True)
+            version = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            os.environ[self._version_env()] = version
+            self._save_snapshot(schema, version)
+        with _project_schemas_lock:
+            _project_schemas[(str(self._project_id), version)] = project_schema
+        return project_schema
+
+    def invalidate_project_schema(self):
+        """Drop the cached project schema, its version and its snapshot file."""
+        version = os.environ.pop(self._version_env(), None)
+        with _project_schemas_lock:
+            for key in list(_project_schemas):
+                if key[0] == str(self._project_id):
+                    _project_schemas.pop(key)
+        snapshot_path = self._snapshot_path(version)
+        if snapshot_path and os.path.exists(snapshot_path):
+            os.remove(snapshot_path)
+
+    def _version_env(self) -> str:
+        return f"KNEXT_SCHEMA_VERSION_{self._project_id}"
+
+    def _snapshot_path(self, version: str):
+        snapshot_dir = os.environ.get("KNEXT_SCHEMA_SNAPSHOT_DIR")
+        if not snapshot_dir or not version:
+            return None
+        return os.path.join(snapshot_dir, f"schema_{self._project_id}_{version}.json")
+
+    def _load_snapshot(self, version: str):
+        snapshot_path = self._snapshot_path(version)
+        if not snapshot_path or not os.path.exists(snapshot_path):
+            return None
+        with open(snapshot_path, "r", encoding="utf-8") as file:
+            snapshot = json.load(file)
+        content = json.dumps(snapshot["schema"], sort_keys=True)
+        if hashlib.sha256(content.encode("utf-8")).hexdigest() != version:
+            return None
+        return self._rest_client.api_client.deserialize(
+            SimpleNamespace(data=content), "ProjectSchema"
+        )
+
+    def _save_snapshot(self, schema: dict, version: str):
+        snapshot_path = self._snapshot_path(version)
+        if not snapshot_path:
+            return
+        snapshot = {
+            "project_id": str(self._project_id),
+            "version": version,
+            "schema": schema,
+        }
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(snapshot, file, ensure_ascii=False)
+        os.replace(tmp_path, snapshot_path)
+
     def query_spg_type(self, spg_type_name: str) -> BaseSpgType:
         """Query SPG type by name."""
         rest_model = self._rest_client.schema_query_spg_type_get(spg_type_name)
@@ -53,53 +144,99 @@ class SchemaClient(Client):
             name=predicate_name, object_type_name=object_name, rest_model=rest_model
         )
 
-    def create_session(self):
-        """Create session for altering schema."""
-        return self.SchemaSession(self._rest_client, self._project_id)
+    def create_session(self, refresh: bool = False):
+        """Create session for altering schema, use `refresh` to build it from the
+        schema on the server instead of the cached one."""
+        return self.SchemaSession(self._rest_client, self._project_id, refresh)
 
     class SchemaSession:
-        def __init__(self, client, project_id):
+        """Session for reading and altering the project schema.
+
+        SPG types are built from the cached project schema on first access, each session
+        works on its own copies, so altering them does not affect other sessions.
+        """
+
+        def __init__(self, client, project_id, refresh: bool = False):
             self._alter_spg_types: List[BaseSpgType] = []
             self._rest_client = client
             self._project_id = project_id
 
             self._spg_types = {}
             self.__spg_types = {}
-            self._init_spg_types()
+            self._init_spg_types(refresh)
 
-        def _init_spg_types(self):
-            """Query project schema and init SPG types in session."""
-            project_schema = self._rest_client.schema_query_project_schema_get(
-                self._project_id
-            )
-            for spg_type in project_schema.spg_types:
-                spg_type_name = spg_type.basic_info.name.name
-                type_class = BaseSpgType.by_type_enum(spg_type.spg_type_enum)
-                if spg_type.spg_type_enum == SpgTypeEnum.Concept:
-                    self._spg_types[spg_type_name] = type_class(
-                        name=spg_type_name,
-                        hypernym_predicate=spg_type.concept_layer_config.hypernym_predicate,
-                        rest_model=spg_type,
-                    )
-                else:
-                    self._spg_types[spg_type_name] = type_class(
-                        name=spg_type_name, rest_model=spg_type
-                    )
+        def _init_spg_types(self, refresh: bool = False):
+            """Query project schema and index SPG types in session."""
+            project_schema = SchemaClient(
+                project_id=self._project_id
+            ).query_project_schema(refresh)
+            self._rest_spg_types = {
+                spg_type.basic_info.name.name: spg_type
+                for spg_type in project_schema.spg_types
+            }
+            self._name_zh_index = None
+            self._object_type_index = None
+
+        def _build_spg_type(self, spg_type_name: str) -> BaseSpgType:
+            spg_type = copy.deepcopy(self._rest_spg_types[spg_type_name])
+            type_class = BaseSpgType.by_type_enum(spg_type.spg_type_enum)
+            if spg_type.spg_type_enum == SpgTypeEnum.Concept:
+                return type_class(
+                    name=spg_type_name,
+                    hypernym_predicate=spg_type.concept_layer_config.hypernym_predicate,
+                    rest_model=spg_type,
+                )
+            return type_class(name=spg_type_name, rest_model=spg_type)
+
+        @property
+        def spg_type_names(self) -> List[str]:
+            """Names of the SPG types in project schema, without building them."""
+            return list(self._rest_spg_types)
 
         @property
         def spg_types(self) -> Dict[str, BaseSpgType]:
+            for spg_type_name in self._rest_spg_types:
+                if spg_type_name not in self._spg_types:
+                    self._spg_types[spg_type_name] = self._build_spg_type(spg_type_name)
             return self._spg_types
 
         def get(self, spg_type_name) -> BaseSpgType:
             """Get SPG type by name from project schema."""
             spg_type = self._spg_types.get(spg_type_name)
+            if spg_type is None and spg_type_name in self._rest_spg_types:
+                spg_type = self._build_spg_type(spg_type_name)
+                self._spg_types[spg_type_name] = spg_type
             if spg_type is None:
                 spg_type = self.__spg_types.get(spg_type_name)
                 if spg_type is None:
                     raise ValueError(f"{spg_type_name} is not existed")
-                else:
-                    return self.__spg_types.get(spg_type_name)
-            return self._spg_types.get(spg_type_name)
+            return spg_type
+
+        def get_by_name_zh(self, name_zh: str) -> BaseSpgType:
+            """Get SPG type by chinese name from project schema."""
+            if self._name_zh_index is None:
+                self._name_zh_index = {
+                    spg_type.basic_info.name_zh: name
+                    for name, spg_type in self._rest_spg_types.items()
+                    if spg_type.basic_info.name_zh
+                }
+            if name_zh not in self._name_zh_index:
+                raise ValueError(f"{name_zh} is not existed")
+            return self.get(self._name_zh_index[name_zh])
+
+        def find_by_object_type(self, object_type_name: str) -> List[Tuple[str, str]]:
+            """Get the (spg_type_name, property_name) of all properties and relations
+            whose object type is `object_type_name`."""
+            if self._object_type_index is None:
+                self._object_type_index = {}
+                for name, spg_type in self._rest_spg_types.items():
+                    for prop in (spg_type.properties or []) + (
+                        spg_type.relations or []
+                    ):
+                        self._object_type_index.setdefault(
+                            prop.object_type_ref.basic_info.name.name, []
+                        ).append((name, prop.basic_info.name.name))
+            return list(self._object_type_index.get(object_type_name, []))
 
         def create_type(self, spg_type: BaseSpgType):
             """Add an SPG type in session with `CREATE` operation."""
@@ -150,3 +287,4 @@ class SchemaClient(Client):
                 project_id=self._project_id, schema_draft=rest.SchemaDraft(schema_draft)
             )
             self._rest_client.schema_alter_schema_post(schema_alter_request=request)
+            SchemaClient(project_id=self._project_id).invalidate_project_schema()
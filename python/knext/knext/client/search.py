@@ -10,12 +10,16 @@
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
 
+import os
 import pprint
+import threading
 from typing import Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
 
 from elasticsearch import Elasticsearch
 
 from knext import rest
+from knext import lib
 from knext.common.schema_helper import PropertyName
 from knext.operator.spg_record import SPGRecord
 
@@ -61,19 +65,71 @@ class IdxRecord:
         return record
 
 
+_es_clients: Dict[str, Elasticsearch] = {}
+_index_names: Dict[str, str] = {}
+_lock = threading.Lock()
+
+
+def _es_endpoint(url: str) -> str:
+    """Converts a search engine url like `elasticsearch://127.0.0.1:9200?scheme=http`
+    to the endpoint of Elasticsearch client."""
+    parsed = urlparse(url)
+    if parsed.scheme in ("http", "https"):
+        return url
+    scheme = parse_qs(parsed.query).get("scheme", ["http"])[0]
+    return f"{scheme}://{parsed.netloc}"
+
+
+def _get_es_client(url: str) -> Elasticsearch:
+    """Returns the Elasticsearch client shared in this process by all SearchClients of `url`."""
+    endpoint = _es_endpoint(url)
+    with _lock:
+        if endpoint not in _es_clients:
+            _es_clients[endpoint] = Elasticsearch(endpoint)
+        return _es_clients[endpoint]
+
+
+def _get_index_name(spg_type_name: str) -> str:
+    """Returns the index name of `spg_type_name`, only queried from server once per process."""
+    with _lock:
+        index_name = _index_names.get(spg_type_name)
+    if index_name is None:
+        response = rest.BuilderApi().search_engine_index_get(spg_type=spg_type_name)
+        index_name = response.index_name
+        with _lock:
+            _index_names[spg_type_name] = index_name
+    return index_name
+
+
 class SearchClient:
     """Client connected to search engine, which can be imported in operator to recall entities.
     You can initialize this client in `BaseOp.__init__()` and invoke `search` method in `BaseOp.eval()`.
 
+    The Elasticsearch connection of the search engine url, read from `KNEXT_SEARCH_ENGINE_URL`
+    if not given, is shared by all SearchClients in the process. Operators linking many
+    records should prefer the `*_batch` methods, which send one `msearch` request per batch.
+    For a `local:` url, a `LocalSearchClient` over an in-process index is returned instead.
     """
 
-    def __init__(self, spg_type_name: str):
-        _client = rest.BuilderApi()
-        response = _client.search_engine_index_get(spg_type=spg_type_name)
+    """The maximum number of searches sent in one msearch request."""
+    msearch_size: int = 100
+
+    def __new__(cls, spg_type_name: str, search_engine_url: str = None, **kwargs):
+        url = search_engine_url or os.environ.get("KNEXT_SEARCH_ENGINE_URL") or ""
+        if cls is SearchClient and urlparse(url).scheme == "local":
+            from knext.client.local_search import LocalSearchClient
 
-        self.index_name = response.index_name
+            cls = LocalSearchClient
+        return super().__new__(cls)
+
+    def __init__(self, spg_type_name: str, search_engine_url: str = None):
+        self.index_name = _get_index_name(spg_type_name)
         self.spg_type_name = spg_type_name
-        self.client = Elasticsearch("http://127.0.0.1:9200")
+        self.client = _get_es_client(
+            search_engine_url
+            or os.environ.get("KNEXT_SEARCH_ENGINE_URL")
+            or lib.LOCAL_SEARCH_ENGINE_URL
+        )
 
     def search(self, query, sort=None, filter=None, start: int = 0, size: int = 10):
         """Perform a search operation on the specified index using the given query.
@@ -97,6 +153,40 @@ class SearchClient:
             from_=start,
             size=size,
         )
+        return self._to_idx_records(data)
+
+    def search_batch(
+        self, queries: List[dict], size: int = 10
+    ) -> List[Optional[List[IdxRecord]]]:
+        """Perform the search operations of `queries` with msearch requests. A failed
+        search raises RuntimeError, instead of being taken as a query without results.
+
+        Args:
+            queries: The queries to be executed, a None query is skipped.
+            size: Optional. The maximum number of search results of each query. Default is 10.
+
+        Returns:
+            A list with the search results of each query, as returned by `search`.
+
+        """
+        results = [None] * len(queries)
+        indices = [idx for idx, query in enumerate(queries) if query is not None]
+        for start in range(0, len(indices), self.msearch_size):
+            chunk = indices[start : start + self.msearch_size]
+            searches = []
+            for idx in chunk:
+                searches.append({"index": self.index_name})
+                searches.append({"query": queries[idx], "size": size})
+            data = self.client.msearch(searches=searches)
+            for idx, response in zip(chunk, data.get("responses", [])):
+                if "error" in response:
+                    raise RuntimeError(
+                        f"Search of index [{self.index_name}] failed: {response['error']}"
+                    )
+                results[idx] = self._to_idx_records(response)
+        return results
+
+    def _to_idx_records(self, data) -> Optional[List[IdxRecord]]:
         if "hits" in data and "hits" in data.get("hits"):
             hits = data.get("hits").get("hits")
             records = []
@@ -160,3 +250,37 @@ class SearchClient:
             for recall_result in recall_results:
                 records.append(recall_result.to_spg_record())
         return records
+
+    def fuzzy_search_batch(
+        self, records: List[SPGRecord], property_name: PropertyName, size: int = 10
+    ) -> List[List[SPGRecord]]:
+        """Batch variant of `fuzzy_search`, returns the recalled records of each record."""
+        queries = [
+            {"match": {property_name: record.get_property(property_name)}}
+            if record.get_property(property_name)
+            else None
+            for record in records
+        ]
+        return [
+            [result.to_spg_record() for result in recall_results or []]
+            for recall_results in self.search_batch(queries, size=size)
+        ]
+
+    def exact_search_batch(
+        self, records: List[SPGRecord], property_name: PropertyName
+    ) -> List[Optional[SPGRecord]]:
+        """Batch variant of `exact_search`, returns the matched record or None of each record."""
+        values = [record.get_property(property_name) for record in records]
+        queries = [
+            {"match": {property_name: value}} if value else None for value in values
+        ]
+        outputs = []
+        for value, recall_results in zip(values, self.search_batch(queries, size=1)):
+            if (
+                recall_results
+                and recall_results[0].properties.get(property_name) == value
+            ):
+                outputs.append(recall_results[0].to_spg_record())
+            else:
+                outputs.append(None)
+        return outputs
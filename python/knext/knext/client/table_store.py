@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+import csv
+import io
+import json
+import os
+from typing import Dict, Iterator, List, Optional
+
+from knext import rest
+from knext.client.base import Client
+
+
+class TableStoreClient(Client):
+    """SPG Table Store Client.
+
+    Result tables are streamed from the server in chunks, without loading the whole
+    table into memory.
+    """
+
+    _rest_client = rest.TableStoreApi()
+
+    def __init__(self, host_addr: str = None, project_id: int = None):
+        super().__init__(host_addr, project_id)
+
+    def stream(self, table_name: str, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        """Yields the content of a table file in chunks of at most `chunk_size` bytes."""
+        response = self._open(table_name)
+        try:
+            yield from response.stream(chunk_size)
+        finally:
+            response.release_conn()
+
+    def iter_rows(self, table_name: str) -> Iterator[List[str]]:
+        """Yields the rows of a csv table file, starting with the header row."""
+        response = self._open(table_name)
+        try:
+            yield from csv.reader(io.TextIOWrapper(response, "utf-8", newline=""))
+        finally:
+            response.release_conn()
+
+    def iter_batches(
+        self, table_name: str, batch_size: int = 10000
+    ) -> Iterator[Dict[str, List[Optional[str]]]]:
+        """Yields the rows of a csv table file in column batches of at most
+        `batch_size` rows, as dicts of column name to column values. Rows shorter
+        than the header are padded with None, a table without header yields nothing.
+        """
+        rows = self.iter_rows(table_name)
+        columns = next(rows, [])
+        if not columns:
+            return
+        batch = [[] for _ in columns]
+        size = 0
+        for row in rows:
+            for idx, values in enumerate(batch):
+                values.append(row[idx] if idx < len(row) else None)
+            size += 1
+            if size >= batch_size:
+                yield dict(zip(columns, batch))
+                batch = [[] for _ in columns]
+                size = 0
+        if size:
+            yield dict(zip(columns, batch))
+
+    def download(self, table_name: str, file_path: str) -> str:
+        """Downloads a table file to `file_path`, and returns the path.
+        If `file_path` ends with `.jsonl`, each row is written as a json object of
+        column name to value, otherwise the table file is written as is."""
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        if file_path.endswith(".jsonl"):
+            rows = self.iter_rows(table_name)
+            columns = next(rows, [])
+            with open(file_path, "w", encoding="utf-8") as file:
+                for row in rows:
+                    record = dict(zip(columns, row))
+                    file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            with open(file_path, "wb") as file:
+                for chunk in self.stream(table_name):
+                    file.write(chunk)
+        return file_path
+
+    def _open(self, table_name: str):
+        response = self._rest_client.table_store_download_get(
+            file_name=table_name, _preload_content=False
+        )
+        # Keep the response readable at EOF, which io.TextIOWrapper checks.
+        response.auto_close = False
+        return response
@@ -10,74 +10,97 @@
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
 
+import importlib
+from typing import Dict
+
 import click
 
-from knext.command.sub_command.builder import execute_job
-from knext.command.sub_command.config import edit_config
-from knext.command.sub_command.config import list_config
-from knext.command.sub_command.project import create_project
-from knext.command.sub_command.project import list_project
-from knext.command.sub_command.reasoner import execute_reasoner_job
-from knext.command.sub_command.schema import commit_schema
-from knext.command.sub_command.schema import list_schema
-from knext.command.sub_command.schema import reg_concept_rule
 from knext.command.exception import _ApiExceptionHandler
 from knext import __version__
 
 
+class _LazyGroup(click.Group):
+    """Group whose commands are imported on first use from `lazy_commands`, a dict of
+    command name to `module:function`, so that starting the cli stays cheap."""
+
+    def __init__(self, *args, lazy_commands: Dict[str, str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, func_name = self.lazy_commands[cmd_name].split(":")
+            func = getattr(importlib.import_module(module_name), func_name)
+            self.command(cmd_name)(func)
+        return super().get_command(ctx, cmd_name)
+
+
 @click.group(cls=_ApiExceptionHandler)
 @click.version_option(__version__)
 def _main() -> None:
     pass
 
 
-@_main.group()
+@_main.group(
+    cls=_LazyGroup,
+    lazy_commands={
+        "list": "knext.command.sub_command.config:list_config",
+        "set": "knext.command.sub_command.config:edit_config",
+    },
+)
 def config() -> None:
     """Knext config."""
     pass
 
 
-config.command("list")(list_config)
-config.command("set")(edit_config)
-
-
-@_main.group()
+@_main.group(
+    cls=_LazyGroup,
+    lazy_commands={"execute": "knext.command.sub_command.builder:execute_job"},
+)
 def builder() -> None:
     """Builder client."""
     pass
 
 
-builder.command("execute")(execute_job)
-
-
-@_main.group()
+@_main.group(
+    cls=_LazyGroup,
+    lazy_commands={
+        "create": "knext.command.sub_command.project:create_project",
+        "list": "knext.command.sub_command.project:list_project",
+    },
+)
 def project() -> None:
     """Project client."""
     pass
 
 
-project.command("create")(create_project)
-project.command("list")(list_project)
-
-
-@_main.group()
+@_main.group(
+    cls=_LazyGroup,
+    lazy_commands={
+        "commit": "knext.command.sub_command.schema:commit_schema",
+        "list": "knext.command.sub_command.schema:list_schema",
+        "reg_concept_rule": "knext.command.sub_command.schema:reg_concept_rule",
+        "validate": "knext.command.sub_command.schema:validate_schema",
+    },
+)
 def schema() -> None:
     """Schema client."""
     pass
 
 
-schema.command("commit")(commit_schema)
-schema.command("list")(list_schema)
-schema.command("reg_concept_rule")(reg_concept_rule)
-
-
-@_main.group()
+@_main.group(
+    cls=_LazyGroup,
+    lazy_commands={
+        "execute": "knext.command.sub_command.reasoner:execute_reasoner_job"
+    },
+)
 def reasoner() -> None:
     """Reasoner client."""
     pass
 
 
-reasoner.command("execute")(execute_reasoner_job)
-
 if __name__ == "__main__":
     _main()
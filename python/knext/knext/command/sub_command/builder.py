@@ -12,13 +12,12 @@
 
 import os
 import sys
-from pathlib import Path
 
 import click
 from tabulate import tabulate
 
-from knext import rest
 from knext.client.builder import BuilderClient
+from knext.client.table_store import TableStoreClient
 from knext.client.model.builder_job import BuilderJob
 
 
@@ -40,7 +39,17 @@ def submit_job(job_names):
 
 
 @click.argument("job_names", required=True)
-def execute_job(job_names):
+@click.option(
+    "--local",
+    is_flag=True,
+    help="Execute jobs in-process with Python instead of the builder jar.",
+)
+@click.option(
+    "--sink",
+    default="memory",
+    help="Sink of local execution: memory, jsonl:<path> or sqlite:<path>.",
+)
+def execute_job(job_names, local, sink):
     job_list = [name.strip() for name in job_names.split(",") if name]
 
     for job in job_list:
@@ -51,7 +60,14 @@ def execute_job(job_names):
             for param in builder_job.__annotations__
             if hasattr(builder_job, param) and not param.startswith("_")
         }
+        if local:
+            params.update(local=True, sink=sink)
         builder_chain.invoke(builder_chain, **params)
+        if local:
+            click.secho(
+                f"BuilderJob [{job}] has been successfully executed locally.",
+                fg="bright_green",
+            )
 
 
 @click.option("--id", help="Unique id of submitted builder job.")
@@ -89,19 +105,13 @@ def get_job(id):
             fg="bright_green",
         )
         if click.confirm(confirm):
-            client = rest.TableStoreApi()
             error_table_file = res[0].result.error_table_file
-            content = client.table_store_download_get(file_name=error_table_file)
-
             file_path = os.path.join(
                 os.environ["KNEXT_ROOT_PATH"],
                 os.environ["KNEXT_BUILDER_RECORD_DIR"],
                 error_table_file.split("/")[-1],
             )
-            if not Path(file_path).parent.exists():
-                os.mkdir(Path(file_path).parent.resolve())
-            with open(file_path, "w") as file:
-                file.write(content)
+            TableStoreClient().download(error_table_file, file_path)
             click.secho(
                 f"Download successful. The file path is [{file_path}].",
                 fg="bright_green",
@@ -12,18 +12,19 @@
 
 import os
 import sys
-from pathlib import Path
 
 import click
 from tabulate import tabulate
 
-from knext import rest
 from knext.client.reasoner import ReasonerClient
 
 
 @click.option("--file", help="Path of DSL file.")
 @click.option("--dsl", help="DSL string enclosed in double quotes.")
-def run_dsl(file, dsl):
+@click.option(
+    "--page-size", default=1000, type=int, help="Number of rows shown in each table."
+)
+def run_dsl(file, dsl, page_size):
     """
     Query dsl by providing a string or file.
     """
@@ -37,9 +38,9 @@ def run_dsl(file, dsl):
     else:
         click.secho("ERROR: Please choose either --file or --dsl.", fg="bright_red")
 
-    result = client.run_dsl(dsl_content)
-    table = tabulate(result.cells, result.columns, tablefmt="github")
-    click.echo(table)
+    for page in client.run_dsl_pages(dsl_content, page_size):
+        table = tabulate(page.cells, page.columns, tablefmt="github")
+        click.echo(table)
 
 
 @click.option("--file", help="Path of DSL file.")
@@ -102,19 +103,13 @@ def query_reasoner_job(id):
             fg="bright_green",
         )
         if click.confirm(confirm):
-            client = rest.TableStoreApi()
             table_name = res[0].result.table_name
-            content = client.table_store_download_get(file_name=table_name)
-
             file_path = os.path.join(
                 os.environ["KNEXT_ROOT_PATH"],
                 os.environ["KNEXT_REASONER_RESULT_DIR"],
                 table_name.split("/")[-1],
             )
-            if not Path(file_path).parent.exists():
-                os.mkdir(Path(file_path).parent.resolve())
-            with open(file_path, "w") as file:
-                file.write(content)
+            client.download_result(table_name, file_path)
             click.secho(
                 f"Download successful. The file path is [{file_path}].",
                 fg="bright_green",
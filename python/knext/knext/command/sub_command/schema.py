@@ -12,6 +12,7 @@
 
 import os
 import string
+import sys
 from pathlib import Path
 
 import click
@@ -83,10 +84,65 @@ def commit_schema():
         )
 
 
+@click.option("--file", help="Path of schema file, defaults to the schema of project.")
+def validate_schema(file):
+    """
+    Validate local schema offline and generate schema helper, without the server.
+    """
+    schema_file = file or os.path.join(
+        os.environ["KNEXT_ROOT_PATH"],
+        os.environ["KNEXT_SCHEMA_DIR"],
+        os.environ["KNEXT_SCHEMA_FILE"],
+    )
+    if not Path(schema_file).exists():
+        click.secho(f"ERROR: File {schema_file} not exists.", fg="bright_red")
+        sys.exit(1)
+
+    helper_file = os.path.join(
+        os.environ["KNEXT_ROOT_PATH"],
+        os.environ["KNEXT_SCHEMA_DIR"],
+        TEMPLATE_TO_RENDER,
+    )
+    tplfile = string.Template(helper_file).substitute(
+        project=os.environ["KNEXT_PROJECT_DIR"]
+    )
+    py_file = Path(tplfile).with_suffix("")
+    digest = SPGSchemaMarkLang.script_digest(schema_file)
+    if py_file.exists() and f"# Schema digest: {digest}" in py_file.read_text("utf8"):
+        click.secho(
+            "Schema is unchanged, SchemaHelper is up to date.", fg="bright_yellow"
+        )
+        return
+
+    try:
+        ml = SPGSchemaMarkLang(schema_file, offline=True)
+    except AssertionError as e:
+        click.secho(f"ERROR: {e}", fg="bright_red")
+        sys.exit(1)
+
+    copytree(
+        Path("schema_helper"), Path(helper_file).parent, os.environ["KNEXT_PROJECT_DIR"]
+    )
+    ml.export_schema_python(tplfile)
+    click.secho("Schema is valid.", fg="bright_green")
+    click.secho(
+        f"SchemaHelper is created in {os.environ['KNEXT_SCHEMA_DIR']}/{os.environ['KNEXT_PROJECT_DIR']}_schema_helper.py.",
+        fg="bright_green",
+    )
+
+
 @click.option("--file", help="Path of DSL file.")
-def reg_concept_rule(file):
+@click.option(
+    "--parallelism", default=8, help="Number of rules submitted concurrently."
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Submit all rules, including the ones unchanged since the last registration.",
+)
+def reg_concept_rule(file, parallelism, force):
     """
     Register a concept rule according to DSL file.
     """
-    SPGConceptRuleMarkLang(file)
+    SPGConceptRuleMarkLang(file, parallelism=parallelism, force=force)
     click.secho(f"Concept rule is successfully registered", fg="bright_green")
@@ -9,19 +9,350 @@
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
 
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
 from cachetools import TTLCache
 
+DEFAULT_MAXSIZE = 500
+DEFAULT_TTL = 60
+
+"""Value stored for keys known to have no linked entity."""
+NEGATIVE = "__knext_negative__"
+
+
+class CacheStats:
+    """Hit/miss/eviction counters of a LinkCache."""
+
+    __slots__ = ("hits", "negative_hits", "disk_hits", "misses", "evictions")
+
+    def __init__(self):
+        self.hits = 0
+        self.negative_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.negative_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.lookups
+        return (self.hits + self.negative_hits) / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+    def __repr__(self):
+        return ", ".join(f"{k}={v}" for k, v in self.to_dict().items())
+
+
+class _CountingTTLCache(TTLCache):
+    """TTLCache that counts size-based evictions into CacheStats."""
+
+    def __init__(self, maxsize: int, ttl: float, stats: CacheStats):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._stats = stats
+
+    def popitem(self):
+        item = super().popitem()
+        self._stats.evictions += 1
+        return item
+
+
+class _SqliteTier:
+    """On-disk cache tier, shared by all worker processes on the same host
+    that open the same sqlite file."""
+
+    def __init__(self, path: str, ttl: float):
+        self._path = path
+        self._ttl = ttl
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS link_cache ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT, expires_at REAL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(os.path.abspath(self._path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self._path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        row = (
+            self._conn()
+            .execute(
+                "SELECT value, expires_at FROM link_cache WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            )
+            .fetchone()
+        )
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def put(self, namespace: str, key: str, value: str, ttl: float = None):
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO link_cache VALUES (?, ?, ?, ?)",
+            (namespace, key, value, time.time() + (ttl or self._ttl)),
+        )
+        conn.commit()
+
 
 class LinkCache:
-    def __init__(self, maxsize: int = 500, ttl: int = 60):
-        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+    """Cache of linked entity ids, used by LinkOp and FuseOp.
+
+    Lookups go to an in-memory TTL cache first and then, if `disk_path` is given, to a
+    sqlite file shared between worker processes. Keys can also be cached as known misses
+    through `put_miss`, so that values without a linked entity are not searched again
+    within `negative_ttl` seconds.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: int = DEFAULT_TTL,
+        namespace: str = "",
+        negative_ttl: int = None,
+        disk_path: str = None,
+    ):
+        self._namespace = namespace
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._stats = CacheStats()
+        self._cache = _CountingTTLCache(maxsize=maxsize, ttl=ttl, stats=self._stats)
+        self._negative_cache = (
+            _CountingTTLCache(maxsize=maxsize, ttl=negative_ttl, stats=self._stats)
+            if negative_ttl
+            else None
+        )
+        self._disk = _SqliteTier(disk_path, ttl) if disk_path else None
+        self._lock = threading.RLock()
 
     @property
     def cache(self):
         return self._cache
 
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
     def put(self, key, value):
-        self.cache[key] = value
+        with self._lock:
+            self._cache[key] = value
+            if self._negative_cache is not None:
+                self._negative_cache.pop(key, None)
+        if self._disk is not None:
+            self._disk.put(self._namespace, key, value)
+
+    def put_miss(self, key):
+        """Records that `key` has no linked entity, a no-op unless `negative_ttl` is set."""
+        if self._negative_cache is None:
+            return
+        with self._lock:
+            self._negative_cache[key] = NEGATIVE
+        if self._disk is not None:
+            self._disk.put(self._namespace, key, NEGATIVE, self._negative_ttl)
+
+    def lookup(self, key):
+        """Returns the cached value of `key`, `NEGATIVE` if the key is a known miss,
+        or None if the key is not cached."""
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None and self._negative_cache is not None:
+                value = self._negative_cache.get(key)
+            if value is not None:
+                self._count_lookup(value)
+                return value
+        if self._disk is not None:
+            value = self._disk.get(self._namespace, key)
+            if value == NEGATIVE and self._negative_cache is None:
+                value = None
+        with self._lock:
+            if value is not None:
+                self._stats.disk_hits += 1
+                if value != NEGATIVE:
+                    self._cache[key] = value
+                elif self._negative_cache is not None:
+                    self._negative_cache[key] = value
+            self._count_lookup(value)
+        return value
+
+    def _count_lookup(self, value):
+        """Counts a lookup returning `value`, called under the lock."""
+        if value is None:
+            self._stats.misses += 1
+        elif value == NEGATIVE:
+            self._stats.negative_hits += 1
+        else:
+            self._stats.hits += 1
 
     def get(self, key):
-        return self.cache.get(key)
+        value = self.lookup(key)
+        return None if value == NEGATIVE else value
+
+
+_caches: Dict[str, LinkCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_link_cache(
+    namespace: str,
+    maxsize: int = DEFAULT_MAXSIZE,
+    ttl: int = DEFAULT_TTL,
+    negative_ttl: int = None,
+    disk_path: str = None,
+) -> LinkCache:
+    """Returns the process-wide LinkCache of `namespace`, creating it on first use.
+    The sizing arguments only take effect for the call that creates the cache."""
+    with _caches_lock:
+        if namespace not in _caches:
+            _caches[namespace] = LinkCache(
+                maxsize=maxsize,
+                ttl=ttl,
+                namespace=namespace,
+                negative_ttl=negative_ttl,
+                disk_path=disk_path,
+            )
+        return _caches[namespace]
+
+
+def link_cache_from_params(namespace: str, params: Dict[str, str] = None) -> LinkCache:
+    """Returns the LinkCache of `namespace` sized by operator params.
+
+    Supported params are `cache_size`, `cache_ttl`, `cache_negative_ttl` (seconds, unset
+    disables negative caching) and `cache_path` (sqlite file of the on-disk tier, defaults
+    to the `KNEXT_LINK_CACHE_PATH` environment variable).
+    """
+    params = params or {}
+    negative_ttl = params.get("cache_negative_ttl")
+    return get_link_cache(
+        namespace,
+        maxsize=int(params.get("cache_size", DEFAULT_MAXSIZE)),
+        ttl=float(params.get("cache_ttl", DEFAULT_TTL)),
+        negative_ttl=float(negative_ttl) if negative_ttl else None,
+        disk_path=params.get("cache_path") or os.environ.get("KNEXT_LINK_CACHE_PATH"),
+    )
+
+
+class PromptCache:
+    """Persistent cache of raw LLM responses, keyed by the hash of the rendered prompt
+    and the model config.
+
+    At most `maxsize` responses are kept, the least recently used ones are evicted first.
+    A `read_only` cache never writes to its file, so that a replay of a job sees exactly
+    the responses recorded by an earlier run.
+    """
+
+    def __init__(self, path: str, maxsize: int = 100000, read_only: bool = False):
+        self._maxsize = maxsize
+        self._read_only = read_only
+        self._lock = threading.Lock()
+        if read_only:
+            self._conn = sqlite3.connect(
+                f"file:{path}?mode=ro", uri=True, check_same_thread=False
+            )
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS prompt_cache ("
+                "key TEXT PRIMARY KEY, response TEXT, last_used REAL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS prompt_cache_last_used "
+                "ON prompt_cache (last_used)"
+            )
+            self._conn.commit()
+        self._size = self._count()
+        self._stats = CacheStats()
+
+    @staticmethod
+    def key(prompt: Any, model_config: Dict[str, Any]) -> str:
+        content = json.dumps(
+            [prompt, model_config], sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def get(self, key: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM prompt_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+            if not self._read_only:
+                self._conn.execute(
+                    "UPDATE prompt_cache SET last_used = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+                self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, key: str, response: Any):
+        if self._read_only:
+            return
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM prompt_cache WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO prompt_cache VALUES (?, ?, ?)",
+                (key, json.dumps(response, ensure_ascii=False), time.time()),
+            )
+            if exists is None:
+                self._size += 1
+            if self._size > self._maxsize:
+                self._evict(max(self._size - self._maxsize, self._maxsize // 10))
+            self._conn.commit()
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM prompt_cache").fetchone()[0]
+
+    def _evict(self, count: int):
+        cursor = self._conn.execute(
+            "DELETE FROM prompt_cache WHERE key IN "
+            "(SELECT key FROM prompt_cache ORDER BY last_used LIMIT ?)",
+            (count,),
+        )
+        self._stats.evictions += cursor.rowcount
+        self._size = self._count()
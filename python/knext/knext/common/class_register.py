@@ -10,46 +10,301 @@
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
 
+import ast
+import hashlib
+import importlib
+import inspect
+import json
 import os
 import sys
+import threading
 from pathlib import Path
-from typing import Type
-import inspect
+from typing import Any, Dict, List, Tuple, Type
+
+_lazy_lock = threading.RLock()
+
+_MANIFEST_FILE = "knext_registry.json"
+_MANIFEST_VERSION = 1
+
+
+def _register_module(module_name: str, local_path: str, class_type: Type):
+    """Import a module and register the subclasses of `class_type` defined in it."""
+    module = importlib.import_module(module_name)
+    classes = inspect.getmembers(module, inspect.isclass)
+    for class_name, class_obj in classes:
+        if issubclass(class_obj, class_type) and inspect.getmodule(class_obj) == module:
+
+            class_type.register(
+                name=class_name,
+                local_path=local_path,
+                module_path=module_name,
+            )(class_obj)
+
+
+def _modules(root: str) -> List[Tuple[str, str]]:
+    """Returns the (local path, module name) of each python file under `root`."""
+    modules = []
+    for path, dirs, files in os.walk(root):
+        relative_path = os.path.relpath(path, root)
+        module_prefix = relative_path.replace(".", "").replace("/", ".")
+        module_prefix = module_prefix + "." if module_prefix else ""
+        for file_name in files:
+            if file_name.endswith(".py"):
+                module_name = module_prefix + os.path.splitext(file_name)[0]
+                modules.append((os.path.join(path, file_name), module_name))
+    return modules
+
+
+def _base_name(node: ast.expr):
+    if isinstance(node, ast.Subscript):
+        node = node.value
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _scan_classes(source: str, local_path: str) -> List[Dict[str, Any]]:
+    """
+    Statically scan the top-level classes of a python file, without importing it.
+    Each class is described by its `name`, the names of its `bases`, and its `bind_to`
+    if assigned in the class body. `static` is False if `bind_to` is not a literal.
+    The module and name of each base imported from the knext package are kept in
+    `imports`.
+    """
+    tree = ast.parse(source, local_path)
+    imports = {}
+    for node in tree.body:
+        module = node.module if isinstance(node, ast.ImportFrom) else None
+        if module and module.startswith("knext."):
+            for alias in node.names:
+                imports[alias.asname or alias.name] = [node.module, alias.name]
+    classes = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = [_base_name(base) for base in node.bases]
+        cls = {
+            "name": node.name,
+            "bases": bases,
+            "imports": {base: imports[base] for base in bases if base in imports},
+            "static": True,
+        }
+        for stmt in node.body:
+            if isinstance(stmt, ast.Assign):
+                targets, value = stmt.targets, stmt.value
+            elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+                targets, value = [stmt.target], stmt.value
+            else:
+                continue
+            if any(isinstance(t, ast.Name) and t.id == "bind_to" for t in targets):
+                try:
+                    cls["bind_to"] = ast.literal_eval(value)
+                except ValueError:
+                    cls["static"] = False
+        classes.append(cls)
+    return classes
+
+
+def _literal(value):
+    """Converts the json lists of a literal back to tuples, so it can be a dict key."""
+    if isinstance(value, list):
+        return tuple(_literal(item) for item in value)
+    return value
 
 
-def _register(root, path, files, class_type):
-    relative_path = os.path.relpath(path, root)
-    module_prefix = relative_path.replace(".", "").replace("/", ".")
-    module_prefix = module_prefix + "." if module_prefix else ""
-    for file_name in files:
-        if file_name.endswith(".py"):
-            module_name = module_prefix + os.path.splitext(file_name)[0]
-            import importlib
+def _load_manifest(root: str) -> Dict[str, Any]:
+    manifest_path = os.path.join(root, "__pycache__", _MANIFEST_FILE)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            manifest = {}
+    if manifest.get("version") != _MANIFEST_VERSION:
+        manifest = {"version": _MANIFEST_VERSION, "files": {}}
+    return manifest
 
-            module = importlib.import_module(module_name)
-            classes = inspect.getmembers(module, inspect.isclass)
-            for class_name, class_obj in classes:
-                if (
-                    issubclass(class_obj, class_type)
-                    and inspect.getmodule(class_obj) == module
-                ):
 
-                    class_type.register(
-                        name=class_name,
-                        local_path=os.path.join(path, file_name),
-                        module_path=module_name,
-                    )(class_obj)
+def _save_manifest(root: str, manifest: Dict[str, Any]):
+    manifest_path = os.path.join(root, "__pycache__", _MANIFEST_FILE)
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, ensure_ascii=False)
+        os.replace(tmp_path, manifest_path)
+    except OSError:
+        # The manifest is only a cache, read-only packages are scanned each time.
+        pass
+
+
+def _scan_package(
+    root: str, modules: List[Tuple[str, str]], manifest: Dict[str, Any]
+) -> bool:
+    """
+    Scan the python files under `root` by `_scan_classes` into `manifest`, which is
+    kept in the file `__pycache__/knext_registry.json` of `root`.
+    A file is only scanned again if its mtime or size changed and its content hash
+    changed too. Returns whether `manifest` changed.
+    """
+    entries, changed = {}, False
+    for local_path, module_name in modules:
+        key = os.path.relpath(local_path, root)
+        stat = os.stat(local_path)
+        entry = manifest["files"].get(key)
+        if not (
+            entry
+            and entry["mtime"] == stat.st_mtime
+            and entry["size"] == stat.st_size
+            and entry["module"] == module_name
+        ):
+            with open(local_path, "rb") as file:
+                content = file.read()
+            digest = hashlib.sha256(content).hexdigest()
+            if not entry or entry["sha256"] != digest or entry["module"] != module_name:
+                entry = {
+                    "module": module_name,
+                    "sha256": digest,
+                    "classes": _scan_classes(content.decode("utf-8"), local_path),
+                }
+            entry.update(mtime=stat.st_mtime, size=stat.st_size)
+            changed = True
+        entries[key] = entry
+    changed = changed or set(entries) != set(manifest["files"])
+    manifest["files"] = entries
+    return changed
+
+
+def _loaded_subclasses(class_type: Type) -> Dict[str, Type]:
+    subclasses = {class_type.__name__: class_type}
+    pending = [class_type]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            if subclass.__name__ not in subclasses:
+                subclasses[subclass.__name__] = subclass
+                pending.append(subclass)
+    return subclasses
+
+
+def _register_lazily(
+    modules: List[Tuple[str, str]],
+    scanned: Dict[str, List[Dict[str, Any]]],
+    class_type: Type,
+) -> None:
+    """
+    Register the subclasses of `class_type` found by `_scan_classes`, without importing
+    their modules, which are imported by `load_registered` on first use. The `bind_to`
+    of each subclass is also bound, as `class_type.register` does. Modules whose
+    subclasses can not be resolved statically are imported at once, on each start,
+    since a runtime `bind_to` may depend on other modules, such as the schema helper.
+    """
+    loaded = _loaded_subclasses(class_type)
+    declared = {cls["name"]: cls for classes in scanned.values() for cls in classes}
+    for cls in declared.values():
+        for base, (module_name, name) in cls["imports"].items():
+            if base not in loaded and base not in declared:
+                base_obj = getattr(importlib.import_module(module_name), name, None)
+                if inspect.isclass(base_obj) and issubclass(base_obj, class_type):
+                    loaded[base] = base_obj
+    known = set(loaded)
+    changed = True
+    while changed:
+        changed = False
+        for name, cls in declared.items():
+            if name not in known and any(base in known for base in cls["bases"]):
+                known.add(name)
+                changed = True
+
+    def resolve(cls):
+        """Returns (resolved, bind_to, class holding bind_schemas)."""
+        bind_to, current = None, cls
+        for _ in range(len(declared) + 1):
+            if not current["static"]:
+                return False, None, None
+            if bind_to is None:
+                bind_to = _literal(current.get("bind_to"))
+            first_base = current["bases"][0] if current["bases"] else None
+            if first_base in loaded:
+                holder = loaded[first_base]
+                if bind_to is None:
+                    bind_to = getattr(holder, "bind_to", None)
+                return True, bind_to, holder
+            if first_base not in declared:
+                return False, None, None
+            current = declared[first_base]
+        return False, None, None
+
+    for local_path, module_name in modules:
+        candidates = [
+            cls
+            for cls in scanned[local_path]
+            if cls["name"] in known and cls["name"] not in loaded
+        ]
+        resolved = [resolve(cls) for cls in candidates]
+        if not all(
+            ok and (bind_to is None or hasattr(holder, "bind_schemas"))
+            for ok, bind_to, holder in resolved
+        ):
+            _register_module(module_name, local_path, class_type)
+            continue
+        for cls, (_, bind_to, holder) in zip(candidates, resolved):
+            name = cls["name"]
+            if name in class_type._registry or name in class_type._lazy_registry:
+                other_path = class_type._lazy_registry.get(name, (None,))[0]
+                if other_path is None:
+                    other_path = class_type._registry[name]._local_path
+                raise ValueError(
+                    f"{class_type.__name__} [{name}] conflict in {local_path} "
+                    f"and {other_path}."
+                )
+            class_type._lazy_registry[name] = (local_path, module_name)
+            if bind_to is not None:
+                holder.bind_schemas[bind_to] = name
+
+
+def load_registered(class_type: Type, name: str) -> None:
+    """
+    Import the module of a lazily registered subclass of `class_type`, and register
+    all subclasses defined in it.
+    """
+    with _lazy_lock:
+        if name not in class_type._lazy_registry:
+            return
+        local_path, module_name = class_type._lazy_registry[name]
+        for other_name, (other_path, _) in list(class_type._lazy_registry.items()):
+            if other_path == local_path:
+                del class_type._lazy_registry[other_name]
+        _register_module(module_name, local_path, class_type)
 
 
-def register_from_package(path: str, class_type: Type) -> None:
+def register_from_package(path: str, class_type: Type, lazy: bool = True) -> None:
     """
     Register all classes under the given package.
     Only registered classes can be recognized by knext.
+    If `lazy`, the classes are found by scanning the python files, and their modules
+    are only imported when the classes are first got by `by_name`. The scan results
+    are cached in a manifest file under the package, see `_scan_package`.
     """
     if not append_python_path(path):
         return
-    for root, dirs, files in os.walk(path):
-        _register(path, root, files, class_type)
+    modules = _modules(path)
+    if lazy:
+        manifest = _load_manifest(path)
+        changed = _scan_package(path, modules, manifest)
+        scanned = {
+            local_path: manifest["files"][os.path.relpath(local_path, path)]["classes"]
+            for local_path, _ in modules
+        }
+        with _lazy_lock:
+            _register_lazily(modules, scanned, class_type)
+        if changed:
+            _save_manifest(path, manifest)
+    else:
+        for local_path, module_name in modules:
+            _register_module(module_name, local_path, class_type)
     class_type._has_registered = True
 
 
@@ -118,13 +118,15 @@ def load_operator():
     """
     Load all operators in [builder_operator_dir].
     """
+    if "KNEXT_ROOT_PATH" not in os.environ or (
+        "KNEXT_BUILDER_OPERATOR_DIR" not in os.environ
+    ):
+        return
+
     from knext.operator.base import BaseOp
     from knext.operator import builtin
 
-    if not BaseOp._has_registered and (
-        "KNEXT_ROOT_PATH" in os.environ and "KNEXT_BUILDER_OPERATOR_DIR" in os.environ
-    ):
-
+    if not BaseOp._has_registered:
         from knext.common.class_register import register_from_package
 
         builder_operator_path = os.path.join(
@@ -139,12 +141,12 @@ def load_builder_job():
     """
     Load all builder jobs in [builder_job_dir].
     """
-    from knext.client.model.builder_job import BuilderJob
+    if "KNEXT_ROOT_PATH" not in os.environ or "KNEXT_BUILDER_JOB_DIR" not in os.environ:
+        return
 
-    if not BuilderJob._has_registered and (
-        "KNEXT_ROOT_PATH" in os.environ and "KNEXT_BUILDER_JOB_DIR" in os.environ
-    ):
+    from knext.client.model.builder_job import BuilderJob
 
+    if not BuilderJob._has_registered:
         from knext.common.class_register import register_from_package
 
         builder_operator_path = os.path.join(
@@ -43,6 +43,11 @@ class Runnable(BaseModel):
             f"`invoke` is not currently supported for {self.__class__.__name__}."
         )
 
+    def invoke_batch(self, inputs: Sequence[Input]) -> Sequence[Output]:
+        """Transform a batch of inputs into one output sequence synchronously,
+        defaults to invoking each input in order."""
+        return [output for input in inputs for output in self.invoke(input)]
+
     def __rshift__(self, other: Other):
         raise NotImplementedError("To be implemented in subclass")
 
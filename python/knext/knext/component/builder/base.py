@@ -13,7 +13,7 @@
 from abc import ABC
 from enum import Enum
 from functools import cmp_to_key
-from typing import Union
+from typing import Any, List, Sequence, Union
 
 from knext.component.base import Component
 
@@ -80,7 +80,8 @@ class Mapping(BuilderComponent, ABC):
         return Union[SinkWriter]
 
     @staticmethod
-    def sort_by_dependency(mappings: list):
+    def sorted_by_dependency(mappings: list) -> list:
+        """Sorts mappings so that each one comes after the mappings it depends on."""
 
         from knext.component.builder import SPGTypeMapping
 
@@ -92,18 +93,40 @@ class Mapping(BuilderComponent, ABC):
             else:
                 return 0
 
+        if len(mappings) == 1:
+            return list(mappings)
+        return sorted(mappings, key=cmp_to_key(comparator))
+
+    @staticmethod
+    def sort_by_dependency(mappings: list):
         from knext import rest
 
-        if len(mappings) == 1:
-            return rest.SpgTypeMappingNodeConfigs(
-                mapping_node_configs=[m.to_rest().node_config for m in mappings]
-            )
-        mappings = sorted(mappings, key=cmp_to_key(comparator))
+        mappings = Mapping.sorted_by_dependency(mappings)
         return rest.SpgTypeMappingNodeConfigs(
             mapping_node_configs=[m.to_rest().node_config for m in mappings]
         )
 
 
+def _invoke_op(op, *args) -> List:
+    """Invokes an operator in-process and returns the data of its output as a list."""
+    return _invoke_op_batch(op, [args])[0]
+
+
+def _invoke_op_batch(op, batch_args: List[Sequence[Any]]) -> List[List]:
+    """Invokes an operator in-process on a batch of argument tuples through its batch
+    entry point, and returns the data of each output as a list."""
+    from knext.operator.invoke_result import InvokeResult
+
+    results = []
+    for output in op._invoke_batch(batch_args):
+        if isinstance(output, InvokeResult):
+            output = output.data
+        elif isinstance(output, tuple):
+            output = output[0]
+        results.append(list(output) if output else [])
+    return results
+
+
 class SinkWriter(BuilderComponent, ABC):
     """
     Abstract base class for all sink writer component.
@@ -11,11 +11,11 @@
 # or implied.
 
 import json
-from typing import Dict, List, Sequence
+from typing import Dict, List, Sequence, Optional, Any
 
 from knext.client.operator import OperatorClient
 from knext.common.runnable import Input, Output
-from knext.component.builder.base import SPGExtractor
+from knext.component.builder.base import SPGExtractor, _invoke_op
 from knext.operator.spg_record import SPGRecord
 from knext import rest
 from knext.operator.op import PromptOp, ExtractOp
@@ -35,7 +35,8 @@ class LLMBasedExtractor(SPGExtractor):
                 )
         extract = LLMBasedExtractor(
                     llm=NNInvoker.from_config("./config.json"),
-                    prompt_ops=[prompt_op]
+                    prompt_ops=[prompt_op],
+                    prompt_cache_path="./builder/model/prompt_cache.db",
                 )
 
     """
@@ -44,6 +45,14 @@ class LLMBasedExtractor(SPGExtractor):
     llm: NNInvoker
     """PromptOps."""
     prompt_ops: List[PromptOp]
+    """The sqlite file that caches LLM responses by rendered prompt, no cache if not set."""
+    prompt_cache_path: Optional[str] = None
+    """The maximum number of cached responses, least recently used ones are evicted."""
+    prompt_cache_size: int = 100000
+    """Only read cached responses without recording new ones, for reproducible replays."""
+    prompt_cache_read_only: bool = False
+
+    _extractor: Any = None
 
     @property
     def input_types(self) -> Input:
@@ -54,19 +63,34 @@ class LLMBasedExtractor(SPGExtractor):
         return SPGRecord
 
     def invoke(self, input: Input) -> Sequence[Output]:
-        raise NotImplementedError(
-            f"{self.__class__.__name__} does not support being invoked separately."
-        )
+        """Extracts SPGRecords from one input record in-process with `llm` and `prompt_ops`."""
+        if self._extractor is None:
+            from knext.operator.builtin.online_runner import _BuiltInOnlineExtractor
+
+            self._extractor = _BuiltInOnlineExtractor(
+                self._extractor_params(), model=self.llm, prompt_ops=self.prompt_ops
+            )
+        return _invoke_op(self._extractor, input)
 
     def submit(self):
         raise NotImplementedError(
             f"{self.__class__.__name__} does not support being submitted separately."
         )
 
-    def to_rest(self):
-        """Transforms `LLMBasedExtractor` to REST model `ExtractNodeConfig`."""
+    def _extractor_params(self) -> Dict[str, str]:
         params = dict()
         params["model_config"] = json.dumps(self.llm.init_args)
+        if self.prompt_cache_path:
+            from pathlib import Path
+
+            params["prompt_cache_path"] = str(Path(self.prompt_cache_path).resolve())
+            params["prompt_cache_size"] = str(self.prompt_cache_size)
+            params["prompt_cache_read_only"] = str(self.prompt_cache_read_only)
+        return params
+
+    def to_rest(self):
+        """Transforms `LLMBasedExtractor` to REST model `ExtractNodeConfig`."""
+        params = self._extractor_params()
         params["prompt_config"] = json.dumps(
             [OperatorClient().serialize(op.to_rest()) for op in self.prompt_ops]
         )
@@ -104,9 +128,8 @@ class UserDefinedExtractor(SPGExtractor):
         return Dict[str, str]
 
     def invoke(self, input: Input) -> Sequence[Output]:
-        raise NotImplementedError(
-            f"{self.__class__.__name__} does not support being invoked separately."
-        )
+        """Runs `extract_op` on one input record in-process."""
+        return _invoke_op(self.extract_op, input)
 
     def submit(self):
         raise NotImplementedError(
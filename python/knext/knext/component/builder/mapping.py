@@ -24,17 +24,20 @@ from knext.common.schema_helper import (
     TripletName,
     SubPropertyName,
 )
-from knext.component.builder.base import Mapping
+from knext.component.builder.base import Mapping, _invoke_op
+from knext.operator.lifecycle import get_operator
 from knext.operator.op import LinkOp, FuseOp, PredictOp
 from knext.operator.spg_record import SPGRecord
 
 
 class LinkingStrategyEnum(str, Enum):
     IDEquals = "ID_EQUALS"
+    FuzzyMatch = "FUZZY_MATCH"
 
 
 class FusingStrategyEnum(str, Enum):
     NewInstance = "NEW_INSTANCE"
+    EntityResolution = "ENTITY_RESOLUTION"
 
 
 class PredictingStrategyEnum(str, Enum):
@@ -149,13 +152,7 @@ class SPGTypeMapping(Mapping):
             )
         triplet_name = (self.spg_type_name, target_name, object_type_name)
 
-        if linking_strategy:
-            pass
-        elif object_type_name in LinkOp.bind_schemas:
-            op_name = LinkOp.bind_schemas[object_type_name]
-            linking_strategy = LinkOp.by_name(op_name)()
-        else:
-            linking_strategy = None
+        linking_strategy = self._linking_strategy(linking_strategy, object_type_name)
         self._property_mapping[triplet_name] = source_name
         self._object_linking_strategies[triplet_name] = linking_strategy
 
@@ -177,13 +174,7 @@ class SPGTypeMapping(Mapping):
                 f" does not exist in [{self.spg_type_name}]."
             )
         triplet_name = (self.spg_type_name, target_name, target_type)
-        if linking_strategy:
-            pass
-        elif target_type in LinkOp.bind_schemas:
-            op_name = LinkOp.bind_schemas[target_type]
-            linking_strategy = LinkOp.by_name(op_name)()
-        else:
-            linking_strategy = None
+        linking_strategy = self._linking_strategy(linking_strategy, target_type)
         self._relation_mapping[triplet_name] = source_name
         self._object_linking_strategies[triplet_name] = linking_strategy
 
@@ -191,6 +182,28 @@ class SPGTypeMapping(Mapping):
             self._current = (triplet_name, MappingTypeEnum.SubRelation)
         return self
 
+    @staticmethod
+    def _linking_strategy(
+        linking_strategy: LinkingStrategy, object_type_name: SPGTypeName
+    ) -> Optional[LinkingStrategy]:
+        """Returns the linking strategy of objects of `object_type_name`, defaults to
+        the LinkOp bound to the type. `LinkingStrategyEnum.FuzzyMatch` is executed by
+        the built-in `FuzzyLinkOp`, which can also be given with custom params. The
+        resolved operators are shared in the process."""
+        from knext.operator.builtin.fuzzy_link import FuzzyLinkOp
+
+        if linking_strategy == LinkingStrategyEnum.FuzzyMatch:
+            return get_operator(FuzzyLinkOp, {"bind_to": object_type_name})
+        if isinstance(linking_strategy, FuzzyLinkOp) and not linking_strategy.bind_to:
+            params = {**linking_strategy.params, "bind_to": object_type_name}
+            return get_operator(linking_strategy.__class__, params)
+        if linking_strategy:
+            return linking_strategy
+        if object_type_name in LinkOp.bind_schemas:
+            op_name = LinkOp.bind_schemas[object_type_name]
+            return get_operator(LinkOp.by_name(op_name))
+        return None
+
     def add_predicting_property(
         self,
         target_name: PropertyName,
@@ -212,7 +225,7 @@ class SPGTypeMapping(Mapping):
             pass
         elif triplet_name in PredictOp.bind_schemas:
             op_name = PredictOp.bind_schemas[triplet_name]
-            predicting_strategy = PredictOp.by_name(op_name)()
+            predicting_strategy = get_operator(PredictOp.by_name(op_name))
         else:
             predicting_strategy = None
         self._property_mapping[triplet_name] = None
@@ -238,7 +251,7 @@ class SPGTypeMapping(Mapping):
             pass
         elif triplet_name in PredictOp.bind_schemas:
             op_name = PredictOp.bind_schemas[triplet_name]
-            predicting_strategy = PredictOp.by_name(op_name)()
+            predicting_strategy = get_operator(PredictOp.by_name(op_name))
         else:
             predicting_strategy = None
         self._relation_mapping[triplet_name] = None
@@ -266,10 +279,9 @@ class SPGTypeMapping(Mapping):
         self._filters.append((column_name, column_value))
         return self
 
-    def to_rest(self):
-        """
-        Transforms `SPGTypeMapping` to REST model `SpgTypeMappingNodeConfig`.
-        """
+    def _add_default_mappings(self):
+        """Maps all properties and relations from the source fields of the same name,
+        if no mapping is added."""
         if not self._property_mapping and not self._relation_mapping:
             for _rel in self.spg_type.relations.values():
                 if _rel.is_dynamic:
@@ -278,6 +290,12 @@ class SPGTypeMapping(Mapping):
             for _prop in self.spg_type.properties.values():
                 self.add_property_mapping(_prop.name, _prop.name)
 
+    def to_rest(self):
+        """
+        Transforms `SPGTypeMapping` to REST model `SpgTypeMappingNodeConfig`.
+        """
+        self._add_default_mappings()
+
         if "id" not in [
             triplet_name[1]
             for triplet_name in {
@@ -371,23 +389,17 @@ class SPGTypeMapping(Mapping):
                 )
             )
 
-        if isinstance(self.fusing_strategy, FuseOp):
+        fusing_strategy = self._fusing_strategy()
+        if isinstance(fusing_strategy, FuseOp):
             fusing_config = rest.OperatorFusingConfig(
-                operator_config=self.fusing_strategy.to_rest()
+                operator_config=fusing_strategy.to_rest()
             )
-        elif self.fusing_strategy == FusingStrategyEnum.NewInstance:
+        elif fusing_strategy == FusingStrategyEnum.NewInstance:
             fusing_config = rest.NewInstanceFusingConfig()
-        elif not self.fusing_strategy:
-            if self.spg_type_name in FuseOp.bind_schemas:
-                op_name = FuseOp.bind_schemas[self.spg_type_name]
-                op = FuseOp.by_name(op_name)()
-                fusing_config = rest.OperatorFusingConfig(operator_config=op.to_rest())
-            else:
-                fusing_config = None
+        elif not fusing_strategy:
+            fusing_config = None
         else:
-            raise ValueError(
-                f"Invalid fusing_strategy [{self.subject_fusing_strategy}]."
-            )
+            raise ValueError(f"Invalid fusing_strategy [{self.fusing_strategy}].")
 
         for (
             triplet_name,
@@ -412,9 +424,92 @@ class SPGTypeMapping(Mapping):
         return rest.Node(**super().to_dict(), node_config=config)
 
     def invoke(self, input: Input) -> Sequence[Output]:
-        raise NotImplementedError(
-            f"`invoke` method is not currently supported for {self.__class__.__name__}."
-        )
+        """Maps one source record to SPGRecords in-process, see `invoke_batch`."""
+        return self.invoke_batch([input])
+
+    def invoke_batch(self, inputs: Sequence[Input]) -> Sequence[Output]:
+        """Maps a batch of source records to SPGRecords in-process.
+
+        Linked and predicted objects are written as comma-separated ids. The mapped
+        records of the batch go through the fusing strategy together, if there is one,
+        so that it can resolve the duplicated records of the batch. Sub-property
+        mappings are not supported in-process and are ignored.
+        """
+        self._add_default_mappings()
+        records = []
+        for input in inputs:
+            record = self._map_record(input)
+            if record is not None:
+                records.append(record)
+        fusing_strategy = self._fusing_strategy()
+        if records and isinstance(fusing_strategy, FuseOp):
+            return _invoke_op(fusing_strategy, records)
+        return records
+
+    def _map_record(self, input: Input) -> Optional[SPGRecord]:
+        """Maps one source record, or returns None if it is filtered out."""
+        if isinstance(input, SPGRecord):
+            input = input.properties
+        for column_name, column_value in self._filters:
+            if input.get(column_name) != column_value:
+                return None
+        record = SPGRecord(self.spg_type_name)
+        for triplet_name, src_name in self._property_mapping.items():
+            value = self._map_value(triplet_name, input, src_name, record)
+            if value is not None:
+                record.upsert_property(triplet_name[1], value)
+        for triplet_name, src_name in self._relation_mapping.items():
+            value = self._map_value(triplet_name, input, src_name, record)
+            if value is not None:
+                record.upsert_relation(triplet_name[1], triplet_name[2], value)
+        return record
+
+    def _fusing_strategy(self) -> Optional[FusingStrategy]:
+        """Returns the fusing strategy of subjects, defaults to the FuseOp bound to the
+        type. `FusingStrategyEnum.EntityResolution` is executed by the built-in
+        `EntityResolutionFuseOp`, which can also be given with custom params. The
+        resolved operators are shared in the process, `fusing_strategy` is kept as is.
+        """
+        from knext.operator.builtin.entity_resolution import EntityResolutionFuseOp
+
+        fusing_strategy = self.fusing_strategy
+        if fusing_strategy == FusingStrategyEnum.EntityResolution:
+            fusing_strategy = get_operator(
+                EntityResolutionFuseOp, {"bind_to": self.spg_type_name}
+            )
+        elif (
+            isinstance(fusing_strategy, EntityResolutionFuseOp)
+            and not fusing_strategy.bind_to
+        ):
+            params = {**fusing_strategy.params, "bind_to": self.spg_type_name}
+            fusing_strategy = get_operator(fusing_strategy.__class__, params)
+        elif not fusing_strategy and self.spg_type_name in FuseOp.bind_schemas:
+            op_name = FuseOp.bind_schemas[self.spg_type_name]
+            fusing_strategy = get_operator(FuseOp.by_name(op_name))
+        return fusing_strategy
+
+    def _map_value(
+        self,
+        triplet_name: TripletName,
+        input: Dict[str, str],
+        src_name: Optional[str],
+        record: SPGRecord,
+    ) -> Optional[str]:
+        if src_name:
+            value = input.get(src_name)
+            linking_strategy = self._object_linking_strategies.get(triplet_name)
+            if value is None or not isinstance(linking_strategy, LinkOp):
+                return value
+            objects = _invoke_op(linking_strategy, value, record)
+        else:
+            predicting_strategy = self._predicate_predicting_strategies.get(
+                triplet_name
+            )
+            if not isinstance(predicting_strategy, PredictOp):
+                return None
+            objects = _invoke_op(predicting_strategy, record)
+        ids = [o.get_property("id") for o in objects if o.get_property("id")]
+        return ",".join(ids) if ids else None
 
     @classmethod
     def from_rest(cls, rest_model):
@@ -499,7 +594,19 @@ class RelationMapping(Mapping):
         pass
 
     def invoke(self, input: Input) -> Sequence[Output]:
-        pass
+        """Maps one source record to a relation SPGRecord in-process."""
+        if isinstance(input, SPGRecord):
+            input = input.properties
+        for column_name, column_value in self._filters:
+            if input.get(column_name) != column_value:
+                return []
+        record = SPGRecord(
+            f"{self.subject_name}_{self.predicate_name}_{self.object_name}"
+        )
+        for tgt_name, src_name in self._mapping.items():
+            if input.get(src_name) is not None:
+                record.upsert_property(tgt_name, input[src_name])
+        return [record]
 
     def submit(self):
         pass
@@ -509,6 +616,15 @@ class _SPGTypeMappings(Mapping):
 
     spg_type_mappings: List[SPGTypeMapping]
 
+    def invoke(self, input: Input) -> Sequence[Output]:
+        return self.invoke_batch([input])
+
+    def invoke_batch(self, inputs: Sequence[Input]) -> Sequence[Output]:
+        records = []
+        for mapping in Mapping.sorted_by_dependency(self.spg_type_mappings):
+            records.extend(mapping.invoke_batch(inputs))
+        return records
+
     def to_rest(self):
         config = Mapping.sort_by_dependency(self.spg_type_mappings)
         return rest.Node(**super().to_dict(), node_config=config)
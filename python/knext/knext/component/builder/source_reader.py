@@ -10,7 +10,11 @@
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
 
-from typing import List, Dict
+import csv
+import gzip
+import mmap
+import os
+from typing import List, Dict, Iterator
 
 from pydantic import Field
 
@@ -27,6 +31,10 @@ class CSVReader(SourceReader):
         columns: The column names that need to be read from the CSV file.
         start_row: The starting number of rows read from the CSV file.
                     If the CSV file includes a header, it needs to be greater than or equal to 2.
+        delimiter: The field delimiter of the CSV file, only used when read from Python.
+        encoding: The encoding of the CSV file, only used when read from Python.
+        chunk_size: The number of records in each batch yielded by `read_batches`.
+        use_mmap: Whether to memory-map the CSV file when read from Python.
     Examples:
         source = CSVReader(
                     local_path="./builder/job/data/App.csv",
@@ -42,6 +50,14 @@ class CSVReader(SourceReader):
     """The starting number of rows read from the CSV file.
     If the CSV file includes a header, it needs to be greater than or equal to 2."""
     start_row: int = Field(ge=1)
+    """The field delimiter of the CSV file."""
+    delimiter: str = ","
+    """The encoding of the CSV file."""
+    encoding: str = "utf-8"
+    """The number of records in each batch yielded by `read_batches`."""
+    chunk_size: int = Field(default=1000, ge=1)
+    """Whether to memory-map the CSV file when read from Python."""
+    use_mmap: bool = False
 
     @property
     def input_types(self) -> Input:
@@ -51,10 +67,81 @@ class CSVReader(SourceReader):
     def output_types(self) -> Output:
         return Dict[str, str]
 
-    def invoke(self, input: Input):
-        raise NotImplementedError(
-            f"{self.__class__.__name__} does not support being invoked separately."
+    def invoke(self, input: Input = None) -> Iterator[Output]:
+        """Lazily yields all records of the CSV file."""
+        for batch in self.read_batches():
+            yield from batch
+
+    def read_batches(
+        self, shard_index: int = 0, num_shards: int = 1
+    ) -> Iterator[List[Dict[str, str]]]:
+        """Yields the records of one shard of the CSV file in batches of `chunk_size`.
+
+        The file is split into `num_shards` byte ranges of the same size, and a shard reads
+        the lines starting in its range, so that parallel workers read disjoint slices of
+        one file. Byte sharding requires records without line breaks inside quoted fields,
+        and is not supported for gzip files (".gz"), which are read from start to end.
+        The i-th field of each line is projected to the i-th name in `columns`.
+        """
+        if not 0 <= shard_index < num_shards:
+            raise ValueError(
+                f"Invalid shard {shard_index} of {num_shards} for {self.local_path}."
+            )
+        lines = (
+            line.decode(self.encoding)
+            for line in self._read_lines(shard_index, num_shards)
         )
+        rows = csv.reader(lines, delimiter=self.delimiter)
+        if shard_index == 0:
+            for _ in zip(range(self.start_row - 1), rows):
+                pass
+        batch = []
+        for row in rows:
+            if not row:
+                continue
+            batch.append(dict(zip(self.columns, row)))
+            if len(batch) >= self.chunk_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _read_lines(self, shard_index: int, num_shards: int) -> Iterator[bytes]:
+        if self.local_path.endswith(".gz"):
+            if num_shards > 1:
+                raise ValueError(
+                    f"{self.__class__.__name__} can not shard gzip file {self.local_path}."
+                )
+            with gzip.open(self.local_path, "rb") as reader:
+                yield from reader
+            return
+
+        with open(self.local_path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                return
+            start = size * shard_index // num_shards
+            end = size * (shard_index + 1) // num_shards
+            reader = (
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                if self.use_mmap
+                else file
+            )
+            try:
+                if start > 0:
+                    # Skips the line crossing `start`, it belongs to the previous shard.
+                    reader.seek(start - 1)
+                    reader.readline()
+                position = reader.tell()
+                while position < end:
+                    line = reader.readline()
+                    if not line:
+                        break
+                    position += len(line)
+                    yield line
+            finally:
+                if reader is not file:
+                    reader.close()
 
     def submit(self):
         raise NotImplementedError(
@@ -10,6 +10,8 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
+from typing import List
+
 import requests
 from knext.api.operator import FuseOp
 from knext.api.record import SPGRecord
@@ -26,6 +28,9 @@ class IndicatorFuseOp(FuseOp):
         from builder.operator.prompts import IndicatorFusePrompt
 
         self.prompt_op = IndicatorFusePrompt()
+        self.search_client = None
+
+    def open(self):
         self.search_client = SearchClient(Finance.Indicator)
 
     def generate(self, input_data):
@@ -49,6 +54,16 @@ class IndicatorFuseOp(FuseOp):
             return subject_record
         return recall_records[0]
 
+    def link_batch(self, subject_records: List[SPGRecord]) -> List[SPGRecord]:
+        # Retrieve the indicators of all records with one msearch request
+        recall_records = self.search_client.fuzzy_search_batch(
+            subject_records, "name", size=1
+        )
+        return [
+            records[0] if records else record
+            for record, records in zip(subject_records, recall_records)
+        ]
+
     def merge(self, subject_record: SPGRecord, linked_record: SPGRecord) -> SPGRecord:
         # Merge the recalled indicators with LLM
         data = {
@@ -40,14 +40,29 @@ class CompanyLinkerOperator(LinkOp):
 
     def __init__(self):
         super().__init__()
-        self.search_client = SearchClient("SupplyChain.Company")
+        self.search_client = None
         self.enable_llm = False
 
+    def open(self):
+        self.search_client = SearchClient("SupplyChain.Company")
+
     def invoke(self, property: str, record: SPGRecord) -> List[SPGRecord]:
         company_name = property
         query = {"match": {"name": company_name}}
         recalls = self.search_client.search(query, start=0, size=30)
+        return self._link(company_name, recalls)
+
+    def invoke_batch(self, batch_args) -> List[List[SPGRecord]]:
+        # Recall candidates of all company names with one msearch request
+        company_names = [property for property, _ in batch_args]
+        queries = [{"match": {"name": name}} for name in company_names]
+        batch_recalls = self.search_client.search_batch(queries, size=30)
+        return [
+            self._link(name, recalls)
+            for name, recalls in zip(company_names, batch_recalls)
+        ]
 
+    def _link(self, company_name: str, recalls) -> List[SPGRecord]:
         if not recalls:
             return []
 
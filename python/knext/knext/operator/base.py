@@ -10,8 +10,9 @@
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
 import os
+import threading
 from abc import ABC
-from typing import Dict, Any, Type
+from typing import Dict, Any, Type, List, Sequence, Tuple
 
 from knext import rest
 
@@ -32,27 +33,84 @@ class BaseOp(ABC):
     params: Dict[str, str] = None
 
     _registry = {}
+    _lazy_registry: Dict[str, Tuple[str, str]] = {}
     _local_path: str
     _module_path: str
     _version: int
     _has_registered: bool = False
+    _opened: bool = False
+    _open_lock = threading.Lock()
 
     def __init__(self, params: Dict[str, str] = None):
         self.params = params
 
+    def open(self):
+        """Used to acquire heavy resources of the operator, such as clients and models.
+
+        Called once before the first record is handled, so that constructing an operator
+        stays cheap and the resources are only acquired where the operator really runs.
+        """
+        pass
+
+    def close(self):
+        """Used to release the resources acquired in `open`."""
+        pass
+
+    def _ensure_open(self):
+        if self._opened:
+            return
+        with BaseOp._open_lock:
+            lock = self.__dict__.setdefault("_instance_open_lock", threading.Lock())
+        with lock:
+            if not self._opened:
+                self.open()
+                self._opened = True
+
     def invoke(self, *args):
         """Used to implement operator execution logic."""
         raise NotImplementedError(
             f"{self.__class__.__name__} need to implement `invoke` method."
         )
 
+    def invoke_batch(self, batch_args: List[Sequence[Any]]) -> List[Any]:
+        """Used to implement operator execution logic over a batch of inputs.
+
+        Each element of `batch_args` is the argument tuple that would be passed to `invoke`.
+        Operators that can process records vectorially (e.g. one search or LLM request
+        for the whole batch) should override this method, by default `invoke` is called
+        once per element.
+        """
+        return [self.invoke(*args) for args in batch_args]
+
     def _handle(self, *inputs) -> Dict[str, Any]:
         """Only available for Builder in OpenSPG to call through the pemja tool."""
+        self._ensure_open()
         pre_input = self._pre_process(*inputs)
         output = self.invoke(*pre_input)
         post_output = self._post_process(output)
         return post_output
 
+    def _handle_batch(self, batch_inputs: List[Sequence[Any]]) -> List[Dict[str, Any]]:
+        """Only available for Builder in OpenSPG to call through the pemja tool.
+
+        Handles a batch of inputs in one call, each element of `batch_inputs` is the
+        argument list that would be passed to `_handle`. The outputs are returned in the
+        same order as the inputs. The builder calls it instead of `_handle` for the
+        operators whose method is `_handle`, once per batch of records.
+        """
+        pre_inputs = [self._pre_process(*inputs) for inputs in batch_inputs]
+        outputs = self._invoke_batch(pre_inputs)
+        return [self._post_process(output) for output in outputs]
+
+    def _invoke_batch(self, batch_args: List[Sequence[Any]]) -> List[Any]:
+        """Opens the operator if needed and invokes it on a batch of pre-processed inputs.
+
+        Shared by `_handle_batch` and the in-process runners, so that operators behave
+        the same, e.g. with the link cache of `LinkOp`, wherever they are invoked.
+        """
+        self._ensure_open()
+        return self.invoke_batch(batch_args)
+
     @staticmethod
     def _pre_process(*inputs):
         """Convert data structures in building job into structures in operator before `eval` method."""
@@ -74,6 +132,10 @@ class BaseOp(ABC):
             subclass.name = name
             subclass._local_path = local_path
             subclass._module_path = module_path
+            if name in cls._lazy_registry:
+                raise ValueError(
+                    f"Operator [{name}] conflict in {subclass._local_path} and {cls._lazy_registry[name][0]}."
+                )
             if name in cls._registry:
                 raise ValueError(
                     f"Operator [{name}] conflict in {subclass._local_path} and {cls.by_name(name)._local_path}."
@@ -88,6 +150,10 @@ class BaseOp(ABC):
     @classmethod
     def by_name(cls, name: str):
         """Reflection from op name to subclass object of BaseOp."""
+        if name not in cls._registry and name in cls._lazy_registry:
+            from knext.common.class_register import load_registered
+
+            load_registered(BaseOp, name)
         if name in cls._registry:
             subclass = cls._registry[name]
             return subclass
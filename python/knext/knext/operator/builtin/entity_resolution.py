@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import os
+from typing import Callable, Dict, List, Optional
+
+from knext.common.cache import NEGATIVE
+from knext.operator.builtin.fuzzy_link import normalize_name
+from knext.operator.op import FuseOp
+from knext.operator.spg_record import SPGRecord
+
+
+def _latest(old: Optional[str], new: Optional[str]) -> Optional[str]:
+    return new if new not in (None, "") else old
+
+
+def _concat(old: Optional[str], new: Optional[str]) -> Optional[str]:
+    values = []
+    for value in (old, new):
+        for item in (value or "").split(","):
+            item = item.strip()
+            if item and item not in values:
+                values.append(item)
+    return ",".join(values) if values else _latest(old, new)
+
+
+def _max(old: Optional[str], new: Optional[str]) -> Optional[str]:
+    if old in (None, ""):
+        return new
+    if new in (None, ""):
+        return old
+    try:
+        return new if float(new) > float(old) else old
+    except ValueError:
+        return max(old, new)
+
+
+"""Property merge policies, called with the value merged so far and the next value."""
+MERGE_POLICIES: Dict[str, Callable[[Optional[str], Optional[str]], Optional[str]]] = {
+    "latest": _latest,
+    "concat": _concat,
+    "max": _max,
+}
+
+
+class EntityResolutionFuseOp(FuseOp):
+    """Built-in fuse operator, resolving the duplicated records of a batch before
+    linking them to the entities of `bind_to`.
+
+    The records of a batch are clustered by union-find, two records are in the same
+    cluster if they have the same normalized value of any of `key_properties`. Each
+    cluster is merged into one record, with the property merge policies, and is then
+    linked once: by the link cache of any record id in the cluster, or by an exact
+    search of its `link_property`, one msearch request for all clusters of the batch.
+    A linked cluster is merged into the linked entity, and takes its id.
+
+    Subclasses can override `link_batch` and `merge` to link and merge clusters in
+    other ways, `link` and `merge` of each cluster are called at most once.
+
+    Params:
+        bind_to: The SPG type of the fused records, set by `SPGTypeMapping`.
+        key_properties: Comma-separated properties identifying duplicates, defaults
+            to `id,name`.
+        merge_policy: The merge policy of properties, `latest` (the last non-empty
+            value, the default), `concat` (unique comma-separated values) or `max`.
+            Relations are always merged with `concat`.
+        property_merge_policies: Comma-separated `property:policy` pairs, overriding
+            `merge_policy` for some properties, like `alias:concat,revenue:max`.
+        link_property: The property searched to link clusters, defaults to `name`.
+            Set it empty to only resolve duplicates within batches.
+        search_engine_url: Optional. The search engine url, see `SearchClient`.
+    """
+
+    def __init__(self, params: Dict[str, str] = None):
+        super().__init__(params or {})
+        self.bind_to = self.params.get("bind_to")
+        self.key_properties = [
+            name.strip()
+            for name in self.params.get("key_properties", "id,name").split(",")
+            if name.strip()
+        ]
+        self.link_property = self.params.get("link_property", "name")
+        self.default_policy = self._policy(self.params.get("merge_policy", "latest"))
+        self.policies = {}
+        for item in self.params.get("property_merge_policies", "").split(","):
+            if item.strip():
+                name, _, policy = item.partition(":")
+                self.policies[name.strip()] = self._policy(policy.strip())
+        self.search_client = None
+
+    @staticmethod
+    def _policy(name: str):
+        if name not in MERGE_POLICIES:
+            raise ValueError(
+                f"Invalid merge policy [{name}], expected one of {list(MERGE_POLICIES)}."
+            )
+        return MERGE_POLICIES[name]
+
+    def open(self):
+        if self.link_property:
+            from knext.client.search import SearchClient
+
+            url = self.params.get("search_engine_url") or os.environ.get(
+                "KNEXT_SEARCH_ENGINE_URL"
+            )
+            self.search_client = SearchClient(self.bind_to, url)
+
+    def cluster(self, records: List[SPGRecord]) -> List[List[SPGRecord]]:
+        """Groups the records with the same value of any key property, in the order of
+        their first record. Values other than ids are compared normalized."""
+        parents = list(range(len(records)))
+
+        def find(idx):
+            while parents[idx] != idx:
+                parents[idx] = parents[parents[idx]]
+                idx = parents[idx]
+            return idx
+
+        first_indices = {}
+        for idx, record in enumerate(records):
+            for name in self.key_properties:
+                value = record.get_property(name)
+                if not value:
+                    continue
+                if name != "id":
+                    value = normalize_name(value, ())
+                key = (name, value)
+                if key in first_indices:
+                    root, other = find(idx), find(first_indices[key])
+                    parents[max(root, other)] = min(root, other)
+                else:
+                    first_indices[key] = idx
+        clusters: Dict[int, List[SPGRecord]] = {}
+        for idx, record in enumerate(records):
+            clusters.setdefault(find(idx), []).append(record)
+        return list(clusters.values())
+
+    def merge_records(self, records: List[SPGRecord]) -> SPGRecord:
+        """Merges records into a new record with the id of the first one, applying
+        the merge policies in the order of the records."""
+        merged = SPGRecord(records[0].spg_type_name)
+        properties, relations = {}, {}
+        for record in records:
+            for name, value in record.properties.items():
+                policy = self.policies.get(name, self.default_policy)
+                properties[name] = policy(properties.get(name), value)
+            for name, value in record.relations.items():
+                relations[name] = _concat(relations.get(name), value)
+        if records[0].get_property("id"):
+            properties["id"] = records[0].get_property("id")
+        merged.properties = properties
+        merged.relations = relations
+        return merged
+
+    def link(self, subject_record: SPGRecord) -> Optional[SPGRecord]:
+        return self.link_batch([subject_record])[0]
+
+    def link_batch(self, subject_records: List[SPGRecord]) -> List[Optional[SPGRecord]]:
+        """Returns the linked entity of each record, or None if not linked."""
+        if self.search_client is None:
+            return [None] * len(subject_records)
+        return self.search_client.exact_search_batch(
+            subject_records, self.link_property
+        )
+
+    def merge(self, subject_record: SPGRecord, linked_record: SPGRecord) -> SPGRecord:
+        merged = self.merge_records([linked_record, subject_record])
+        merged.spg_type_name = subject_record.spg_type_name
+        return merged
+
+    def invoke(self, subject_records: List[SPGRecord]) -> List[SPGRecord]:
+        cache = self.link_cache
+        clusters = self.cluster(subject_records)
+        cluster_records = [self.merge_records(cluster) for cluster in clusters]
+
+        linked_records: List[Optional[SPGRecord]] = [None] * len(clusters)
+        missed_indices = []
+        for idx, cluster in enumerate(clusters):
+            for record in cluster:
+                linked_id = cache.lookup(record.get_property("id", ""))
+                if linked_id and linked_id != NEGATIVE:
+                    linked_records[idx] = SPGRecord(self.bind_to).upsert_property(
+                        "id", linked_id
+                    )
+                    break
+            else:
+                missed_indices.append(idx)
+        if missed_indices:
+            missed_linked = self.link_batch(
+                [cluster_records[idx] for idx in missed_indices]
+            )
+            for idx, linked_record in zip(missed_indices, missed_linked):
+                linked_records[idx] = linked_record
+
+        outputs = []
+        for cluster, record, linked_record in zip(
+            clusters, cluster_records, linked_records
+        ):
+            if linked_record:
+                record = self.merge(record, linked_record)
+            if not record:
+                continue
+            for member in cluster:
+                if member.get_property("id"):
+                    cache.put(member.get_property("id"), record.get_property("id"))
+            outputs.append(record)
+        return outputs
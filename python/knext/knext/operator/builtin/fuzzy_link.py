@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import functools
+import os
+import re
+import threading
+import unicodedata
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from knext.operator.op import LinkOp
+from knext.operator.spg_record import SPGRecord
+
+"""Legal-form words dropped from names before blocking, since most names share them."""
+NAME_STOP_WORDS = (
+    "股份有限公司",
+    "有限责任公司",
+    "有限公司",
+    "集团",
+    "公司",
+    "company",
+    "limited",
+    "corp",
+    "corporation",
+    "group",
+    "inc",
+    "ltd",
+    "llc",
+    "co",
+)
+
+_EMPTY = np.uint32(0xFFFFFFFF)
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+@functools.lru_cache(maxsize=None)
+def _stop_words_pattern(stop_words: Tuple[str, ...]) -> Tuple[frozenset, re.Pattern]:
+    """Returns the ascii stop words, dropped as whole words, and the pattern of the
+    other stop words, dropped wherever they appear."""
+    ascii_words = frozenset(word for word in stop_words if word.isascii())
+    others = sorted((word for word in stop_words if not word.isascii()), key=len)
+    pattern = "|".join(re.escape(word) for word in reversed(others)) or "(?!)"
+    return ascii_words, re.compile(pattern)
+
+
+def normalize_name(name: str, stop_words: Sequence[str] = NAME_STOP_WORDS) -> str:
+    """Returns the blocking key of a name: NFKC-normalized, lowercased, without
+    punctuation, whitespace and `stop_words`."""
+    ascii_words, pattern = _stop_words_pattern(tuple(stop_words))
+    name = unicodedata.normalize("NFKC", name).lower()
+    words = _NON_WORD.sub(" ", name).split()
+    key = pattern.sub("", "".join(word for word in words if word not in ascii_words))
+    # Names made of stop words only are kept whole.
+    return key or "".join(words)
+
+
+def _offsets(counts: np.ndarray) -> np.ndarray:
+    """Returns the ranges `0..count - 1` of all counts, concatenated."""
+    return np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+
+class MinHashBlockingIndex:
+    """Blocking index of entity names, for recalling the candidates of many names at
+    once. Names are blocked by their normalized key, and by MinHash LSH over the
+    character n-grams of the key, with `num_perm` hash functions in `bands` bands.
+
+    Args:
+        ids: The ids of the entities.
+        names: The names of the entities.
+        ngram_size: The size of the character n-grams of the keys.
+        num_perm: The number of MinHash functions, a multiple of `bands`.
+        bands: The number of LSH bands, more bands recall less similar names.
+        max_bucket_size: LSH buckets with more names than this are not recalled.
+        stop_words: The words dropped from names, see `normalize_name`.
+    """
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        names: Sequence[str],
+        ngram_size: int = 2,
+        num_perm: int = 64,
+        bands: int = 32,
+        max_bucket_size: int = 1000,
+        stop_words: Sequence[str] = NAME_STOP_WORDS,
+    ):
+        if num_perm % bands:
+            raise ValueError(f"num_perm [{num_perm}] is not a multiple of [{bands}].")
+        self.ids = list(ids)
+        self.ngram_size = ngram_size
+        self.bands = bands
+        self.max_bucket_size = max_bucket_size
+        self.stop_words = tuple(stop_words)
+        # Odd multipliers of the multiply-shift hash functions.
+        rng = np.random.RandomState(num_perm)
+        self._a = rng.randint(0, 1 << 62, size=num_perm, dtype=np.uint64) * 2 + 1
+        self._b = rng.randint(0, 1 << 62, size=num_perm, dtype=np.uint64)
+        self._band_mult = self._a[: num_perm // bands]
+
+        keys = [normalize_name(name, self.stop_words) for name in names]
+        self._keys: Dict[str, List[int]] = {}
+        for idx, key in enumerate(keys):
+            self._keys.setdefault(key, []).append(idx)
+        self.signatures = self._signatures(keys)
+        # Sorted hashes of each band of all names, with the name index of each hash.
+        band_hashes = np.ascontiguousarray(self._band_hashes(self.signatures).T)
+        self._band_order = np.argsort(band_hashes, axis=1)
+        self._band_sorted = np.take_along_axis(band_hashes, self._band_order, axis=1)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _shingle_hashes(self, keys: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the hashes of the character n-grams of all keys, and the number of
+        n-grams of each key. Keys shorter than `ngram_size` are one n-gram."""
+        n = self.ngram_size
+        lengths = np.fromiter(map(len, keys), dtype=np.int64, count=len(keys))
+        codes = np.frombuffer("".join(keys).encode("utf-32-le"), dtype=np.uint32)
+        codes = np.append(codes.astype(np.uint64) + 1, np.uint64(0))
+        ends = np.cumsum(lengths)
+        counts = np.where(lengths > 0, np.maximum(lengths - n + 1, 1), 0)
+        key_indices = np.repeat(np.arange(len(keys)), counts)
+        positions = _offsets(counts) + (ends - lengths)[key_indices]
+        key_ends = ends[key_indices]
+        hashes = np.zeros(len(positions), dtype=np.uint64)
+        for offset in range(n):
+            pos = positions + offset
+            # Positions past the end of a key read the 0 appended to the codes.
+            pos[pos >= key_ends] = len(codes) - 1
+            hashes = hashes * np.uint64(0x100000001B3) + codes[pos]
+        return hashes, counts
+
+    def _signatures(self, keys: Sequence[str], chunk_size: int = 10000) -> np.ndarray:
+        """Returns the MinHash signatures of keys, computed `chunk_size` keys at a time.
+        Empty keys get a signature of `_EMPTY`, which matches no other signature."""
+        signatures = np.full((len(keys), len(self._a)), _EMPTY, dtype=np.uint32)
+        for start in range(0, len(keys), chunk_size):
+            hashes, counts = self._shingle_hashes(keys[start : start + chunk_size])
+            rows = np.flatnonzero(counts)
+            if not len(rows):
+                continue
+            offsets = (np.cumsum(counts) - counts)[rows]
+            values = (hashes[:, None] * self._a + self._b) >> np.uint64(33)
+            signatures[start + rows] = np.minimum.reduceat(values, offsets, axis=0)
+        return signatures
+
+    def _band_hashes(self, signatures: np.ndarray) -> np.ndarray:
+        rows = signatures.reshape(len(signatures), self.bands, len(self._band_mult))
+        hashes = (rows.astype(np.uint64) * self._band_mult).sum(axis=2)
+        # Signatures of empty keys must not share buckets.
+        hashes[signatures[:, 0] == _EMPTY] = np.iinfo(np.uint64).max
+        return hashes
+
+    def _candidates(self, signatures: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the (query index, name index) pairs of the names sharing a bucket
+        of at most `max_bucket_size` names with the queries."""
+        band_hashes = self._band_hashes(signatures)
+        lefts = np.empty(band_hashes.shape, dtype=np.int64)
+        rights = np.empty(band_hashes.shape, dtype=np.int64)
+        for band in range(self.bands):
+            sorted_hashes = self._band_sorted[band]
+            lefts[:, band] = np.searchsorted(sorted_hashes, band_hashes[:, band])
+            rights[:, band] = np.searchsorted(
+                sorted_hashes, band_hashes[:, band], "right"
+            )
+        sizes = rights - lefts
+        sizes[(sizes > self.max_bucket_size) | (signatures[:, :1] == _EMPTY)] = 0
+        if not sizes.any():
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        query_indices = np.repeat(np.arange(len(signatures)), sizes.sum(axis=1))
+        sizes = sizes.ravel()
+        starts = lefts + np.arange(self.bands) * len(self.ids)
+        positions = _offsets(sizes) + np.repeat(starts.ravel(), sizes)
+        candidates = self._band_order.ravel()[positions]
+        pairs = np.unique(query_indices * len(self.ids) + candidates)
+        return pairs // len(self.ids), pairs % len(self.ids)
+
+    def query(self, names: Sequence[str]) -> List[List[Tuple[int, float]]]:
+        """Returns the candidates of each name as (entity index, similarity) pairs,
+        sorted by similarity. Entities with the same normalized key as the name have
+        similarity 1.0, others the estimated Jaccard similarity of the n-grams."""
+        keys = [normalize_name(name, self.stop_words) for name in names]
+        signatures = self._signatures(keys)
+        query_indices, candidates = self._candidates(signatures)
+        scores = (self.signatures[candidates] == signatures[query_indices]).mean(axis=1)
+        order = np.lexsort((-scores, query_indices))
+        results = [[] for _ in keys]
+        for qidx, cidx, score in zip(
+            query_indices[order].tolist(),
+            candidates[order].tolist(),
+            scores[order].tolist(),
+        ):
+            results[qidx].append((cidx, score))
+        for qidx, key in enumerate(keys):
+            exact = self._keys.get(key)
+            if exact and key:
+                results[qidx] = [(cidx, 1.0) for cidx in exact] + [
+                    (cidx, score) for cidx, score in results[qidx] if cidx not in exact
+                ]
+        return results
+
+    def similarity(self, names: Sequence[str], others: Sequence[str]) -> np.ndarray:
+        """Returns the estimated similarity of each pair of `names` and `others`."""
+        signatures = self._signatures(
+            [normalize_name(name, self.stop_words) for name in names]
+        )
+        other_signatures = self._signatures(
+            [normalize_name(name, self.stop_words) for name in others]
+        )
+        scores = (signatures == other_signatures).mean(axis=1)
+        scores[signatures[:, 0] == _EMPTY] = 0.0
+        return scores
+
+
+"""The blocking indexes of this process with the size of their local index, which
+are rebuilt when records have been added to the local index."""
+_blocking_indexes: Dict[Tuple, Tuple[Optional[int], MinHashBlockingIndex]] = {}
+_blocking_indexes_lock = threading.Lock()
+
+
+def _load_entities(
+    spg_type_name: str, property_name: str, source: str = None, url: str = None
+) -> Optional[Tuple[List[str], List[str]]]:
+    """Returns the (ids, names) of the entities of `spg_type_name` in `source`, a
+    csv, jsonl, sqlite or local index file, or in the local index of `url`.
+    Returns None if neither is given, or `url` is not a local url."""
+    from knext.client.local_search import LocalIndex, LOCAL_SCHEME, get_local_index
+
+    if source:
+        extension = os.path.splitext(source)[1].lower()
+        if extension == ".idx":
+            index = LocalIndex(spg_type_name, source)
+        else:
+            index = LocalIndex(spg_type_name)
+            if extension == ".csv":
+                index.load_csv(source)
+            elif extension in (".jsonl", ".json"):
+                index.load_jsonl(source)
+            elif extension in (".db", ".sqlite", ".sqlite3"):
+                index.load_sqlite(source)
+            else:
+                raise ValueError(f"Unsupported entity source [{source}].")
+    elif url and url.startswith(f"{LOCAL_SCHEME}:"):
+        index = get_local_index(spg_type_name, url)
+    else:
+        return None
+    ids, names = [], []
+    for doc_id, name in index.values(property_name):
+        ids.append(doc_id)
+        names.append(name)
+    return ids, names
+
+
+class FuzzyLinkOp(LinkOp):
+    """Built-in link operator, linking property values to the entities of `bind_to`
+    with similar names.
+
+    The names are recalled from a `MinHashBlockingIndex` of all entities, built once
+    per process from the `source` param, or from the local index when the search
+    engine url is `local:`, and rebuilt when the operator is opened after records
+    have been added to the local index. Otherwise, candidates are recalled from the
+    search engine with one msearch request per batch. The most similar candidate is
+    linked if its similarity is at least `threshold`.
+
+    Params:
+        bind_to: The SPG type of the linked entities, set by `SPGTypeMapping`.
+        property_name: The property of the entity names, defaults to `name`.
+        threshold: The minimum similarity of a linked entity, defaults to 0.7.
+        source: Optional. The csv, jsonl, sqlite or local index file of the entities.
+        search_engine_url: Optional. The search engine url, see `SearchClient`.
+        ngram_size, num_perm, bands, max_bucket_size: See `MinHashBlockingIndex`.
+        candidate_size: The number of candidates recalled from the search engine.
+    """
+
+    def __init__(self, params: Dict[str, str] = None):
+        super().__init__(params or {})
+        self.bind_to = self.params.get("bind_to")
+        self.property_name = self.params.get("property_name", "name")
+        self.threshold = float(self.params.get("threshold", "0.7"))
+        self.candidate_size = int(self.params.get("candidate_size", "30"))
+        self.blocking_index: Optional[MinHashBlockingIndex] = None
+        self.search_client = None
+
+    def open(self):
+        from knext.client.local_search import LOCAL_SCHEME, get_local_index
+
+        source = self.params.get("source")
+        url = self.params.get("search_engine_url") or os.environ.get(
+            "KNEXT_SEARCH_ENGINE_URL"
+        )
+        config = (
+            int(self.params.get("ngram_size", "2")),
+            int(self.params.get("num_perm", "64")),
+            int(self.params.get("bands", "32")),
+            int(self.params.get("max_bucket_size", "1000")),
+        )
+        key = (self.bind_to, self.property_name, source, url) + config
+        size = None
+        if not source and url and url.startswith(f"{LOCAL_SCHEME}:"):
+            size = len(get_local_index(self.bind_to, url))
+        with _blocking_indexes_lock:
+            cached_size, self.blocking_index = _blocking_indexes.get(key, (None, None))
+            if self.blocking_index is None or cached_size != size:
+                self.blocking_index = None
+                entities = _load_entities(self.bind_to, self.property_name, source, url)
+                if entities is not None:
+                    self.blocking_index = MinHashBlockingIndex(*entities, *config)
+                    _blocking_indexes[key] = (size, self.blocking_index)
+        if self.blocking_index is None:
+            from knext.client.search import SearchClient
+
+            self.search_client = SearchClient(self.bind_to, url)
+            self.blocking_index = MinHashBlockingIndex([], [], *config)
+
+    def invoke(self, property: str, subject_record: SPGRecord) -> List[SPGRecord]:
+        return self.invoke_batch([(property, subject_record)])[0]
+
+    def invoke_batch(self, batch_args) -> List[List[SPGRecord]]:
+        names = [property for property, _ in batch_args]
+        if self.search_client is not None:
+            return self._link_recalls(names)
+        outputs = []
+        for candidates in self.blocking_index.query(names):
+            if candidates and candidates[0][1] >= self.threshold:
+                doc_id = self.blocking_index.ids[candidates[0][0]]
+                outputs.append([self._linked(doc_id)])
+            else:
+                outputs.append([])
+        return outputs
+
+    def _link_recalls(self, names: List[str]) -> List[List[SPGRecord]]:
+        queries = [{"match": {self.property_name: name}} for name in names]
+        batch_recalls = self.search_client.search_batch(
+            queries, size=self.candidate_size
+        )
+        pairs: List[Tuple[int, str, str]] = []
+        for idx, recalls in enumerate(batch_recalls):
+            for recall in recalls or []:
+                name = recall.properties.get(self.property_name)
+                if name:
+                    pairs.append((idx, recall.doc_id, name))
+        best: Dict[int, Tuple[float, str]] = {}
+        if pairs:
+            scores = self.blocking_index.similarity(
+                [names[idx] for idx, _, _ in pairs], [name for _, _, name in pairs]
+            )
+            for (idx, doc_id, _), score in zip(pairs, scores.tolist()):
+                if score >= self.threshold and score > best.get(idx, (-1.0,))[0]:
+                    best[idx] = (score, doc_id)
+        return [
+            [self._linked(best[idx][1])] if idx in best else []
+            for idx in range(len(names))
+        ]
+
+    def _linked(self, doc_id: str) -> SPGRecord:
+        return SPGRecord(spg_type_name=self.bind_to).upsert_property("id", doc_id)
@@ -10,24 +10,73 @@
 # or implied.
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 from knext.api.operator import ExtractOp
+from knext.common.cache import PromptCache
 from knext.operator.spg_record import SPGRecord
 from nn4k.invoker import NNInvoker
 
 
 class _BuiltInOnlineExtractor(ExtractOp):
-    def __init__(self, params: Dict[str, str] = None):
+    """Runs a chain of prompt operators against a remote model.
+
+    All prompts of one stage of the chain are sent concurrently, with at most
+    `max_in_flight` requests running at a time. A request that fails, or does not answer
+    within `request_timeout` seconds, is retried after `retry_backoff * 2 ** attempt`
+    seconds, up to `max_retry_times` attempts in total. If `prompt_cache_path` is set,
+    responses are looked up in and recorded to a PromptCache first.
+
+    The request threads and the PromptCache are only acquired in `open`, so that building
+    the operator config in `to_rest` does not start threads or touch the cache file.
+    """
+
+    def __init__(
+        self,
+        params: Dict[str, str] = None,
+        model: NNInvoker = None,
+        prompt_ops: List = None,
+    ):
         super().__init__(params)
-        self.model = self.load_model()
-        self.prompt_ops = self.load_operator()
+        self.model = model or self.load_model()
+        self.prompt_ops = prompt_ops if prompt_ops is not None else self.load_operator()
         self.max_retry_times = int(self.params.get("max_retry_times", "3"))
+        self.max_in_flight = int(self.params.get("max_in_flight", "8"))
+        request_timeout = self.params.get("request_timeout")
+        self.request_timeout = float(request_timeout) if request_timeout else None
+        self.retry_backoff = float(self.params.get("retry_backoff", "1"))
+        self._executor = None
+        self.prompt_cache = None
+
+    def open(self):
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix="knext-prompt"
+        )
+        self.prompt_cache = self.load_prompt_cache()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self.prompt_cache is not None:
+            self.prompt_cache.close()
+            self.prompt_cache = None
 
     def load_model(self):
         model_config = json.loads(self.params["model_config"])
         return NNInvoker.from_config(model_config)
 
+    def load_prompt_cache(self):
+        if not self.params.get("prompt_cache_path"):
+            return None
+        return PromptCache(
+            self.params["prompt_cache_path"],
+            maxsize=int(self.params.get("prompt_cache_size", "100000")),
+            read_only=self.params.get("prompt_cache_read_only", "False") == "True",
+        )
+
     def load_operator(self):
         import importlib.util
 
@@ -48,24 +97,65 @@ class _BuiltInOnlineExtractor(ExtractOp):
         return prompt_ops
 
     def invoke(self, record: Dict[str, str]) -> List[SPGRecord]:
-
+        # The executor and prompt cache are created by `open`, which is not called
+        # when the operator is invoked directly.
+        self._ensure_open()
         collector = []
         input_params = [record]
         for op in self.prompt_ops:
             next_params = []
-            for input_param in input_params:
-                retry_times = 0
-                while retry_times < self.max_retry_times:
-                    try:
-                        query = op.build_prompt(input_param)
-                        response = self.model.remote_inference(query)
-                        collector.extend(op.parse_response(response))
-                        next_params.extend(
-                            op._build_next_variables(input_param, response)
-                        )
-                        break
-                    except Exception as e:
-                        retry_times += 1
-                        raise e
+            for records, variables in self._run_stage(op, input_params):
+                collector.extend(records)
+                next_params.extend(variables)
             input_params = next_params
         return collector
+
+    def _run_stage(self, op, input_params: List[Dict[str, str]]):
+        """Sends the prompts of all `input_params` concurrently and returns the parsed
+        records and next variables of each one, in the order of `input_params`."""
+        queries = [op.build_prompt(input_param) for input_param in input_params]
+        results = [None] * len(queries)
+        pending = []
+        cache_keys = [None] * len(queries)
+        for idx, query in enumerate(queries):
+            if self.prompt_cache is not None:
+                cache_keys[idx] = PromptCache.key(query, self.params["model_config"])
+                response = self.prompt_cache.get(cache_keys[idx])
+                if response is not None:
+                    results[idx] = (
+                        op.parse_response(response),
+                        op._build_next_variables(input_params[idx], response),
+                    )
+                    continue
+            pending.append(idx)
+        retry_times = 0
+        while pending:
+            futures = [
+                (idx, self._executor.submit(self.model.remote_inference, queries[idx]))
+                for idx in pending
+            ]
+            failed = []
+            error = None
+            for idx, future in futures:
+                try:
+                    # The timeout counts from when the future is waited on. A timed-out
+                    # request keeps running, as cancel cannot stop it, and keeps its
+                    # worker busy, so later requests may spend part of it queued.
+                    response = future.result(timeout=self.request_timeout)
+                    results[idx] = (
+                        op.parse_response(response),
+                        op._build_next_variables(input_params[idx], response),
+                    )
+                    if self.prompt_cache is not None:
+                        self.prompt_cache.put(cache_keys[idx], response)
+                except Exception as e:
+                    future.cancel()
+                    failed.append(idx)
+                    error = e
+            retry_times += 1
+            if failed and retry_times >= self.max_retry_times:
+                raise error
+            if failed:
+                time.sleep(self.retry_backoff * 2 ** (retry_times - 1))
+            pending = failed
+        return results
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import atexit
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple, Type
+
+from knext.operator.base import BaseOp
+
+
+def _op_name(op) -> str:
+    op_class = op if isinstance(op, type) else op.__class__
+    return getattr(op_class, "name", None) or op_class.__name__
+
+
+class OperatorManager:
+    """Manages the operator instances of a worker process.
+
+    Each operator class is instantiated once per distinct params through `get`, and
+    `prewarm` opens the managed operators in parallel before the first record is handled.
+    The seconds spent constructing and opening each operator are kept in `init_times`.
+    All opened operators are closed and released by `close`, which runs at interpreter
+    exit.
+    """
+
+    def __init__(self):
+        self._instances: Dict[Tuple[Type[BaseOp], str], BaseOp] = {}
+        self._opened: List[BaseOp] = []
+        self._init_times: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def init_times(self) -> Dict[str, float]:
+        """Seconds spent constructing and opening each operator, keyed by operator name."""
+        return dict(self._init_times)
+
+    def get(self, op_class: Type[BaseOp], params: Dict[str, str] = None) -> BaseOp:
+        """Returns the instance of `op_class` with `params`, creating it on first use."""
+        key = self._key(op_class, params)
+        with self._lock:
+            op = self._instances.get(key)
+            if op is None:
+                start = time.perf_counter()
+                op = op_class(params) if params else op_class()
+                self._add_time(op, time.perf_counter() - start)
+                self._instances[key] = op
+            return op
+
+    def open(self, op: BaseOp) -> BaseOp:
+        """Opens `op` once, and manages it if it was not created through `get`."""
+        with self._lock:
+            self._instances.setdefault(self._key(op.__class__, op.params), op)
+        if not op._opened:
+            start = time.perf_counter()
+            op._ensure_open()
+            self._add_time(op, time.perf_counter() - start)
+            with self._lock:
+                if op not in self._opened:
+                    self._opened.append(op)
+        return op
+
+    def prewarm(self, ops: Iterable[BaseOp] = None, max_workers: int = 8):
+        """Opens `ops` and all managed operators in parallel, and prints the init time
+        of each operator."""
+        with self._lock:
+            ops = list(ops or []) + list(self._instances.values())
+        pending: List[BaseOp] = []
+        for op in ops:
+            if not op._opened and op not in pending:
+                pending.append(op)
+        if not pending:
+            return
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(pending)), thread_name_prefix="knext-op"
+        ) as executor:
+            list(executor.map(self.open, pending))
+        for op in pending:
+            name = _op_name(op)
+            print(f"Operator [{name}] initialized in {self._init_times[name]:.3f}s.")
+
+    def close(self):
+        """Closes all opened operators, the ones opened by `open` in the reverse order
+        of their opening, and releases all managed operators."""
+        with self._lock:
+            ops = list(self._instances.values())
+            ops = [op for op in ops if op not in self._opened] + self._opened
+            self._opened = []
+            self._instances.clear()
+        for op in reversed(ops):
+            if op._opened:
+                op.close()
+                op._opened = False
+
+    @staticmethod
+    def _key(
+        op_class: Type[BaseOp], params: Dict[str, str]
+    ) -> Tuple[Type[BaseOp], str]:
+        return op_class, json.dumps(params or None, sort_keys=True)
+
+    def _add_time(self, op: BaseOp, seconds: float):
+        name = _op_name(op)
+        self._init_times[name] = self._init_times.get(name, 0.0) + seconds
+
+
+operator_manager = OperatorManager()
+atexit.register(operator_manager.close)
+
+
+def get_operator(op_class: Type[BaseOp], params: Dict[str, str] = None) -> BaseOp:
+    """Returns the process-wide instance of `op_class` with `params`."""
+    return operator_manager.get(op_class, params)
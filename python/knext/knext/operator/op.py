@@ -10,15 +10,39 @@
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
 from abc import ABC
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
 
-import knext.common.cache
+from knext.common.cache import LinkCache, link_cache_from_params, NEGATIVE
 from knext.common.schema_helper import SPGTypeName, TripletName
 from knext.operator.base import BaseOp
 from knext.operator.invoke_result import InvokeResult
 from knext.operator.spg_record import SPGRecord
 
-cache = knext.common.cache.LinkCache(5000, 60)
+LINK_CACHE_SIZE = 5000
+LINK_CACHE_TTL = 60
+LINK_CACHE_LOG_INTERVAL = 10000
+
+
+def _link_cache(op: BaseOp) -> LinkCache:
+    """Returns the LinkCache shared by all link and fuse operators bound to `op.bind_to`.
+
+    The cache is resolved from the params once per operator and bound type, and then
+    kept on the operator, so that handling a record does not take the registry lock.
+    """
+    resolved = op.__dict__.get("_resolved_link_cache")
+    if resolved is not None and resolved[0] == op.bind_to:
+        return resolved[1]
+    params = {"cache_size": LINK_CACHE_SIZE, "cache_ttl": LINK_CACHE_TTL}
+    params.update(op.params or {})
+    cache = link_cache_from_params(str(op.bind_to), params)
+    op.__dict__["_resolved_link_cache"] = (op.bind_to, cache)
+    return cache
+
+
+def _is_empty_output(output) -> bool:
+    if isinstance(output, InvokeResult):
+        return not output.data and not output.errors
+    return isinstance(output, list) and not output
 
 
 class ExtractOp(BaseOp, ABC):
@@ -47,14 +71,23 @@ class ExtractOp(BaseOp, ABC):
 
 
 class LinkOp(BaseOp, ABC):
-    """Base class for all entity link operators."""
+    """Base class for all entity link operators.
+
+    Linked ids are cached per `bind_to` type, the cache is configured by the operator
+    params described in `knext.common.cache.link_cache_from_params`, and its counters
+    are printed every `cache_log_interval` lookups.
+    """
 
     bind_to: SPGTypeName
 
     bind_schemas: Dict[SPGTypeName, str] = {}
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, params: Dict[str, str] = None):
+        super().__init__(params)
+
+    @property
+    def link_cache(self) -> LinkCache:
+        return _link_cache(self)
 
     def invoke(self, property: str, subject_record: SPGRecord) -> List[SPGRecord]:
         raise NotImplementedError(
@@ -62,19 +95,47 @@ class LinkOp(BaseOp, ABC):
         )
 
     def _handle(self, *inputs) -> Dict[str, Any]:
-        _property, subject_record = self._pre_process(*inputs)
-        cache_key = str(self.bind_to) + _property
-        cache_property = cache.get(cache_key)
-        if cache_property:
-            output = [
-                SPGRecord(spg_type_name=self.bind_to).upsert_property(
-                    "id", cache_property
-                )
-            ]
-        else:
-            output = self.invoke(_property, subject_record)
-        post_output = self._post_process(output)
-        return post_output
+        return self._handle_batch([inputs])[0]
+
+    def _invoke_batch(self, batch_args: List[Sequence[Any]]) -> List[Any]:
+        """Links a batch of property values, only the values missing in the link cache
+        are passed to `invoke_batch`."""
+        self._ensure_open()
+        cache = self.link_cache
+        lookups = cache.stats.lookups
+        outputs = [None] * len(batch_args)
+        missed_indices = []
+        for idx, (_property, _) in enumerate(batch_args):
+            cache_property = cache.lookup(_property)
+            if cache_property == NEGATIVE:
+                outputs[idx] = []
+            elif cache_property:
+                outputs[idx] = [
+                    SPGRecord(spg_type_name=self.bind_to).upsert_property(
+                        "id", cache_property
+                    )
+                ]
+            else:
+                missed_indices.append(idx)
+        if missed_indices:
+            missed_outputs = self.invoke_batch(
+                [batch_args[idx] for idx in missed_indices]
+            )
+            for idx, output in zip(missed_indices, missed_outputs):
+                outputs[idx] = output
+                if _is_empty_output(output):
+                    cache.put_miss(batch_args[idx][0])
+        self._log_cache_stats(cache, lookups)
+        return outputs
+
+    def _log_cache_stats(self, cache: LinkCache, lookups_before: int):
+        params = self.params or {}
+        interval = int(params.get("cache_log_interval", LINK_CACHE_LOG_INTERVAL))
+        if (
+            interval > 0
+            and cache.stats.lookups // interval > lookups_before // interval
+        ):
+            print(f"LinkCache [{cache.namespace}]: {cache.stats}")
 
     @staticmethod
     def _pre_process(*inputs):
@@ -100,24 +161,35 @@ class FuseOp(BaseOp, ABC):
 
     bind_schemas: Dict[SPGTypeName, str] = {}
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, params: Dict[str, str] = None):
+        super().__init__(params)
+
+    @property
+    def link_cache(self) -> LinkCache:
+        return _link_cache(self)
 
     def link(self, subject_record: SPGRecord) -> SPGRecord:
         raise NotImplementedError(
             f"{self.__class__.__name__} need to implement `link` method."
         )
 
+    def link_batch(self, subject_records: List[SPGRecord]) -> List[SPGRecord]:
+        """Links a batch of records, by default `link` is called once per record.
+        Operators that can recall entities vectorially (e.g. one msearch request for
+        the whole batch) should override this method."""
+        return [self.link(record) for record in subject_records]
+
     def merge(self, subject_record: SPGRecord, linked_record: SPGRecord) -> SPGRecord:
         raise NotImplementedError(
             f"{self.__class__.__name__} need to implement `merge` method."
         )
 
     def invoke(self, subject_records: List[SPGRecord]) -> List[SPGRecord]:
+        cache = self.link_cache
         records = []
-        for record in subject_records:
-            cache_key = str(self.bind_to) + record.get_property("id", "")
-            linked_record = self.link(record)
+        linked_records = self.link_batch(subject_records)
+        for record, linked_record in zip(subject_records, linked_records):
+            cache_key = record.get_property("id", "")
             if not linked_record:
                 records.append(record)
                 continue
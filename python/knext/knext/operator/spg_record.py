@@ -11,6 +11,7 @@
 # or implied.
 
 import pprint
+import sys
 from typing import Dict, Any, List, Tuple
 from knext.common.schema_helper import (
     SPGTypeName,
@@ -19,13 +20,48 @@ from knext.common.schema_helper import (
 )
 
 
+_RELATION_KEYS: Dict[Tuple[str, str], str] = {}
+
+
+def _intern(name: str) -> str:
+    """Returns the interned plain string of a type/property name,
+    so that all records share one key object per schema name. None is kept as is."""
+    if name is None:
+        return None
+    return sys.intern(str(name))
+
+
+def _relation_key(relation_name: RelationName, object_type_name: SPGTypeName) -> str:
+    """Returns the cached `relation_name#object_type_name` key of a relation."""
+    key = _RELATION_KEYS.get((relation_name, object_type_name))
+    if key is None:
+        key = _intern(f"{relation_name}#{object_type_name}")
+        _RELATION_KEYS[(relation_name, object_type_name)] = key
+    return key
+
+
 class SPGRecord:
-    """Data structure in operator, used to store entity information."""
+    """Data structure in operator, used to store entity information.
+
+    Type and property names are interned, so that the many records of one job share
+    the same key objects, and relations are stored under cached `relation#object_type` keys.
+    """
+
+    __slots__ = ("_spg_type_name", "_properties", "_relations")
 
-    def __init__(self, spg_type_name: SPGTypeName):
-        self._spg_type_name = spg_type_name
+    def __init__(
+        self,
+        spg_type_name: SPGTypeName,
+        properties: Dict[PropertyName, str] = None,
+        relations: Dict[Tuple[RelationName, SPGTypeName], str] = None,
+    ):
+        self._spg_type_name = _intern(spg_type_name)
         self._properties = {}
         self._relations = {}
+        if properties:
+            self.upsert_properties(properties)
+        if relations:
+            self.upsert_relations(relations)
 
     @property
     def spg_type_name(self) -> SPGTypeName:
@@ -45,7 +81,7 @@ class SPGRecord:
         :param spg_type_name: The spg_type_name of this SPGRecord.  # noqa: E501
         :type: str
         """
-        self._spg_type_name = spg_type_name
+        self._spg_type_name = _intern(spg_type_name)
 
     @property
     def properties(self) -> Dict[PropertyName, str]:
@@ -98,7 +134,7 @@ class SPGRecord:
         :return: A property value.  # noqa: E501
         :rtype: str
         """
-        return self.properties.get(property_name, default_value)
+        return self._properties.get(property_name, default_value)
 
     def upsert_property(self, property_name: PropertyName, value: str):
         """Upsert a property of this SPGRecord.  # noqa: E501
@@ -108,7 +144,7 @@ class SPGRecord:
         :param value: The updated property value.  # noqa: E501
         :type: str
         """
-        self.properties[property_name] = value
+        self._properties[_intern(property_name)] = value
         return self
 
     def upsert_properties(self, properties: Dict[PropertyName, str]):
@@ -118,7 +154,9 @@ class SPGRecord:
         :param properties: The updated properties.  # noqa: E501
         :type: dict
         """
-        self.properties.update(properties)
+        self._properties.update(
+            {_intern(name): value for name, value in properties.items()}
+        )
         return self
 
     def remove_property(self, property_name: PropertyName):
@@ -128,7 +166,7 @@ class SPGRecord:
         :param property_name: The property name.  # noqa: E501
         :type: str
         """
-        self.properties.pop(property_name)
+        self._properties.pop(property_name)
         return self
 
     def remove_properties(self, property_names: List[PropertyName]):
@@ -139,7 +177,7 @@ class SPGRecord:
         :type: list
         """
         for property_name in property_names:
-            self.properties.pop(property_name)
+            self._properties.pop(property_name)
         return self
 
     def get_relation(
@@ -157,7 +195,9 @@ class SPGRecord:
         :return: A relation value.  # noqa: E501
         :rtype: str
         """
-        return self.relations.get(relation_name + "#" + object_type_name, default_value)
+        return self._relations.get(
+            _relation_key(relation_name, object_type_name), default_value
+        )
 
     def upsert_relation(
         self, relation_name: RelationName, object_type_name: SPGTypeName, value: str
@@ -170,7 +210,7 @@ class SPGRecord:
         :param value: The updated relation value.  # noqa: E501
         :type: str
         """
-        self.relations[relation_name + "#" + object_type_name] = value
+        self._relations[_relation_key(relation_name, object_type_name)] = value
         return self
 
     def upsert_relations(self, relations: Dict[Tuple[RelationName, SPGTypeName], str]):
@@ -181,7 +221,7 @@ class SPGRecord:
         :type: dict
         """
         for (relation_name, object_type_name), value in relations.items():
-            self.relations[relation_name + "#" + object_type_name] = value
+            self._relations[_relation_key(relation_name, object_type_name)] = value
         return self
 
     def remove_relation(
@@ -194,7 +234,7 @@ class SPGRecord:
         :param object_type_name: The object SPG type name.  # noqa: E501
         :type: str
         """
-        self.relations.pop(relation_name + "#" + object_type_name)
+        self._relations.pop(_relation_key(relation_name, object_type_name))
         return self
 
     def remove_relations(self, relation_names: List[Tuple[RelationName, SPGTypeName]]):
@@ -205,25 +245,23 @@ class SPGRecord:
         :type: list
         """
         for (relation_name, object_type_name) in relation_names:
-            self.relations.pop(relation_name + "#" + object_type_name)
+            self._relations.pop(_relation_key(relation_name, object_type_name))
         return self
 
     def to_str(self):
         """Returns the string representation of the model"""
-        return pprint.pformat(self.__dict__())
+        return pprint.pformat(self._to_repr_dict())
 
     def to_dict(self):
-        """Returns the model properties as a dict"""
-
+        """Returns the model properties as a dict, with a copy of the properties
+        and relations of the record."""
+        properties = {**self._properties, **self._relations}
         return {
-            "spgTypeName": self.spg_type_name,
-            "properties": {
-                **self.properties,
-                **self.relations,
-            },
+            "spgTypeName": self._spg_type_name,
+            "properties": properties,
         }
 
-    def __dict__(self):
+    def _to_repr_dict(self):
         """Returns this SPGRecord as a dict"""
         return {
             "spgTypeName": self.spg_type_name,
@@ -234,18 +272,26 @@ class SPGRecord:
     @classmethod
     def from_dict(cls, input: Dict[str, Any]):
         """Returns the model from a dict"""
-        spg_type_name = input.get("spgTypeName")
-        _cls = cls(spg_type_name)
-        properties = input.get("properties")
-        for k, v in properties.items():
+        _cls = cls.__new__(cls)
+        _cls._spg_type_name = _intern(input.get("spgTypeName"))
+        _cls._properties = {}
+        _cls._relations = {}
+        for k, v in input.get("properties").items():
             if "#" in k:
-                relation_name, object_type_name = k.split("#")
-                _cls.relations.update({relation_name + "#" + object_type_name: v})
+                _cls._relations[_intern(k)] = v
             else:
-                _cls.properties.update({k: v})
-
+                _cls._properties[_intern(k)] = v
         return _cls
 
+    def __getstate__(self):
+        return self._spg_type_name, self._properties, self._relations
+
+    def __setstate__(self, state):
+        spg_type_name, properties, relations = state
+        self._spg_type_name = _intern(spg_type_name)
+        self._properties = {_intern(k): v for k, v in properties.items()}
+        self._relations = {_intern(k): v for k, v in relations.items()}
+
     def __repr__(self):
         """For `print` and `pprint`"""
-        return pprint.pformat(self.__dict__())
+        return pprint.pformat(self._to_repr_dict())
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import multiprocessing
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Type
+
+from knext.operator.base import BaseOp
+from knext.operator.lifecycle import get_operator, operator_manager
+
+_worker_op: BaseOp = None
+
+
+def _init_worker(op_class: Type[BaseOp], params: Dict[str, str]):
+    global _worker_op
+    _worker_op = operator_manager.open(get_operator(op_class, params))
+
+
+def _handle_batch(batch_inputs: List[Sequence[Any]]) -> List[Dict[str, Any]]:
+    return _worker_op._handle_batch(batch_inputs)
+
+
+class OperatorWorkerPool:
+    """Runs an operator in a pool of worker processes.
+
+    One instance of `op_class` is created in each worker process, and inputs are sent to
+    the workers in batches of `batch_size` through `_handle_batch`, so that CPU-bound
+    operators are not limited to one core by the GIL. Outputs keep the order of inputs.
+
+    Examples:
+        with OperatorWorkerPool(DemoExtractOp, {"config": "1"}, processes=4) as pool:
+            for output in pool.handle((record,) for record in records):
+                ...
+    """
+
+    def __init__(
+        self,
+        op_class: Type[BaseOp],
+        params: Dict[str, str] = None,
+        processes: int = None,
+        batch_size: int = 64,
+    ):
+        self._batch_size = batch_size
+        self._pool = multiprocessing.Pool(
+            processes=processes, initializer=_init_worker, initargs=(op_class, params)
+        )
+
+    def handle(self, inputs: Iterable[Sequence[Any]]) -> Iterator[Dict[str, Any]]:
+        """Yields the `_handle` output of each argument tuple in `inputs`, in order."""
+        for outputs in self._pool.imap(_handle_batch, self._batches(inputs)):
+            yield from outputs
+
+    def _batches(
+        self, inputs: Iterable[Sequence[Any]]
+    ) -> Iterator[List[Sequence[Any]]]:
+        batch = []
+        for args in inputs:
+            batch.append(args)
+            if len(batch) >= self._batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._pool.terminate()
@@ -24,7 +24,7 @@ from __future__ import absolute_import
 
 import atexit
 import datetime
-import json
+import functools
 import mimetypes
 import os
 import re
@@ -41,6 +41,21 @@ from knext.rest import rest
 from knext.rest.configuration import Configuration
 from knext.rest.exceptions import ApiValueError, ApiException
 
+_model_fields_cache = {}
+
+
+def _model_fields(klass):
+    """Returns the (attribute name, json key, attribute type) of each attribute of
+    the model `klass`, which are reflected once per model class."""
+    fields = _model_fields_cache.get(klass)
+    if fields is None:
+        fields = [
+            (attr, klass.attribute_map[attr], attr_type)
+            for attr, attr_type in six.iteritems(klass.openapi_types)
+        ]
+        _model_fields_cache[klass] = fields
+    return fields
+
 
 class ApiClient(object):
     """Generic API client for OpenAPI client library builds.
@@ -98,6 +113,7 @@ class ApiClient(object):
         # Set default User-Agent.
         self.user_agent = "OpenAPI-Generator/1.0.0/python"
         self.client_side_validation = configuration.client_side_validation
+        self._decoders = {}
         self.url_prefix = "/public/v" + knext.rest.__version__
 
     def __enter__(self):
@@ -270,31 +286,24 @@ class ApiClient(object):
             return tuple(self.sanitize_for_serialization(sub_obj) for sub_obj in obj)
         elif isinstance(obj, (datetime.datetime, datetime.date)):
             return obj.isoformat()
-        # elif hasattr(obj, "__type_name__"):
-        #     return obj.__type_name__
 
         if isinstance(obj, dict):
-            obj_dict = obj
+            items = six.iteritems(obj)
         else:
-            # Convert model obj to dict except
-            # attributes `openapi_types`, `attribute_map`
-            # and attributes which value is not None.
-            # Convert attribute name to json key in
-            # model definition for request.
-            obj_dict = {
-                obj.attribute_map[attr]: getattr(obj, attr)
-                for attr, _ in six.iteritems(obj.openapi_types)
-                if getattr(obj, attr) is not None
-            }
+            # Convert model obj to dict of the attributes which value is not
+            # None, keyed by the json key in model definition for request.
+            items = [
+                (key, getattr(obj, attr)) for attr, key, _ in _model_fields(type(obj))
+            ]
             if obj.discriminator is not None:
-                obj_dict["@type"] = obj.discriminator
+                items.append(("@type", obj.discriminator))
 
-        obj_dict = {
-            key: self.sanitize_for_serialization(val)
-            for key, val in six.iteritems(obj_dict)
-            if val is not None
-        }
-        obj_dict = {key: val for key, val in six.iteritems(obj_dict) if val is not None}
+        obj_dict = {}
+        for key, val in items:
+            if val is not None:
+                val = self.sanitize_for_serialization(val)
+                if val is not None:
+                    obj_dict[key] = val
 
         return obj_dict if obj_dict else None
 
@@ -314,7 +323,7 @@ class ApiClient(object):
 
         # fetch data from response object
         try:
-            data = json.loads(response.data)
+            data = rest.json_loads(response.data)
         except ValueError:
             data = response.data
 
@@ -330,34 +339,58 @@ class ApiClient(object):
         """
         if data is None:
             return None
+        return self.__decoder(klass)(data)
+
+    def __decoder(self, klass):
+        """Returns the function deserializing data into `klass`, compiled once
+        per klass of this client.
+
+        :param klass: class literal, or string of class name.
+        :return: function of data.
+        """
+        decoder = self._decoders.get(klass)
+        if decoder is not None:
+            return decoder
 
         if type(klass) == str:
             if klass.startswith("list["):
                 sub_kls = re.match(r"list\[(.*)\]", klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls) for sub_data in data]
-
-            if klass.startswith("dict("):
+                decoder = self.__list_decoder(sub_kls)
+            elif klass.startswith("dict("):
                 sub_kls = re.match(r"dict\(([^,]*), (.*)\)", klass).group(2)
-                return {
-                    k: self.__deserialize(v, sub_kls) for k, v in six.iteritems(data)
-                }
-
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
+                decoder = self.__dict_decoder(sub_kls)
+            elif klass in self.NATIVE_TYPES_MAPPING:
+                decoder = self.__decoder(self.NATIVE_TYPES_MAPPING[klass])
             else:
-                klass = getattr(knext.rest.models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+                decoder = self.__decoder(getattr(knext.rest.models, klass))
+        elif klass in self.PRIMITIVE_TYPES:
+            decoder = functools.partial(self.__deserialize_primitive, klass=klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            decoder = self.__deserialize_object
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            decoder = self.__deserialize_date
         elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
+            decoder = self.__deserialize_datetime
         else:
-            return self.__deserialize_model(data, klass)
+            decoder = functools.partial(self.__deserialize_model, klass=klass)
+        self._decoders[klass] = decoder
+        return decoder
+
+    def __list_decoder(self, sub_kls):
+        sub_decoder = self.__decoder(sub_kls)
+        if sub_decoder == self.__deserialize_object:
+            return list
+        return lambda data: [
+            None if sub_data is None else sub_decoder(sub_data) for sub_data in data
+        ]
+
+    def __dict_decoder(self, sub_kls):
+        sub_decoder = self.__decoder(sub_kls)
+        if sub_decoder == self.__deserialize_object:
+            return dict
+        return lambda data: {
+            k: None if v is None else sub_decoder(v) for k, v in six.iteritems(data)
+        }
 
     def call_api(
         self,
@@ -750,12 +783,11 @@ class ApiClient(object):
             and klass.openapi_types is not None
             and isinstance(data, (list, dict))
         ):
-            for attr, attr_type in six.iteritems(klass.openapi_types):
-                if klass.attribute_map[attr] in data:
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self.__deserialize(value, attr_type)
+            for attr, key, attr_type in _model_fields(klass):
+                if key in data:
+                    kwargs[attr] = self.__deserialize(data[key], attr_type)
 
-        instance = klass(**kwargs)
+        instance = klass(local_vars_configuration=self.configuration, **kwargs)
 
         if has_discriminator:
             klass_name = instance.get_real_child_model(data)
@@ -0,0 +1,128 @@
+# coding: utf-8
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+"""
+    Asyncio variants of the generated apis.
+
+    Each `Async<Name>Api` has the same methods as `<Name>Api`, returning awaitables.
+    Requests run on a process-wide executor sized to the shared connection pool, so
+    hundreds of requests can be awaited together without opening more connections
+    than `Configuration.connection_pool_maxsize`.
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from knext.rest.api.builder_api import BuilderApi
+from knext.rest.api.concept_api import ConceptApi
+from knext.rest.api.editor_api import EditorApi
+from knext.rest.api.object_store_api import ObjectStoreApi
+from knext.rest.api.operator_api import OperatorApi
+from knext.rest.api.project_api import ProjectApi
+from knext.rest.api.reasoner_api import ReasonerApi
+from knext.rest.api.schema_api import SchemaApi
+from knext.rest.api.table_store_api import TableStoreApi
+from knext.rest.exceptions import ApiValueError
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _shared_executor(max_workers):
+    """Returns the executor of `max_workers` threads shared by all async apis of this
+    process, creating it on first use."""
+    with _executors_lock:
+        if max_workers not in _executors:
+            _executors[max_workers] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="knext-rest"
+            )
+        return _executors[max_workers]
+
+
+class AsyncApi(object):
+    """Wraps a generated api, whose public methods return awaitables.
+
+    :param api_client: the `ApiClient` of the wrapped api, a new one if None.
+    :param max_workers: the number of requests running at the same time, defaults to
+        the connection pool size of the api client.
+    """
+
+    api_class = None
+
+    def __init__(self, api_client=None, max_workers=None):
+        self.api = self.api_class(api_client)
+        self.api_client = self.api.api_client
+        if max_workers is None:
+            max_workers = self.api_client.configuration.connection_pool_maxsize
+        self._executor = _shared_executor(max_workers or 1)
+
+    def __getattr__(self, name):
+        if "api" not in self.__dict__:
+            # not initialized yet, like while being copied or unpickled
+            raise AttributeError(name)
+        method = getattr(self.api, name)
+        if name.startswith("_") or not callable(method):
+            return method
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            if kwargs.get("async_req"):
+                raise ApiValueError(
+                    f"Got an unexpected parameter `async_req` in async method {name}"
+                )
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(method, *args, **kwargs)
+            )
+
+        self.__dict__[name] = call
+        return call
+
+
+class AsyncBuilderApi(AsyncApi):
+    api_class = BuilderApi
+
+
+class AsyncConceptApi(AsyncApi):
+    api_class = ConceptApi
+
+
+class AsyncEditorApi(AsyncApi):
+    api_class = EditorApi
+
+
+class AsyncObjectStoreApi(AsyncApi):
+    api_class = ObjectStoreApi
+
+
+class AsyncOperatorApi(AsyncApi):
+    api_class = OperatorApi
+
+
+class AsyncProjectApi(AsyncApi):
+    api_class = ProjectApi
+
+
+class AsyncReasonerApi(AsyncApi):
+    api_class = ReasonerApi
+
+
+class AsyncSchemaApi(AsyncApi):
+    api_class = SchemaApi
+
+
+class AsyncTableStoreApi(AsyncApi):
+    api_class = TableStoreApi
@@ -144,12 +144,32 @@ class Configuration(object):
         """Set this to True/False to enable/disable SSL hostname verification.
         """
 
-        self.connection_pool_maxsize = multiprocessing.cpu_count() * 5
+        self.connection_pool_maxsize = int(
+            os.environ.get("KNEXT_HTTP_POOL_MAXSIZE", multiprocessing.cpu_count() * 5)
+        )
         """urllib3 connection pool's maximum number of connections saved
            per pool. urllib3 uses 1 connection as default value, but this is
            not the best value when you are making a lot of possibly parallel
            requests to the same host, which is often the case here.
            cpu_count * 5 is used as default value to increase performance.
+           The pool is shared by all API clients with the same settings.
+        """
+        self.connection_pool_block = (
+            os.environ.get("KNEXT_HTTP_POOL_BLOCK", "false").lower() == "true"
+        )
+        """Wait for a free connection instead of opening a connection that is
+           discarded after use, when all `connection_pool_maxsize` ones are busy.
+        """
+        self.accept_gzip = (
+            os.environ.get("KNEXT_HTTP_ACCEPT_GZIP", "true").lower() == "true"
+        )
+        """Ask the server for gzip compressed responses
+        """
+        gzip_request_min_size = os.environ.get("KNEXT_HTTP_GZIP_REQUEST_MIN_SIZE")
+        self.gzip_request_min_size = (
+            int(gzip_request_min_size) if gzip_request_min_size else None
+        )
+        """Gzip json request bodies of at least this many bytes, disabled if None
         """
 
         self.proxy = None
@@ -161,8 +181,14 @@ class Configuration(object):
         self.safe_chars_for_path_param = ""
         """Safe chars for path_param
         """
-        self.retries = None
-        """Adding retries to override urllib3 default value 3
+        self.retries = urllib3.Retry(
+            total=int(os.environ.get("KNEXT_HTTP_RETRIES", 3)),
+            backoff_factor=float(os.environ.get("KNEXT_HTTP_RETRY_BACKOFF", 0.2)),
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        )
+        """Adding retries to override urllib3 default value 3, idempotent requests
+           are retried with exponential backoff on connection errors and 502/503/504
         """
         # Disable client side validation
         self.client_side_validation = True
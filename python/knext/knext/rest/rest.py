@@ -23,11 +23,14 @@
 
 from __future__ import absolute_import
 
+import gzip
 import io
 import json
 import logging
 import re
 import ssl
+import threading
+import time
 
 import certifi
 
@@ -38,8 +41,87 @@ from six.moves.urllib.parse import urlencode
 
 from knext.rest.exceptions import ApiException, ApiValueError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_pool_managers = {}
+_pool_managers_lock = threading.Lock()
+
+
+class RequestStats(object):
+    """Latency counters of the requests sent to one endpoint."""
+
+    __slots__ = ("count", "errors", "total_time", "max_time")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    @property
+    def avg_time(self):
+        return self.total_time / self.count if self.count else 0.0
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_time": round(self.avg_time, 6),
+            "max_time": round(self.max_time, 6),
+        }
+
+
+_request_stats = {}
+_request_stats_lock = threading.Lock()
+
+
+def request_stats():
+    """Returns the latency counters of all endpoints requested by this process,
+    keyed by `METHOD path`."""
+    with _request_stats_lock:
+        return {endpoint: stats.to_dict() for endpoint, stats in _request_stats.items()}
+
+
+def _record_request(method, url, elapsed, failed):
+    path = urllib3.util.parse_url(url).path
+    endpoint = "{0} {1}".format(method, path)
+    with _request_stats_lock:
+        stats = _request_stats.get(endpoint)
+        if stats is None:
+            stats = _request_stats[endpoint] = RequestStats()
+        stats.count += 1
+        stats.errors += int(failed)
+        stats.total_time += elapsed
+        stats.max_time = max(stats.max_time, elapsed)
+
+
+def json_dumps(obj):
+    """Serializes obj to a json string, with orjson if it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj)
+
+
+def json_loads(data):
+    """Deserializes a json string or bytes, with orjson if it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _shared_pool_manager(key, factory):
+    """Returns the pool manager of `key` shared by all clients of this process,
+    so that connections are kept alive across API instances."""
+    with _pool_managers_lock:
+        if key not in _pool_managers:
+            _pool_managers[key] = factory()
+        return _pool_managers[key]
+
 
 class RESTResponse(io.IOBase):
     def __init__(self, resp):
@@ -58,7 +140,7 @@ class RESTResponse(io.IOBase):
 
 
 class RESTClientObject(object):
-    def __init__(self, configuration, pools_size=4, maxsize=None):
+    def __init__(self, configuration, pools_size=10, maxsize=None):
         # urllib3.PoolManager will pass all kw parameters to connectionpool
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
@@ -93,11 +175,15 @@ class RESTClientObject(object):
             else:
                 maxsize = 4
 
+        self.accept_gzip = configuration.accept_gzip
+        self.gzip_request_min_size = configuration.gzip_request_min_size
+
         # https pool manager
         if configuration.proxy:
-            self.pool_manager = urllib3.ProxyManager(
+            factory = lambda: urllib3.ProxyManager(
                 num_pools=pools_size,
                 maxsize=maxsize,
+                block=configuration.connection_pool_block,
                 cert_reqs=cert_reqs,
                 ca_certs=ca_certs,
                 cert_file=configuration.cert_file,
@@ -107,15 +193,29 @@ class RESTClientObject(object):
                 **addition_pool_args
             )
         else:
-            self.pool_manager = urllib3.PoolManager(
+            factory = lambda: urllib3.PoolManager(
                 num_pools=pools_size,
                 maxsize=maxsize,
+                block=configuration.connection_pool_block,
                 cert_reqs=cert_reqs,
                 ca_certs=ca_certs,
                 cert_file=configuration.cert_file,
                 key_file=configuration.key_file,
                 **addition_pool_args
             )
+        key = (
+            pools_size,
+            maxsize,
+            configuration.connection_pool_block,
+            cert_reqs,
+            ca_certs,
+            configuration.cert_file,
+            configuration.key_file,
+            configuration.proxy,
+            repr(sorted((configuration.proxy_headers or {}).items())),
+            repr(sorted(addition_pool_args.items())),
+        )
+        self.pool_manager = _shared_pool_manager(key, factory)
 
     def request(
         self,
@@ -170,7 +270,11 @@ class RESTClientObject(object):
 
         if "Content-Type" not in headers:
             headers["Content-Type"] = "application/json"
+        if self.accept_gzip and "Accept-Encoding" not in headers:
+            headers["Accept-Encoding"] = "gzip"
 
+        start = time.perf_counter()
+        failed = True
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
             if method in ["POST", "PUT", "PATCH", "OPTIONS", "DELETE"]:
@@ -179,7 +283,7 @@ class RESTClientObject(object):
                 if re.search("json", headers["Content-Type"], re.IGNORECASE):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = self._encode_body(json_dumps(body), headers)
                     r = self.pool_manager.request(
                         method,
                         url,
@@ -243,9 +347,12 @@ class RESTClientObject(object):
                     timeout=timeout,
                     headers=headers,
                 )
+            failed = not 200 <= r.status <= 299
         except urllib3.exceptions.SSLError as e:
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
             raise ApiException(status=0, reason=msg)
+        finally:
+            _record_request(method, url, time.perf_counter() - start, failed)
 
         if _preload_content:
             r = RESTResponse(r)
@@ -258,6 +365,16 @@ class RESTClientObject(object):
 
         return r
 
+    def _encode_body(self, request_body, headers):
+        """Gzips json bodies of at least `gzip_request_min_size` bytes, if enabled."""
+        if self.gzip_request_min_size is None:
+            return request_body
+        data = request_body.encode("utf-8")
+        if len(data) < self.gzip_request_min_size:
+            return request_body
+        headers["Content-Encoding"] = "gzip"
+        return gzip.compress(data)
+
     def GET(
         self,
         url,
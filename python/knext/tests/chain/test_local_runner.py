@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import json
+import os
+import tempfile
+import unittest
+
+from knext.api.chain import BuilderChain
+from knext.api.component import CSVReader, UserDefinedExtractor, KGWriter
+from knext.api.operator import ExtractOp
+from knext.api.record import SPGRecord
+from knext.chain.local_runner import LocalBuilderRunner
+
+
+class _CompanyExtractOp(ExtractOp):
+    def invoke(self, record):
+        return [SPGRecord("Company", {"id": record["id"], "name": record["name"]})]
+
+
+class _DictExtractOp(ExtractOp):
+    def invoke(self, record):
+        return [{"id": record["id"], "name": record["name"]}]
+
+
+class TestLocalBuilderRunner(unittest.TestCase):
+    """LocalBuilderRunner unit test"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.work_dir, "company.csv")
+        with open(self.csv_path, "w") as writer:
+            writer.write("id,name\n1,alipay\n2,taobao\n1,ant\n")
+        self.chain = BuilderChain.from_chain(
+            CSVReader(local_path=self.csv_path, columns=["id", "name"], start_row=2)
+            >> UserDefinedExtractor(extract_op=_CompanyExtractOp())
+            >> KGWriter()
+        )
+
+    def testMemorySink(self):
+        runner = LocalBuilderRunner()
+        sink = runner.run(self.chain)
+        self.assertEqual(len(sink.records), 2)
+        self.assertEqual(sink.get("Company", "1").get_property("name"), "ant")
+        self.assertEqual(runner.stats["KGWriter"], 3)
+
+    def testParallelism(self):
+        runner = LocalBuilderRunner(parallelism=2, batch_size=2)
+        sink = runner.run(self.chain)
+        self.assertEqual(len(sink.records), 2)
+        self.assertEqual(sink.get("Company", "1").get_property("name"), "ant")
+        self.assertEqual(runner.stats["UserDefinedExtractor"], 3)
+
+    def testSerialOutputType(self):
+        runner = LocalBuilderRunner()
+        extractor = UserDefinedExtractor(extract_op=_DictExtractOp())
+        outputs = runner._invoke(extractor, [{"id": "1", "name": "ant"}])
+        self.assertIsInstance(outputs[0], SPGRecord)
+        self.assertEqual(outputs[0].get_property("name"), "ant")
+
+    def testJSONLSink(self):
+        path = os.path.join(self.work_dir, "output.jsonl")
+        self.chain.invoke(local=True, sink=f"jsonl:{path}")
+        with open(path) as reader:
+            records = [json.loads(line) for line in reader]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[1]["properties"]["name"], "taobao")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from knext.client.marklang import concept_rule_ml
+from knext.client.marklang.concept_rule_ml import SPGConceptRuleMarkLang
+
+RULE = """    rule: [[
+        Define (e:Event)-[p:belongTo]->(o:`Taxo`/`{name}`) {{
+            Structure {{
+            }}
+        }}
+    ]]
+"""
+
+
+class _StubSchemaClient:
+    def create_session(self):
+        return mock.Mock(_project_id="1")
+
+
+class _StubConceptApi:
+    def __init__(self):
+        self.posted = []
+        self.failures = set()
+        self.api_client = concept_rule_ml.rest.ConceptApi().api_client
+
+    def concept_define_dynamic_taxonomy_post(self, define_dynamic_taxonomy_request):
+        if define_dynamic_taxonomy_request.concept_name in self.failures:
+            raise RuntimeError("server error")
+        self.posted.append(define_dynamic_taxonomy_request.concept_name)
+
+
+class TestSPGConceptRuleMarkLang(unittest.TestCase):
+    """SPGConceptRuleMarkLang unit test"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.work_dir, "concept.rule")
+        self.api = _StubConceptApi()
+        patches = [
+            mock.patch.object(concept_rule_ml, "SchemaClient", _StubSchemaClient),
+            mock.patch.object(concept_rule_ml.rest, "ConceptApi", lambda: self.api),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _write(self, *names, extra: str = ""):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("namespace Test\n\n")
+            for name in names:
+                file.write(f"`Taxo`/`{name}`:\n" + RULE.format(name=name) + "\n")
+            file.write(extra)
+
+    def testParseErrors(self):
+        self._write(
+            "Up",
+            extra="`Taxo/`Bad`:\n"
+            + RULE.format(name="Bad")
+            + "`Taxo`/`Down`:\n    desc: not a rule\n",
+        )
+        with self.assertRaises(AssertionError) as context:
+            SPGConceptRuleMarkLang(self.path)
+        errors = str(context.exception).split("\n")
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(errors[0].startswith("Line# 11: parse error"))
+        self.assertTrue(errors[1].startswith("Line# 19: parse error, expect rule:"))
+        self.assertEqual(self.api.posted, [])
+
+    def testSkipUnchangedAndForce(self):
+        self._write("Up", "Down")
+        SPGConceptRuleMarkLang(self.path)
+        self.assertEqual(sorted(self.api.posted), ["Down", "Up"])
+
+        self.api.posted.clear()
+        SPGConceptRuleMarkLang(self.path)
+        self.assertEqual(self.api.posted, [])
+
+        SPGConceptRuleMarkLang(self.path, force=True)
+        self.assertEqual(sorted(self.api.posted), ["Down", "Up"])
+
+    def testResumeAfterFailure(self):
+        self._write("Up", "Down", "Flat")
+        self.api.failures.add("Down")
+        with self.assertRaises(Exception) as context:
+            SPGConceptRuleMarkLang(self.path, parallelism=1)
+        self.assertIn("Failed to submit 1 rules", str(context.exception))
+        self.assertEqual(sorted(self.api.posted), ["Flat", "Up"])
+
+        self.api.posted.clear()
+        self.api.failures.clear()
+        SPGConceptRuleMarkLang(self.path)
+        self.assertEqual(self.api.posted, ["Down"])
+
+    def testCorruptManifest(self):
+        self._write("Up")
+        with open(f"{self.path}.manifest", "w") as file:
+            file.write('{"project_id": "1", "rules": {')
+        SPGConceptRuleMarkLang(self.path)
+        self.assertEqual(self.api.posted, ["Up"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from knext.client import local_search
+from knext.client.local_search import LocalIndex, LocalSearchClient
+from knext.client.search import SearchClient
+from knext.operator.spg_record import SPGRecord
+
+
+class TestLocalSearchClient(unittest.TestCase):
+    """LocalSearchClient unit test"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.url = f"local://{self.work_dir}"
+        self.client = SearchClient("Test.Company", self.url)
+        path = os.path.join(self.work_dir, "company.jsonl")
+        with open(path, "w") as writer:
+            for id, name in [("1", "Ant Group"), ("2", "Alipay"), ("3", "蚂蚁集团")]:
+                record = SPGRecord("Test.Company", {"id": id, "name": name})
+                writer.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+            writer.write(json.dumps({"spgTypeName": "Test.Person", "properties": {}}))
+        self.assertEqual(self.client.load_jsonl(path), 3)
+
+    def testSearch(self):
+        self.assertIsInstance(self.client, LocalSearchClient)
+        records = self.client.fuzzy_search_by_property("ant group co", "name")
+        self.assertEqual(records[0].get_property("id"), "1")
+        records = self.client.fuzzy_search_by_property("蚂蚁", "name")
+        self.assertEqual([record.get_property("id") for record in records], ["3"])
+        hits = self.client.search(
+            {"bool": {"should": [{"match": {"name": "alipay"}}]}},
+            filter={"term": {"id": "2"}},
+        )
+        self.assertEqual([hit.doc_id for hit in hits], ["2"])
+
+    def testExactSearch(self):
+        record = self.client.exact_search_by_property("Alipay", "name")
+        self.assertEqual(record.get_property("id"), "2")
+        self.assertIsNone(self.client.exact_search_by_property("alipay", "name"))
+        self.client.add_records([SPGRecord("Test.Company", {"id": "2", "name": "Ali"})])
+        self.assertIsNone(self.client.exact_search_by_property("Alipay", "name"))
+        records = [SPGRecord("Test.Company", {"name": "Ali"})]
+        records = self.client.exact_search_batch(records, "name")
+        self.assertEqual(records[0].get_property("id"), "2")
+
+    def testSave(self):
+        self.client.save()
+        client = LocalSearchClient("Test.Company", self.url)
+        self.assertIs(client.index, self.client.index)
+        path = os.path.join(self.work_dir, "Test.Company.idx")
+        index = LocalIndex("Test.Company", path)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.search({"match": {"name": "group"}})[0].doc_id, "1")
+
+    def testEnvUrl(self):
+        self.client.save()
+        # as in a new process, which loads the saved index
+        local_search._local_indexes.clear()
+        env = {"KNEXT_SEARCH_ENGINE_URL": self.url}
+        with mock.patch.dict(os.environ, env):
+            client = SearchClient("Test.Company")
+        self.assertIsInstance(client, LocalSearchClient)
+        self.assertEqual(
+            client.index.path, os.path.join(self.work_dir, "Test.Company.idx")
+        )
+        self.assertEqual(len(client.index), 3)
+        record = client.exact_search_by_property("Alipay", "name")
+        self.assertEqual(record.get_property("id"), "2")
+        with mock.patch.dict(os.environ, {"KNEXT_SEARCH_ENGINE_URL": "http://es:9200"}):
+            client = LocalSearchClient("Test.Company")
+        self.assertIsNone(client.index.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from knext import rest
+from knext.client import schema
+from knext.client.schema import SchemaClient
+
+
+class _StubSchemaApi:
+    def __init__(self):
+        self.api_client = rest.SchemaApi().api_client
+        self.desc = "v1"
+        self.queries = 0
+
+    def schema_query_project_schema_get(self, project_id):
+        self.queries += 1
+        name = {"identityType": "SPG_TYPE", "namespace": "Test", "nameEn": "Company"}
+        basic_info = {"name": name, "desc": self.desc}
+        data = {"spgTypes": [{"basicInfo": basic_info, "spgTypeEnum": "ENTITY_TYPE"}]}
+        return self.api_client.deserialize(
+            SimpleNamespace(data=json.dumps(data)), "ProjectSchema"
+        )
+
+
+def _desc(project_schema):
+    return project_schema.spg_types[0].basic_info.desc
+
+
+class TestSchemaClient(unittest.TestCase):
+    """SchemaClient project schema cache unit test"""
+
+    def setUp(self):
+        self.rest_client = SchemaClient._rest_client
+        self.stub = _StubSchemaApi()
+        SchemaClient._rest_client = self.stub
+        self.environ = dict(os.environ)
+        os.environ["KNEXT_SCHEMA_SNAPSHOT_DIR"] = tempfile.mkdtemp()
+        self.client = SchemaClient(project_id=9001)
+
+    def tearDown(self):
+        SchemaClient._rest_client = self.rest_client
+        schema._project_schemas.clear()
+        os.environ.clear()
+        os.environ.update(self.environ)
+
+    def testCachedByVersion(self):
+        self.assertEqual(_desc(self.client.query_project_schema()), "v1")
+        self.assertEqual(_desc(self.client.query_project_schema()), "v1")
+        self.assertEqual(self.stub.queries, 1)
+        version = os.environ["KNEXT_SCHEMA_VERSION_9001"]
+
+        # A worker process inherits the version and loads the snapshot of it.
+        schema._project_schemas.clear()
+        self.assertEqual(_desc(self.client.query_project_schema()), "v1")
+        self.assertEqual(self.stub.queries, 1)
+
+        # A new process has no version, so it sees the changed server schema.
+        schema._project_schemas.clear()
+        os.environ.pop("KNEXT_SCHEMA_VERSION_9001")
+        self.stub.desc = "v2"
+        self.assertEqual(_desc(self.client.query_project_schema()), "v2")
+        self.assertEqual(self.stub.queries, 2)
+        self.assertNotEqual(os.environ["KNEXT_SCHEMA_VERSION_9001"], version)
+
+    def testRefreshAndInvalidate(self):
+        self.client.query_project_schema()
+        self.stub.desc = "v2"
+        session = self.client.create_session(refresh=True)
+        self.assertEqual(self.stub.queries, 2)
+        self.assertEqual(session.spg_type_names, ["Test.Company"])
+        self.assertEqual(_desc(self.client.query_project_schema()), "v2")
+
+        version = os.environ["KNEXT_SCHEMA_VERSION_9001"]
+        self.client.invalidate_project_schema()
+        self.assertNotIn("KNEXT_SCHEMA_VERSION_9001", os.environ)
+        snapshots = os.listdir(os.environ["KNEXT_SCHEMA_SNAPSHOT_DIR"])
+        self.assertNotIn(f"schema_9001_{version}.json", snapshots)
+        self.client.query_project_schema()
+        self.assertEqual(self.stub.queries, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
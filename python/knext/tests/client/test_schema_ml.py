@@ -0,0 +1,195 @@
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import copy
+import glob
+import os
+import re
+import tempfile
+import unittest
+
+from click.testing import CliRunner
+
+import knext
+from knext.client.marklang.schema_ml import (
+    BUILTIN_BASIC_TYPES,
+    BUILTIN_STANDARD_TYPES,
+    SPGSchemaMarkLang,
+)
+from knext.command.knext_cli import _main
+
+SERVER_SCHEMA = """namespace Test
+
+Company(公司): EntityType
+    properties:
+        address(地址): Text
+        revenue(营收): Float
+
+Person(人物): EntityType
+    properties:
+        age(年龄): Integer
+
+Obsolete(废弃): EntityType
+"""
+
+SCRIPT_SCHEMA = """namespace Test
+
+Company(公司): EntityType
+    properties:
+        address(地址): Text
+        revenue(营收): Integer
+        phone(电话): Text
+
+Person(人物): EntityType
+    properties:
+        age(年龄): Integer
+
+Product(产品): EntityType
+    properties:
+        price(价格): Float
+"""
+
+
+class _StubSession:
+    """Schema session over the types of a parsed script, recording the alterations."""
+
+    def __init__(self, types):
+        self.types = copy.deepcopy(types)
+        self.created, self.deleted, self.updated = [], [], []
+
+    @property
+    def spg_type_names(self):
+        return list(self.types)
+
+    def get(self, spg_type_name):
+        return self.types[spg_type_name]
+
+    def create_type(self, spg_type):
+        self.created.append(spg_type.name)
+
+    def delete_type(self, spg_type):
+        self.deleted.append(spg_type.name)
+
+    def update_type(self, spg_type):
+        self.updated.append(spg_type.name)
+
+
+class TestSPGSchemaMarkLang(unittest.TestCase):
+    """SPGSchemaMarkLang unit test"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+
+    def _parse(self, content: str) -> SPGSchemaMarkLang:
+        path = os.path.join(self.work_dir, "test.schema")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return SPGSchemaMarkLang(path, offline=True)
+
+    def testDiffPlan(self):
+        session = _StubSession(self._parse(SERVER_SCHEMA).types)
+        messages = self._parse(SCRIPT_SCHEMA).diff(session)
+        self.assertEqual(
+            messages,
+            [
+                "Delete type: Test.Obsolete",
+                "Create type: Test.Product",
+                "Recreate property: [Test.Company] revenue",
+                "Create property: [Test.Company] phone",
+            ],
+        )
+        self.assertEqual(session.deleted, ["Test.Obsolete"])
+        self.assertEqual(session.created, ["Test.Product"])
+        self.assertEqual(session.updated, ["Test.Company"])
+
+    def testDiffSkipsUnchangedTypes(self):
+        ml = self._parse(SCRIPT_SCHEMA)
+        compared = []
+        get_inherited_type = ml.get_inherited_type
+
+        def compare(type_name):
+            # only called for the types whose subtrees are compared
+            compared.append(type_name)
+            return get_inherited_type(type_name)
+
+        ml.get_inherited_type = compare
+        session = _StubSession(self._parse(SERVER_SCHEMA).types)
+        ml.diff(session)
+        self.assertEqual(compared, ["Test.Company"])
+
+        compared.clear()
+        session = _StubSession(ml.types)
+        self.assertEqual(ml.diff(session), [])
+        self.assertEqual(session.updated, [])
+        self.assertEqual(compared, [])
+
+    def testErrorColumns(self):
+        script = SERVER_SCHEMA.replace("Integer", "Integr").replace(
+            "Obsolete(废弃): EntityType", "Obsolete(废弃): EntityTyp"
+        )
+        with self.assertRaises(AssertionError) as context:
+            self._parse(script)
+        errors = str(context.exception).split("\n")
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(errors[0].startswith("Line# 10, Column# 18: Integr is illegal"))
+        self.assertTrue(
+            errors[1].startswith("Line# 12, Column# 15: EntityTyp is illegal")
+        )
+
+    def testParseExamplesOffline(self):
+        examples_dir = os.path.join(os.path.dirname(knext.__file__), "examples")
+        schema_files = glob.glob(os.path.join(examples_dir, "*", "schema", "*.schema"))
+        self.assertTrue(schema_files)
+        for schema_file in schema_files:
+            ml = SPGSchemaMarkLang(schema_file, offline=True)
+            self.assertTrue(ml.types, schema_file)
+            self.assertEqual(ml.errors, [])
+
+    def testBuiltinTypesMatchServer(self):
+        init_sql = os.path.join(
+            os.path.dirname(knext.__file__),
+            "../../../dev/release/mysql/sql/initdb.sql",
+        )
+        if not os.path.exists(init_sql):
+            self.skipTest("initdb.sql of the server is not available")
+        with open(init_sql, encoding="utf-8") as file:
+            seeded = re.findall(
+                r"INSERT INTO kg_ontology_entity .*? VALUES\(\d+,\d+,'([^']+)','[^']*',"
+                r"'(BASIC|STANDARD)'",
+                file.read(),
+            )
+        self.assertEqual(
+            {name for name, category in seeded if category == "BASIC"},
+            BUILTIN_BASIC_TYPES,
+        )
+        self.assertEqual(
+            {name for name, category in seeded if category == "STANDARD"},
+            BUILTIN_STANDARD_TYPES,
+        )
+
+    def testValidateCommand(self):
+        path = os.path.join(self.work_dir, "test.schema")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(SERVER_SCHEMA.replace("age(年龄): Integer", "boss(老板): Boss"))
+        env = {
+            "KNEXT_ROOT_PATH": self.work_dir,
+            "KNEXT_SCHEMA_DIR": "schema",
+            "KNEXT_PROJECT_DIR": "test",
+        }
+        result = CliRunner().invoke(
+            _main, ["schema", "validate", "--file", path], env=env
+        )
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("Line# 10, Column# 19: Boss is illegal", result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import unittest
+
+from knext.client import search
+from knext.client.search import SearchClient
+from knext.operator.spg_record import SPGRecord
+
+
+class _StubElasticsearch:
+    def __init__(self, documents):
+        self.documents = documents
+        self.requests = []
+
+    def msearch(self, searches):
+        self.requests.append(searches)
+        responses = []
+        for header, body in zip(searches[::2], searches[1::2]):
+            ((name, value),) = body["query"]["match"].items()
+            if value == "error":
+                responses.append(
+                    {"error": {"type": "search_phase_execution_exception"}}
+                )
+                continue
+            hits = [
+                {"_index": header["index"], "_id": id, "_score": 1.0, "_source": doc}
+                for id, doc in self.documents.items()
+                if value.lower() in doc.get(name, "").lower()
+            ]
+            responses.append({"hits": {"hits": hits[: body["size"]]}})
+        return {"responses": responses}
+
+
+class TestSearchClient(unittest.TestCase):
+    """SearchClient batch search unit test"""
+
+    def setUp(self):
+        self.url = "http://stub-search:9200"
+        self.es = _StubElasticsearch(
+            {"1": {"name": "Ant Group"}, "2": {"name": "Alipay"}}
+        )
+        search._es_clients[self.url] = self.es
+        search._index_names["Test.Company"] = "test_company"
+        self.client = SearchClient("Test.Company", self.url)
+
+    def tearDown(self):
+        search._es_clients.pop(self.url)
+        search._index_names.pop("Test.Company")
+
+    def testSearchBatchChunks(self):
+        self.client.msearch_size = 2
+        queries = [{"match": {"name": name}} for name in ["ant", "ali", "x"]]
+        results = self.client.search_batch(queries[:1] + [None] + queries[1:])
+        self.assertEqual(len(self.es.requests), 2)
+        self.assertEqual([len(r) for r in self.es.requests], [4, 2])
+        self.assertEqual([hit.doc_id for hit in results[0]], ["1"])
+        self.assertIsNone(results[1])
+        self.assertEqual([hit.doc_id for hit in results[2]], ["2"])
+        self.assertEqual(results[3], [])
+
+    def testExactSearchBatch(self):
+        records = [
+            SPGRecord("Test.Company", {"name": name}) for name in ["Alipay", "ali", ""]
+        ]
+        linked = self.client.exact_search_batch(records, "name")
+        self.assertEqual(linked[0].get_property("id"), "2")
+        self.assertEqual(linked[1:], [None, None])
+        self.assertEqual(len(self.es.requests[0]), 4)
+
+    def testSearchBatchError(self):
+        with self.assertRaises(RuntimeError):
+            self.client.search_batch([{"match": {"name": "error"}}])
+
+
+if __name__ == "__main__":
+    unittest.main()
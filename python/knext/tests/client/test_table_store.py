@@ -0,0 +1,93 @@
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from knext.client.table_store import TableStoreClient
+
+
+class _StubResponse(io.BytesIO):
+    """A streaming response of urllib3, reading the table in small chunks."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.released = False
+
+    def stream(self, chunk_size):
+        while True:
+            chunk = self.read(min(chunk_size, 4))
+            if not chunk:
+                break
+            yield chunk
+
+    def release_conn(self):
+        self.released = True
+
+
+class _StubTableStoreApi:
+    def __init__(self, tables):
+        self.tables = tables
+        self.responses = []
+
+    def table_store_download_get(self, file_name, _preload_content=True):
+        assert _preload_content is False
+        response = _StubResponse(self.tables[file_name].encode("utf-8"))
+        self.responses.append(response)
+        return response
+
+
+class TestTableStoreClient(unittest.TestCase):
+    """TableStoreClient unit test"""
+
+    def setUp(self):
+        self.api = _StubTableStoreApi(
+            {
+                "result.csv": 'id,name,score\n1,"Ant, Group",0.5\n2,Alipay\n3,蚂蚁,1\n',
+                "empty.csv": "",
+            }
+        )
+        self.client = TableStoreClient(host_addr="http://127.0.0.1:8887")
+        self.client._rest_client = self.api
+
+    def testIterBatches(self):
+        batches = list(self.client.iter_batches("result.csv", batch_size=2))
+        self.assertEqual(
+            batches,
+            [
+                {
+                    "id": ["1", "2"],
+                    "name": ["Ant, Group", "Alipay"],
+                    "score": ["0.5", None],
+                },
+                {"id": ["3"], "name": ["蚂蚁"], "score": ["1"]},
+            ],
+        )
+        self.assertEqual(list(self.client.iter_batches("empty.csv")), [])
+        self.assertTrue(all(response.released for response in self.api.responses))
+
+    def testDownload(self):
+        work_dir = tempfile.mkdtemp()
+        path = self.client.download("result.csv", os.path.join(work_dir, "a.csv"))
+        with open(path, encoding="utf-8") as file:
+            self.assertEqual(file.read(), self.api.tables["result.csv"])
+        path = self.client.download("result.csv", os.path.join(work_dir, "a.jsonl"))
+        with open(path, encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+        self.assertEqual(records[0], {"id": "1", "name": "Ant, Group", "score": "0.5"})
+        self.assertEqual(len(records), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import os
+
+from knext.common.cache import LinkCache, NEGATIVE, PromptCache, get_link_cache
+
+
+def test_link_cache_stats():
+    cache = LinkCache(maxsize=2, ttl=60)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.put("c", "3")
+    assert cache.get("c") == "3"
+    assert cache.get("x") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.evictions == 1
+
+
+def test_link_cache_negative():
+    cache = LinkCache(maxsize=10, ttl=60, negative_ttl=60)
+    cache.put_miss("a")
+    assert cache.lookup("a") == NEGATIVE
+    assert cache.get("a") is None
+    assert cache.stats.negative_hits == 2
+    cache.put("a", "1")
+    assert cache.get("a") == "1"
+
+
+def test_link_cache_stats_threads(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = LinkCache(
+        maxsize=100,
+        ttl=60,
+        negative_ttl=60,
+        disk_path=os.path.join(tmp_path, "link_cache.db"),
+    )
+    cache.put("a", "1")
+    cache.put_miss("b")
+
+    def lookup(i):
+        for key in ("a", "b", f"x{i}"):
+            cache.lookup(key)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lookup, range(200)))
+    assert cache.stats.hits == 200
+    assert cache.stats.negative_hits == 200
+    assert cache.stats.misses == 200
+    assert cache.stats.lookups == 600
+
+
+def test_link_cache_disk(tmp_path):
+    path = os.path.join(tmp_path, "link_cache.db")
+    LinkCache(namespace="Company", disk_path=path).put("a", "1")
+    cache = LinkCache(namespace="Company", disk_path=path)
+    assert cache.get("a") == "1"
+    assert cache.stats.disk_hits == 1
+    assert LinkCache(namespace="Person", disk_path=path).get("a") is None
+
+
+def test_link_cache_disk_negative(tmp_path):
+    path = os.path.join(tmp_path, "link_cache.db")
+    LinkCache(namespace="Company", negative_ttl=60, disk_path=path).put_miss("a")
+    cache = LinkCache(namespace="Company", negative_ttl=60, disk_path=path)
+    assert cache.lookup("a") == NEGATIVE
+    cache = LinkCache(namespace="Company", disk_path=path)
+    assert cache.lookup("a") is None
+    assert cache.stats.misses == 1
+
+
+def test_get_link_cache_shared():
+    assert get_link_cache("test_shared") is get_link_cache("test_shared")
+    assert get_link_cache("test_shared") is not get_link_cache("test_other")
+
+
+def test_prompt_cache(tmp_path):
+    path = os.path.join(tmp_path, "prompt_cache.db")
+    cache = PromptCache(path, maxsize=10)
+    key = PromptCache.key("prompt", {"nn_name": "gpt"})
+    assert key != PromptCache.key("prompt", {"nn_name": "llama"})
+    cache.put(key, ["response"])
+    assert cache.get(key) == ["response"]
+    for i in range(20):
+        cache.put(PromptCache.key(f"prompt{i}", {}), str(i))
+    assert cache.stats.evictions >= 10
+
+    read_only = PromptCache(path, read_only=True)
+    assert read_only.get(PromptCache.key("prompt19", {})) == "19"
+    read_only.put(key, "ignored")
+    assert read_only.get(key) is None
+
+
+def test_prompt_cache_replace_and_threads(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = PromptCache(os.path.join(tmp_path, "prompt_cache.db"), maxsize=3)
+    for _ in range(5):
+        cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.stats.evictions == 0
+    assert cache.get("a") == "1"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda i: cache.put("c", str(i)), range(8)))
+    assert cache.stats.evictions == 0
+    assert cache.get("b") == "2"
+    cache.close()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+PWD = os.path.dirname(__file__)
+
+
+def _run(script: str, cwd: str) -> dict:
+    """Run `script` in a fresh interpreter and return the json it prints."""
+    output = subprocess.check_output(
+        [sys.executable, "-c", script], cwd=cwd, env=dict(os.environ)
+    )
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def test_import_time():
+    script = """
+import json, sys, time
+start = time.perf_counter()
+import knext.command.knext_cli
+from knext import rest
+seconds = time.perf_counter() - start
+modules = [name for name in sys.modules if name.startswith("knext.rest.")]
+print(json.dumps({"seconds": seconds, "modules": modules}))
+"""
+    result = _run(script, tempfile.gettempdir())
+    print(f"import knext cli in {result['seconds']:.3f}s")
+    assert not any(name.startswith("knext.rest.models") for name in result["modules"])
+    assert "knext.rest.api_client" not in result["modules"]
+
+
+def test_lazy_register():
+    script = f"""
+import json, os, sys
+from knext.common.class_register import register_from_package
+from knext.operator.base import BaseOp
+from knext.operator.op import LinkOp
+register_from_package({os.path.join(PWD, "../operators/operators")!r}, BaseOp)
+before = "operators" in sys.modules
+bind_to = LinkOp.bind_schemas.get("Company")
+op = BaseOp.by_name("TestLinkOp")
+print(json.dumps({{"before": before, "bind_to": bind_to, "name": op.__name__,
+    "after": "operators" in sys.modules, "lazy": sorted(BaseOp._lazy_registry)}}))
+"""
+    result = _run(script, PWD)
+    assert not result["before"], "operator module imported before `by_name`"
+    assert result["bind_to"] == "TestLinkOp"
+    assert result["name"] == "TestLinkOp"
+    assert result["after"]
+    assert result["lazy"] == []
+
+
+def test_registry_manifest():
+    pkg_dir = tempfile.mkdtemp()
+    with open(os.path.join(pkg_dir, "demo_op.py"), "w") as file:
+        file.write(
+            "from knext.operator.op import LinkOp\n"
+            "class DemoLinkOp(LinkOp):\n"
+            "    bind_to = str('Demo')\n"
+        )
+    script = f"""
+import json, sys
+from knext.common.class_register import register_from_package
+from knext.operator.base import BaseOp
+from knext.operator.op import LinkOp
+register_from_package({pkg_dir!r}, BaseOp)
+print(json.dumps({{"imported": "demo_op" in sys.modules,
+    "bind_to": LinkOp.bind_schemas.get("Demo")}}))
+"""
+    # `bind_to` is not a literal, so the module is imported on each start, as its
+    # runtime value may depend on other modules.
+    first = _run(script, pkg_dir)
+    assert first == {"imported": True, "bind_to": "DemoLinkOp"}
+    assert os.path.exists(os.path.join(pkg_dir, "__pycache__", "knext_registry.json"))
+    second = _run(script, pkg_dir)
+    assert second == {"imported": True, "bind_to": "DemoLinkOp"}
+
+    with open(os.path.join(pkg_dir, "demo_op.py"), "a") as file:
+        file.write("class OtherLinkOp(LinkOp):\n    bind_to = 'Other'\n")
+    script = script.replace('get("Demo")', 'get("Other")')
+    third = _run(script, pkg_dir)
+    assert third == {"imported": True, "bind_to": "OtherLinkOp"}
+
+
+def test_registry_runtime_bind_to():
+    pkg_dir = tempfile.mkdtemp()
+    helper_path = os.path.join(pkg_dir, "demo_schema.py")
+    with open(helper_path, "w") as file:
+        file.write("class NS:\n    Company = 'NS.Company'\n")
+    with open(os.path.join(pkg_dir, "demo_op.py"), "w") as file:
+        file.write(
+            "from demo_schema import NS\n"
+            "from knext.operator.op import LinkOp\n"
+            "class DemoLinkOp(LinkOp):\n"
+            "    bind_to = NS.Company\n"
+        )
+    script = f"""
+import json
+from knext.common.class_register import register_from_package
+from knext.operator.base import BaseOp
+from knext.operator.op import LinkOp
+register_from_package({pkg_dir!r}, BaseOp)
+print(json.dumps(LinkOp.bind_schemas))
+"""
+    assert _run(script, pkg_dir)["NS.Company"] == "DemoLinkOp"
+    # Only the schema helper changes, the operator is bound to the new type.
+    with open(helper_path, "w") as file:
+        file.write("class NS:\n    Company = 'NS2.Company'\n")
+    bind_schemas = _run(script, pkg_dir)
+    assert bind_schemas["NS2.Company"] == "DemoLinkOp"
+    assert "NS.Company" not in bind_schemas
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import asyncio
+import copy
+import json
+import pickle
+import re
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+import knext.rest.models
+from knext.rest import rest
+from knext.rest.api_client import ApiClient
+from knext.rest.async_api import AsyncApi
+from knext.rest.configuration import Configuration
+from knext.rest.exceptions import ApiException, ApiValueError
+
+
+def test_shared_pool_manager():
+    configuration = Configuration()
+    client = rest.RESTClientObject(configuration)
+    assert rest.RESTClientObject(Configuration()).pool_manager is client.pool_manager
+    assert rest.RESTClientObject(configuration, maxsize=1).pool_manager is not (
+        client.pool_manager
+    )
+    configuration.verify_ssl = False
+    assert rest.RESTClientObject(configuration).pool_manager is not (
+        client.pool_manager
+    )
+
+
+def test_request_stats():
+    client = rest.RESTClientObject(Configuration(), maxsize=2)
+    responses = [mock.Mock(status=200, data=b"{}"), mock.Mock(status=500, data=b"")]
+    url = "http://127.0.0.1:8887/public/v1/stats/test"
+    with mock.patch.object(client.pool_manager, "request", side_effect=responses):
+        client.GET(url)
+        with pytest.raises(ApiException):
+            client.GET(url + "?page=1")
+    stats = rest.request_stats()["GET /public/v1/stats/test"]
+    assert stats["count"] == 2
+    assert stats["errors"] == 1
+    assert stats["max_time"] >= stats["avg_time"] >= 0
+
+
+class _StubApi(object):
+    def __init__(self, api_client=None):
+        self.api_client = api_client or mock.Mock()
+
+    def echo(self, value, delay=0.0):
+        time.sleep(delay)
+        return value, threading.current_thread().name
+
+
+class _AsyncStubApi(AsyncApi):
+    api_class = _StubApi
+
+
+def test_async_api_gather():
+    api = _AsyncStubApi(max_workers=4)
+
+    async def main():
+        return await asyncio.gather(*[api.echo(i, delay=0.05) for i in range(8)])
+
+    start = time.perf_counter()
+    results = asyncio.run(main())
+    assert [value for value, _ in results] == list(range(8))
+    assert all(name.startswith("knext-rest") for _, name in results)
+    assert time.perf_counter() - start < 0.05 * 8
+    with pytest.raises(ApiValueError):
+        asyncio.run(api.echo(1, async_req=True))
+
+
+def test_async_api_copy():
+    api = _AsyncStubApi(max_workers=1)
+    assert copy.copy(api).api is api.api
+    assert pickle.loads(pickle.dumps(_AsyncStubApi.__new__(_AsyncStubApi))) is not None
+
+
+def _reflective_deserialize(data, klass):
+    """Deserializes data by reflecting the type strings on each value, as the
+    generated client does without the cached codecs."""
+    if data is None:
+        return None
+    if isinstance(klass, str):
+        if klass.startswith("list["):
+            sub_kls = re.match(r"list\[(.*)\]", klass).group(1)
+            return [_reflective_deserialize(sub_data, sub_kls) for sub_data in data]
+        if klass.startswith("dict("):
+            sub_kls = re.match(r"dict\(([^,]*), (.*)\)", klass).group(2)
+            return {k: _reflective_deserialize(v, sub_kls) for k, v in data.items()}
+        if klass in ApiClient.NATIVE_TYPES_MAPPING:
+            klass = ApiClient.NATIVE_TYPES_MAPPING[klass]
+        else:
+            klass = getattr(knext.rest.models, klass)
+    if klass in ApiClient.PRIMITIVE_TYPES:
+        return klass(data)
+    if klass == object:
+        return data
+    kwargs = {
+        attr: _reflective_deserialize(data[klass.attribute_map[attr]], attr_type)
+        for attr, attr_type in klass.openapi_types.items()
+        if klass.attribute_map[attr] in data
+    }
+    instance = klass(**kwargs)
+    if getattr(klass, "discriminator_value_class_map", None):
+        klass_name = instance.get_real_child_model(data)
+        if klass_name:
+            instance = _reflective_deserialize(data, klass_name)
+    return instance
+
+
+def test_model_codecs():
+    company = {"identityType": "SPG_TYPE", "namespace": "Test", "nameEn": "Company"}
+    text = {"identityType": "SPG_TYPE", "nameEn": "Text"}
+    prop = {
+        "basicInfo": {
+            "name": {"identityType": "PREDICATE", "nameEn": "alias"},
+            "nameZh": "别名",
+        },
+        "subjectTypeRef": {
+            "basicInfo": {"name": company},
+            "spgTypeEnum": "ENTITY_TYPE",
+        },
+        "objectTypeRef": {"basicInfo": {"name": text}, "spgTypeEnum": "BASIC_TYPE"},
+        "inherited": False,
+        "projectId": 1,
+        "extInfo": {"weight": [1, 2.5, None], "tags": {"a": "b"}},
+    }
+    schema = {
+        "spgTypes": [
+            {
+                "basicInfo": {"name": company, "nameZh": "公司", "desc": "v1"},
+                "spgTypeEnum": "ENTITY_TYPE",
+                "@type": "ENTITY_TYPE",
+                "properties": [prop],
+                "projectId": 1,
+            }
+        ]
+    }
+    receipt = {
+        "columns": ["id", "score"],
+        "cells": [["1", 0.5], ["2", None]],
+        "receiptType": "TABLE",
+    }
+    client = ApiClient()
+    for data, klass in [(schema, "ProjectSchema"), (receipt, "TableReasonerReceipt")]:
+        response = mock.Mock(data=json.dumps(data))
+        expected = _reflective_deserialize(data, klass)
+        for _ in range(2):
+            # the second time decodes with the cached codecs
+            result = client.deserialize(response, klass)
+            assert result == expected
+            body = json.dumps(client.sanitize_for_serialization(result))
+            assert client.deserialize(mock.Mock(data=body), klass) == expected
+    entity_type = client.deserialize(
+        mock.Mock(data=json.dumps(schema)), "ProjectSchema"
+    )
+    assert type(entity_type.spg_types[0]).__name__ == "EntityType"
@@ -8,3 +8,79 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
+from types import SimpleNamespace
+from unittest import mock
+
+from knext.client.model.base import BaseSpgType
+from knext.client.schema import SchemaClient
+from knext.component.builder.mapping import (
+    FusingStrategyEnum,
+    LinkingStrategyEnum,
+    SPGTypeMapping,
+)
+from knext.operator.builtin.entity_resolution import EntityResolutionFuseOp
+from knext.operator.builtin.fuzzy_link import FuzzyLinkOp
+from knext.operator.spg_record import SPGRecord
+
+
+def _mapping(fusing_strategy) -> SPGTypeMapping:
+    properties = {
+        name: SimpleNamespace(name=name, object_type_name="Text")
+        for name in ("id", "name", "city")
+    }
+    return SPGTypeMapping(
+        spg_type_name="Test.MappingCompany",
+        fusing_strategy=fusing_strategy,
+        schema_session=mock.Mock(spec=SchemaClient.SchemaSession),
+        spg_type=mock.Mock(spec=BaseSpgType, properties=properties, relations={}),
+    )
+
+
+def test_mapping_fuse_batch():
+    fuse_op = EntityResolutionFuseOp({"link_property": ""})
+    mapping = _mapping(fuse_op)
+    rows = [
+        {"id": "a1", "name": "Ant Group", "city": "HZ"},
+        {"id": "b1", "name": "Alipay"},
+        {"id": "a2", "name": "ant group.", "city": "SH"},
+    ]
+    records = mapping.invoke_batch(rows)
+    assert [record.get_property("id") for record in records] == ["a1", "b1"]
+    assert records[0].get_property("city") == "SH"
+    assert records[0].spg_type_name == "Test.MappingCompany"
+    # the fusing strategy is resolved without replacing the configured one
+    assert mapping.fusing_strategy is fuse_op
+    assert mapping._fusing_strategy() is mapping._fusing_strategy()
+    assert mapping._fusing_strategy().bind_to == "Test.MappingCompany"
+
+    records = mapping.invoke(SPGRecord("Test.Source", {"id": "a3", "name": "Ant"}))
+    assert [record.get_property("id") for record in records] == ["a3"]
+
+
+def test_mapping_entity_resolution():
+    mapping = _mapping(FusingStrategyEnum.EntityResolution)
+    mapping.add_filter("city", "HZ")
+    op = mapping._fusing_strategy()
+    assert isinstance(op, EntityResolutionFuseOp)
+    assert mapping.fusing_strategy == FusingStrategyEnum.EntityResolution
+    op.link_property = ""
+    rows = [
+        {"id": "c1", "name": "Koubei", "city": "HZ"},
+        {"id": "c2", "name": "koubei", "city": "HZ"},
+        {"id": "c3", "name": "Koubei", "city": "SH"},
+    ]
+    records = mapping.invoke_batch(rows)
+    assert [record.get_property("id") for record in records] == ["c1"]
+    assert mapping.invoke(rows[2]) == []
+
+
+def test_mapping_fuzzy_link_shared():
+    mapping = _mapping(FusingStrategyEnum.NewInstance)
+    first = mapping._linking_strategy(LinkingStrategyEnum.FuzzyMatch, "Test.Company")
+    second = mapping._linking_strategy(LinkingStrategyEnum.FuzzyMatch, "Test.Company")
+    assert isinstance(first, FuzzyLinkOp) and first.bind_to == "Test.Company"
+    assert second is first
+    custom = FuzzyLinkOp({"threshold": "0.9"})
+    resolved = mapping._linking_strategy(custom, "Test.Company")
+    assert resolved is not custom and resolved.threshold == 0.9
+    assert mapping._linking_strategy(custom, "Test.Company") is resolved
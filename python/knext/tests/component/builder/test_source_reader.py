@@ -8,3 +8,49 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License
 # is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 # or implied.
+
+import gzip
+import os
+
+from knext.component.builder.source_reader import CSVReader
+
+
+def _write_csv(path, rows):
+    with open(path, "w", encoding="utf-8") as writer:
+        writer.write("id,name,desc\n")
+        for i in range(rows):
+            writer.write(f"{i},name{i},desc{i}\n")
+
+
+def test_csv_reader_batches(tmp_path):
+    path = os.path.join(tmp_path, "data.csv")
+    _write_csv(path, 25)
+    reader = CSVReader(
+        local_path=path, columns=["id", "name"], start_row=2, chunk_size=10
+    )
+    batches = list(reader.read_batches())
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert batches[0][0] == {"id": "0", "name": "name0"}
+    assert len(list(reader.invoke())) == 25
+
+
+def test_csv_reader_shards(tmp_path):
+    path = os.path.join(tmp_path, "data.csv")
+    _write_csv(path, 1000)
+    for use_mmap in (False, True):
+        reader = CSVReader(
+            local_path=path, columns=["id"], start_row=2, use_mmap=use_mmap
+        )
+        ids = []
+        for shard in range(7):
+            for batch in reader.read_batches(shard, 7):
+                ids.extend(int(record["id"]) for record in batch)
+        assert ids == list(range(1000))
+
+
+def test_csv_reader_gzip(tmp_path):
+    path = os.path.join(tmp_path, "data.csv.gz")
+    with gzip.open(path, "wt", encoding="utf-8") as writer:
+        writer.write("a;b\n1;2\n")
+    reader = CSVReader(local_path=path, columns=["a", "b"], start_row=1, delimiter=";")
+    assert list(reader.invoke()) == [{"a": "a", "b": "b"}, {"a": "1", "b": "2"}]
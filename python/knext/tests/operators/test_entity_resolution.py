@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+from knext.client.local_search import get_local_index
+from knext.operator.builtin.entity_resolution import EntityResolutionFuseOp
+from knext.operator.spg_record import SPGRecord
+
+
+def _company(id, name, **properties):
+    return SPGRecord("Test.FuseCompany", {"id": id, "name": name, **properties})
+
+
+def test_cluster_and_merge():
+    op = EntityResolutionFuseOp(
+        {
+            "bind_to": "Test.FuseCompany",
+            "link_property": "",
+            "property_merge_policies": "alias:concat,revenue:max",
+        }
+    )
+    records = [
+        _company("a1", "Ant Group", alias="ant", revenue="10", city="HZ"),
+        _company("b1", "Alipay"),
+        _company("a2", "ant  group.", alias="ant,antgroup", revenue="9"),
+        _company("a2", "Ant Financial", city="SH"),
+    ]
+    outputs = op._handle([record.to_dict() for record in records])["data"]
+    assert [output["properties"]["id"] for output in outputs] == ["a1", "b1"]
+    properties = outputs[0]["properties"]
+    assert properties["alias"] == "ant,antgroup"
+    assert properties["revenue"] == "10"
+    assert properties["city"] == "SH"
+    assert properties["name"] == "Ant Financial"
+    assert op.link_cache.lookup("a2") == "a1"
+
+
+def test_link_once_per_cluster():
+    url = "local:"
+    get_local_index("Test.FuseCompany", url).add(
+        "k1", {"name": "Ant Group", "founded": "2014"}
+    )
+    op = EntityResolutionFuseOp(
+        {"bind_to": "Test.FuseCompany", "search_engine_url": url}
+    )
+    op._ensure_open()
+    searched = []
+    exact_search_batch = op.search_client.exact_search_batch
+    op.search_client.exact_search_batch = lambda records, name: searched.append(
+        len(records)
+    ) or exact_search_batch(records, name)
+
+    records = [_company("x1", "Ant Group"), _company("x2", "Ant Group", city="HZ")]
+    outputs = op.invoke(records)
+    assert searched == [1]
+    assert len(outputs) == 1
+    assert outputs[0].get_property("id") == "k1"
+    assert outputs[0].get_property("founded") == "2014"
+    assert outputs[0].get_property("city") == "HZ"
+
+    # Records already fused are linked by the link cache, without searching.
+    outputs = op.invoke([_company("x2", "Ant Group Co")])
+    assert searched == [1]
+    assert outputs[0].get_property("id") == "k1"
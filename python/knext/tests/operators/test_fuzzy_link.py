@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+from knext.client.local_search import get_local_index
+from knext.operator.builtin.fuzzy_link import (
+    FuzzyLinkOp,
+    MinHashBlockingIndex,
+    normalize_name,
+)
+from knext.operator.spg_record import SPGRecord
+
+COMPANIES = {
+    "1": "蚂蚁科技集团股份有限公司",
+    "2": "浙江天猫网络有限公司",
+    "3": "Alibaba Group Holding Ltd.",
+    "4": "Hangzhou Alipay Technology Co., Ltd.",
+}
+
+
+def test_normalize_name():
+    assert normalize_name("蚂蚁科技集团股份有限公司") == "蚂蚁科技"
+    assert normalize_name("Alibaba Group Holding Ltd.") == "alibabaholding"
+    assert normalize_name("Group Inc") == "groupinc"
+
+
+def test_blocking_index():
+    index = MinHashBlockingIndex(list(COMPANIES), list(COMPANIES.values()))
+    results = index.query(["蚂蚁科技有限公司", "alibaba holding", "Alipay Technolgy", "京东"])
+    assert results[0][0] == (0, 1.0)
+    assert results[1][0] == (2, 1.0)
+    assert results[2][0][0] == 3 and 0.5 < results[2][0][1] < 1.0
+    assert results[3] == []
+
+
+def test_fuzzy_link_op():
+    url = "local:"
+    get_local_index("Test.Company", url).add_records(
+        SPGRecord("Test.Company", {"id": id, "name": name})
+        for id, name in COMPANIES.items()
+    )
+    op = FuzzyLinkOp(
+        {"bind_to": "Test.Company", "search_engine_url": url, "threshold": "0.6"}
+    )
+    record = SPGRecord("Test.Person")
+    outputs = op._handle_batch(
+        [("浙江天猫网络公司", record.to_dict()), ("Taobao", record.to_dict())]
+    )
+    assert outputs[0]["data"][0]["properties"]["id"] == "2"
+    assert outputs[1]["data"] == []
+
+    get_local_index("Test.Company", url).add_records(
+        [SPGRecord("Test.Company", {"id": "9", "name": "Taobao"})]
+    )
+    op = FuzzyLinkOp({"bind_to": "Test.Company", "search_engine_url": url})
+    outputs = op._handle_batch([("Taobao", record.to_dict())])
+    assert outputs[0]["data"][0]["properties"]["id"] == "9"
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import json
+import os
+
+from knext.operator.builtin.online_runner import _BuiltInOnlineExtractor
+from knext.operator.op import PromptOp
+from knext.operator.spg_record import SPGRecord
+
+
+class _EchoModel:
+    def __init__(self):
+        self.queries = []
+
+    def remote_inference(self, query):
+        self.queries.append(query)
+        return [query.upper()]
+
+
+class _EchoPromptOp(PromptOp):
+    def build_prompt(self, variables):
+        return variables["input"]
+
+    def parse_response(self, response):
+        return [SPGRecord("Test.Echo", {"name": response[0]})]
+
+
+def _extractor(tmp_path, model, read_only=False):
+    params = {
+        "model_config": json.dumps({"model": "echo"}),
+        "prompt_cache_path": os.path.join(tmp_path, "prompt_cache.db"),
+        "prompt_cache_read_only": str(read_only),
+    }
+    return _BuiltInOnlineExtractor(params, model=model, prompt_ops=[_EchoPromptOp()])
+
+
+def test_online_extractor_lazy_resources(tmp_path):
+    extractor = _extractor(tmp_path, _EchoModel(), read_only=True)
+    assert extractor._executor is None and extractor.prompt_cache is None
+    assert not os.listdir(tmp_path)
+
+    extractor = _extractor(tmp_path, _EchoModel())
+    assert not os.listdir(tmp_path)
+    extractor._ensure_open()
+    assert os.path.exists(os.path.join(tmp_path, "prompt_cache.db"))
+    extractor.close()
+    assert extractor._executor is None and extractor.prompt_cache is None
+
+
+def test_online_extractor_prompt_cache(tmp_path):
+    model = _EchoModel()
+    extractor = _extractor(tmp_path, model)
+    output = extractor._handle({"input": "ant"})
+    assert output["data"][0]["properties"]["name"] == "ANT"
+    extractor.close()
+
+    extractor = _extractor(tmp_path, model, read_only=True)
+    output = extractor._handle({"input": "ant"})
+    assert output["data"][0]["properties"]["name"] == "ANT"
+    assert model.queries == ["ant"]
+    extractor.close()
+
+
+def test_online_extractor_invoke_unopened(tmp_path):
+    model = _EchoModel()
+    extractor = _extractor(tmp_path, model)
+    records = extractor.invoke({"input": "ant"})
+    assert [record.get_property("name") for record in records] == ["ANT"]
+    assert model.queries == ["ant"]
+    extractor.close()
@@ -138,3 +138,82 @@ def test_predict_op():
             assert (
                 records[i].get_property(k) == v
             ), f"value of property {k} should be {v}, got {records[i].get_property(k)}"
+
+
+def test_extract_op_batch():
+    record = get_test_extract_data()
+    op = ExtractOp.by_name("TestExtractOp")()
+    op_outs = op._handle_batch([(record,), (record,)])
+    assert len(op_outs) == 2, f"expected 2 outputs, got {len(op_outs)}"
+    for op_out in op_outs:
+        assert op_out == op._handle(*(record,))
+    # The builder passes the arguments of each record as a list.
+    assert op._handle_batch([[record]]) == op_outs[:1]
+
+
+def test_link_op_batch():
+    names = ["taobao", "alipay"]
+    records = [SPGRecord("Company").upsert_properties({"name": name}) for name in names]
+    op = LinkOp.by_name("TestLinkOp")()
+    op_outs = op._handle_batch(
+        [(name, record.to_dict()) for name, record in zip(names, records)]
+    )
+    assert len(op_outs) == len(names), f"expected {len(names)} outputs"
+    for name, op_out in zip(names, op_outs):
+        linked = [SPGRecord.from_dict(x) for x in op_out["data"]]
+        assert len(linked) == op.num_outputs
+        assert linked[0].get_property("indexed_property") == f"{name}_1"
+
+
+def test_operator_lifecycle():
+    from knext.operator.lifecycle import OperatorManager
+
+    class OpenCountOp(BaseOp):
+        opened = 0
+
+        def open(self):
+            OpenCountOp.opened += 1
+
+        def invoke(self, record):
+            return record
+
+        @staticmethod
+        def _post_process(output):
+            return output
+
+    manager = OperatorManager()
+    op = manager.get(OpenCountOp, {"config": "1"})
+    assert manager.get(OpenCountOp, {"config": "1"}) is op
+    assert manager.get(OpenCountOp, {"config": "2"}) is not op
+    manager.prewarm()
+    assert OpenCountOp.opened == 2
+    assert op._handle("a") == "a"
+    assert OpenCountOp.opened == 2
+    assert "OpenCountOp" in manager.init_times
+    manager.close()
+    assert not op._opened
+
+    other = OpenCountOp({"config": "1"})
+    manager.open(other)
+    assert manager.get(OpenCountOp, {"config": "1"}) is other
+    manager.close()
+    assert not other._opened
+    assert manager.get(OpenCountOp, {"config": "1"}) is not other
+
+
+def test_link_op_in_process_cache():
+    from knext.component.builder.base import _invoke_op
+
+    class CountLinkOp(LinkOp):
+        bind_to = "Test.InProcessCompany"
+        invoked = 0
+
+        def invoke(self, property, subject_record):
+            CountLinkOp.invoked += 1
+            return []
+
+    op = CountLinkOp({"cache_negative_ttl": "60"})
+    record = get_test_record()
+    for _ in range(2):
+        assert _invoke_op(op, "taobao", record) == []
+    assert CountLinkOp.invoked == 1
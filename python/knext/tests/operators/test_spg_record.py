@@ -66,3 +66,32 @@ def test_spg_record_consturct():
     print(record_dict["properties"])
     for k, v in record_dict["properties"].items():
         assert record.get_property(k) == v
+
+
+def test_spg_record_relations_roundtrip():
+    import pickle
+
+    name, properties, _ = get_test_data()
+    record = SPGRecord(name, properties, {("isSubsidiaryOf", "Company"): "alipay"})
+    assert record.get_relation("isSubsidiaryOf", "Company") == "alipay"
+
+    record_dict = record.to_dict()
+    assert record_dict["properties"]["isSubsidiaryOf#Company"] == "alipay"
+    record = SPGRecord.from_dict(record_dict)
+    assert record.get_relation("isSubsidiaryOf", "Company") == "alipay"
+    assert record.properties == properties
+
+    record = pickle.loads(pickle.dumps(record))
+    assert record.spg_type_name == name
+    assert record.get_property("phone") == properties["phone"]
+    assert record.relations == {"isSubsidiaryOf#Company": "alipay"}
+
+
+def test_spg_record_none_type_and_to_dict_copy():
+    assert SPGRecord(None).spg_type_name is None
+    assert SPGRecord.from_dict({"properties": {}}).spg_type_name is None
+
+    name, properties, _ = get_test_data()
+    record = SPGRecord(name, properties)
+    record.to_dict()["properties"]["phone"] = "changed"
+    assert record.get_property("phone") == properties["phone"]
@@ -25,6 +25,11 @@ NN_EXECUTOR_TEXT = "NN executor"
 NN_DEVICE_KEY = "device"
 NN_TRUST_REMOTE_CODE_KEY = "trust_remote_code"
 
+NN_BATCH_MAX_SIZE_KEY = "batch_max_size"
+NN_BATCH_MAX_SIZE_TEXT = "max batch size of local inference"
+NN_BATCH_MAX_WAIT_KEY = "batch_max_wait"
+NN_BATCH_MAX_WAIT_TEXT = "max wait seconds of local inference batching"
+
 NN_OPENAI_MODEL_NAME_KEY = NN_NAME_KEY
 NN_OPENAI_MODEL_NAME_TEXT = "openai model name"
 
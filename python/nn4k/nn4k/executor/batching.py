@@ -0,0 +1,116 @@
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List
+
+
+class _Request:
+    def __init__(self, inputs: list, kwargs: dict):
+        self.inputs = inputs
+        self.kwargs = kwargs
+        self.group = repr(sorted(kwargs.items()))
+        self.future = Future()
+
+
+class BatchingScheduler:
+    """
+    Coalesces concurrent inference requests into micro-batches.
+
+    Requests submitted from different threads within `max_wait_time` seconds of each
+    other are merged into one call of `inference_fn` of at most `max_batch_size` inputs.
+    Only requests with the same keyword arguments share a call, and the outputs are
+    split back to the callers. Requests submitted after `close` are rejected.
+    """
+
+    def __init__(
+        self,
+        inference_fn: Callable[..., list],
+        max_batch_size: int = 8,
+        max_wait_time: float = 0.01,
+    ):
+        self._inference_fn = inference_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait_time = max_wait_time
+        self._queue = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(
+            target=self._run, name="nn4k-batching", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, data, **kwargs) -> list:
+        """
+        Run inference on `data`, a string or a list of strings, and return its outputs
+        in the same order, blocking until the batch containing it is done.
+        """
+        inputs = [data] if isinstance(data, str) else list(data)
+        request = _Request(inputs, kwargs)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("batching scheduler is closed")
+            self._queue.put(request)
+        return request.future.result()
+
+    def close(self):
+        """
+        Stop the worker thread after the queued requests are done.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
+
+    def _run(self):
+        pending: List[_Request] = []
+        while True:
+            request = pending.pop(0) if pending else self._queue.get()
+            if request is None:
+                return
+            batch = [request]
+            size = len(request.inputs)
+            deadline = time.monotonic() + self._max_wait_time
+            while size < self._max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    other = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if other is None:
+                    pending.append(other)
+                    break
+                if other.group != request.group:
+                    pending.append(other)
+                    continue
+                batch.append(other)
+                size += len(other.inputs)
+            self._execute(batch)
+
+    def _execute(self, batch: List[_Request]):
+        inputs = [item for request in batch for item in request.inputs]
+        try:
+            outputs = self._inference_fn(inputs, **batch[0].kwargs)
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+        offset = 0
+        for request in batch:
+            request.future.set_result(outputs[offset : offset + len(request.inputs)])
+            offset += len(request.inputs)
@@ -149,7 +149,13 @@ class LLMInvoker(NNInvoker):
     def local_inference(self, data, **kwargs):
         """
         Implement local inference for local invoker.
+
+        If `batch_max_size` is configured, concurrent calls are coalesced into
+        micro-batches by a `BatchingScheduler`.
         """
+        scheduler = getattr(self, "_batching_scheduler", None)
+        if scheduler is not None:
+            return scheduler.submit(data, **kwargs)
         return self._nn_executor.inference(data, **kwargs)
 
     def warmup_local_model(self):
@@ -176,6 +182,24 @@ class LLMInvoker(NNInvoker):
         self._nn_executor: LLMExecutor = executor
         self._nn_executor.load_model()
         self._nn_executor.warmup_inference()
+        self._batching_scheduler = self._create_batching_scheduler()
+
+    def _create_batching_scheduler(self):
+        """
+        Create the micro-batching scheduler of local inference, or None if
+        `batch_max_size` is not configured.
+        """
+        from nn4k.consts import NN_BATCH_MAX_SIZE_KEY, NN_BATCH_MAX_WAIT_KEY
+        from nn4k.executor.batching import BatchingScheduler
+
+        max_batch_size = self.init_args.get(NN_BATCH_MAX_SIZE_KEY)
+        if max_batch_size is None or int(max_batch_size) <= 1:
+            return None
+        return BatchingScheduler(
+            self._nn_executor.inference,
+            max_batch_size=int(max_batch_size),
+            max_wait_time=float(self.init_args.get(NN_BATCH_MAX_WAIT_KEY, 0.01)),
+        )
 
     @classmethod
     def from_config(cls, nn_config: dict) -> "LLMInvoker":
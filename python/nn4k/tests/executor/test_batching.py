@@ -0,0 +1,62 @@
+# Copyright 2023 Ant Group CO., Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License
+# is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+# or implied.
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from nn4k.executor.batching import BatchingScheduler
+
+
+class TestBatchingScheduler(unittest.TestCase):
+    """
+    BatchingScheduler unittest
+    """
+
+    def setUp(self):
+        self.calls = []
+
+        def inference(data, suffix=""):
+            self.calls.append(list(data))
+            return [item.upper() + suffix for item in data]
+
+        self.scheduler = BatchingScheduler(
+            inference, max_batch_size=4, max_wait_time=0.2
+        )
+
+    def tearDown(self):
+        self.scheduler.close()
+
+    def testCoalesce(self):
+        inputs = ["ccc", "a", ["bb", "dddd"]]
+        with ThreadPoolExecutor(len(inputs)) as pool:
+            results = list(pool.map(self.scheduler.submit, inputs))
+
+        self.assertEqual(results, [["CCC"], ["A"], ["BB", "DDDD"]])
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(sorted(self.calls[0]), ["a", "bb", "ccc", "dddd"])
+
+    def testKwargsGroup(self):
+        with ThreadPoolExecutor(2) as pool:
+            first = pool.submit(self.scheduler.submit, "a", suffix="!")
+            second = pool.submit(self.scheduler.submit, "b")
+            self.assertEqual(first.result(), ["A!"])
+            self.assertEqual(second.result(), ["B"])
+        self.assertEqual(len(self.calls), 2)
+
+    def testSubmitAfterClose(self):
+        self.scheduler.close()
+        with self.assertRaises(RuntimeError):
+            self.scheduler.submit("a")
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()